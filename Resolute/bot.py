@@ -1,29 +1,37 @@
 import asyncio
 import logging
 from signal import SIGINT, SIGTERM
-from timeit import default_timer as timer
 import traceback
 
 import discord
 from aiopg.sa import Engine, SAConnection, create_engine, result
 from discord.ext import commands
 from quart import Quart
-from sqlalchemy.schema import CreateTable
+from sqlalchemy.schema import CreateIndex, CreateTable
 from sqlalchemy.sql import FromClause, TableClause
 
 
 from Resolute.compendium import Compendium
-from Resolute.constants import DB_URL, ERROR_CHANNEL, PORT
+from Resolute.constants import COMMAND_TIME_BUDGET, DB_URL, ERROR_CHANNEL, PORT
 from Resolute.models import metadata
 from Resolute.models.embeds import ErrorEmbed
-from Resolute.models.objects.enum import QueryResultType
+from Resolute.helpers.general_helpers import get_context_level
+from Resolute.models.objects.enum import ContextLevel, QueryResultType
 from Resolute.models.objects.exceptions import (
     G0T0CommandError,
     G0T0Error,
 )
 
+from Resolute.models.objects.financial import Financial
 from Resolute.models.objects.guilds import PlayerGuild
 from Resolute.models.objects.players import Player
+from Resolute.loop_monitor import LoopMonitor
+from Resolute.metrics import Metrics
+from Resolute.query_stats import MeasuredEngine, QueryStats
+from Resolute.readiness import ReadinessGate
+from Resolute.send_queue import SendQueue
+from Resolute.startup import StartupReport
+from Resolute.tracing import end_trace, start_trace, trace_http
 
 
 log = logging.getLogger(__name__)
@@ -33,6 +41,9 @@ async def create_tables(conn: SAConnection):
     for table in metadata.sorted_tables:
         await conn.execute(CreateTable(table, if_not_exists=True))
 
+        for index in table.indexes:
+            await conn.execute(CreateIndex(index, if_not_exists=True))
+
 
 class G0T0Context(discord.ApplicationContext):
     bot: "G0T0Bot"
@@ -50,7 +61,15 @@ class G0T0Bot(commands.Bot):
     db: Engine
     compendium: Compendium
     web_app: Quart
+    send_queue: SendQueue
+    query_stats: QueryStats
+    metrics: Metrics
+    loop_monitor: LoopMonitor
+    startup: StartupReport
+    readiness: ReadinessGate
     player_guilds: dict = {}
+    financial: Financial = None
+    store_items: dict = {}
 
     # Extending/overriding discord.ext.commands.Bot
     def __init__(self, **options):
@@ -61,14 +80,31 @@ class G0T0Bot(commands.Bot):
         Attributes:
             compendium (Compendium): An instance of the Compendium class.
             web_app (Quart): An instance of the Quart web application.
+            send_queue (SendQueue): Per-channel scheduler for outbound webhook posts and edits.
+            query_stats (QueryStats): Latency statistics for queries run through `query`.
+            metrics (Metrics): In-process counters exposed on the `/metrics` endpoint.
+            loop_monitor (LoopMonitor): Event loop lag sampler.
+            startup (StartupReport): Timings of each startup phase.
+            readiness (ReadinessGate): Holds commands until the database, compendium and guild cache are ready.
         """
 
         super(G0T0Bot, self).__init__(**options)
         self.compendium = Compendium()
         self.web_app = Quart(__name__)
+        self.send_queue = SendQueue()
+        self.query_stats = QueryStats()
+        self.metrics = Metrics()
+        self.loop_monitor = LoopMonitor()
+        self.startup = StartupReport()
+        self.readiness = ReadinessGate(("database", "compendium", "guild_cache"))
+        self._starting = False
+
+        self.web_app.before_serving(self._web_serving)
+        trace_http(self.http)
 
         self.check(self.bot_check)
         self.before_invoke(self.before_invoke_setup)
+        self.after_invoke(self.after_invoke_teardown)
         self.add_listener(self.error_handling, "on_error")
         self.add_listener(self.error_handling, "on_command_error")
         self.add_listener(self.error_handling, "on_application_command_error")
@@ -78,32 +114,49 @@ class G0T0Bot(commands.Bot):
         Event handler for when the bot is ready.
         This method is called when the bot has successfully connected to Discord and is ready to start interacting.
         It performs the following tasks:
-        1. Connects to the database and creates the necessary tables.
-        2. Starts the web server for the bot.
-        The method logs the time taken to create the database engine and the web server, and logs the bot's user information.
+        1. Starts the web server for the bot in the background.
+        2. Connects to the database and creates the necessary tables.
+        3. Dispatches `db_connected`, whose listeners load the compendium and NPC commands concurrently.
+        Each step is timed in `startup`, which logs a report once the listeners are done as well. Discord fires
+        this again after a reconnect, in which case nothing is started twice. `db` is only set once the tables exist.
         Raises:
             Exception: If there is an error in creating the database engine or starting the web server.
         """
 
-        db_start = timer()
-        self.db = await create_engine(DB_URL)
-        self.dispatch("db_connected")
-        db_end = timer()
+        log.info(f"Logged in as {self.user} (ID: {self.user.id})")
+        log.info("------")
+        self.readiness.mark_ready("guild_cache")
 
-        log.info(f"Time to create db engine: {db_end - db_start:.2f}")
+        # Set before the first await so a reconnect mid-startup doesn't start everything a second time
+        if self._starting:
+            return
 
-        async with self.db.acquire() as conn:
-            await create_tables(conn)
+        self._starting = True
+        self.startup.finish("gateway")
+        self.startup.expect(
+            "web_server", "db_engine", "create_tables", "compendium", "npc_commands"
+        )
 
-        web_start = timer()
-        loop = asyncio.get_event_loop()
-        loop.create_task(self.web_app.run_task(host="0.0.0.0", port=PORT))
-        web_end = timer()
+        self.startup.begin("web_server")
+        self.web_task = asyncio.create_task(
+            self.web_app.run_task(host="0.0.0.0", port=PORT)
+        )
 
-        log.info(f"Time to create web server: {web_end-web_start:.2f}")
+        with self.startup.phase("db_engine"):
+            db = await create_engine(DB_URL)
 
-        log.info(f"Logged in as {self.user} (ID: {self.user.id})")
-        log.info("------")
+        with self.startup.phase("create_tables"):
+            async with db.acquire() as conn:
+                await create_tables(conn)
+
+        # Listeners treat `db` being set as the database being usable, so only expose it once the tables exist
+        self.db = MeasuredEngine(db, self.query_stats)
+        self.readiness.mark_ready("database")
+        self.dispatch("db_connected")
+        self.loop_monitor.start()
+
+    async def _web_serving(self):
+        self.startup.finish("web_server")
 
     async def close(self):
         """
@@ -118,6 +171,8 @@ class G0T0Bot(commands.Bot):
         """
 
         log.info("Shutting down bot and web server...")
+        self.loop_monitor.stop()
+
         if hasattr(self, "web_task"):
             self.web_task.cancel()
             try:
@@ -131,6 +186,10 @@ class G0T0Bot(commands.Bot):
 
         await super().close()
 
+    def add_cog(self, cog: commands.Cog, *, override: bool = False) -> None:
+        self.metrics.instrument_loops(cog)
+        super().add_cog(cog, override=override)
+
     def run(self, *args, **kwargs):
         for sig in (SIGINT, SIGTERM):
             try:
@@ -139,21 +198,42 @@ class G0T0Bot(commands.Bot):
                 )
             except (NotImplementedError, RuntimeError):
                 pass
+        self.startup.begin("gateway")
         super().run(*args, **kwargs)
 
     async def before_invoke_setup(self, ctx: commands.Context):
+        """
+        Loads the context the command declared with `needs_context` into `ctx.playerGuild` and `ctx.player`.
+        Commands that haven't declared one get the full player graph. The command is counted in the player's
+        statistics either way.
+        """
+        start_trace(str(ctx.command))
         ctx: G0T0Context = ctx
-        ctx.player = await Player.get_player(
-            self, ctx.author.id, ctx.guild.id if ctx.guild else None, ctx=ctx
-        )
+        level = get_context_level(ctx.command)
+        self.metrics.observe_context(str(ctx.command), level)
+        level = level or ContextLevel.full
 
+        ctx.player = None
         ctx.playerGuild = (
             await PlayerGuild.get_player_guild(self, ctx.guild.id)
-            if ctx.guild
+            if ctx.guild and level != ContextLevel.none
             else None
         )
 
-        await ctx.player.update_command_count(str(ctx.command))
+        if level in [ContextLevel.player, ContextLevel.full]:
+            ctx.player = await Player.get_player(
+                self,
+                ctx.author.id,
+                ctx.guild.id if ctx.guild else None,
+                ctx=ctx,
+                graph=level == ContextLevel.full,
+            )
+            await ctx.player.update_command_count(str(ctx.command))
+        elif ctx.guild:
+            await Player.record_command(
+                self, ctx.author.id, ctx.guild.id, str(ctx.command)
+            )
+
         params = "".join(
             [
                 f" [{p['name']}: {p['value']}]"
@@ -175,13 +255,43 @@ class G0T0Bot(commands.Bot):
                 f"Command in DM with {ctx.author} [{ctx.author.id}]: {ctx.command} {params}"
             )
 
+    async def after_invoke_teardown(
+        self, ctx: discord.ApplicationContext | commands.Context
+    ):
+        """
+        Ends the command's trace and reports it if the command ran over `COMMAND_TIME_BUDGET`.
+        Args:
+            ctx (discord.ApplicationContext | commands.Context): The context of the command.
+        """
+        trace = end_trace()
+
+        if trace is None:
+            return
+
+        self.metrics.observe_command(trace.command, trace.elapsed())
+
+        if trace.elapsed() < COMMAND_TIME_BUDGET:
+            return
+
+        out_str = (
+            f"Slow command ({COMMAND_TIME_BUDGET:.1f}s budget): {trace.summary()} "
+            f"auth: {ctx.author} [{ctx.author.id}], {f'serv: {ctx.guild} [{ctx.guild.id}]' if ctx.guild else 'DM'}"
+        )
+
+        if ERROR_CHANNEL and (channel := self.get_channel(int(ERROR_CHANNEL))):
+            try:
+                return await channel.send(out_str)
+            except:
+                pass
+
+        log.warning(out_str)
+
     async def bot_check(self, ctx: discord.ApplicationContext | commands.Context):
-        if (
-            hasattr(self, "db")
-            and self.db
-            and hasattr(self, "compendium")
-            and self.compendium
-        ):
+        """
+        Holds commands sent during startup until the bot is ready and rejects them only if it doesn't get there
+        within `READY_TIMEOUT` seconds.
+        """
+        if await self.readiness.wait(ctx):
             return True
 
         if isinstance(ctx, commands.Context):
@@ -285,6 +395,7 @@ class G0T0Bot(commands.Bot):
                 - QueryResultType.multiple: Returns a list of rows.
                 - QueryResultType.scalar: Returns a single scalar value.
                 - None: If the result_type is has no return.
+        Execution time, pool wait and row count are recorded in `query_stats` by the engine.
         """
         async with self.db.acquire() as conn:
             results = await conn.execute(query)
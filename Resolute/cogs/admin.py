@@ -12,8 +12,9 @@ from discord.ext import commands, tasks
 
 from Resolute.bot import G0T0Bot, G0T0Context
 from Resolute.constants import ADMIN_GUILDS
-from Resolute.helpers import is_admin, is_owner
+from Resolute.helpers import initial_response, is_admin, is_owner, needs_context
 from Resolute.models.objects.dashboards import RefDashboard
+from Resolute.models.objects.enum import ContextLevel
 from Resolute.models.objects.financial import Financial
 from Resolute.models.objects.guilds import PlayerGuild
 from Resolute.models.objects.store import Store
@@ -46,6 +47,8 @@ class Admin(commands.Cog):
             Slash command for handling the main administration command. Creates and sends an AdminMenuUI instance to the context, then deletes the context message.
         reload_cog(ctx: discord.ApplicationContext, cog: discord.Option):
             Slash command for reloading a specific cog, refreshing DB information, or reloading all cogs and DB information.
+        query_stats(ctx, sort, reset):
+            Slash command for reporting the slowest database query shapes.
         _reload_DB(ctx):
             Private method for reloading the database information.
         reload_category_task():
@@ -79,6 +82,8 @@ class Admin(commands.Cog):
     @commands.slash_command(
         name="automation_request", description="Log an automation request"
     )
+    @needs_context(ContextLevel.guild)
+    @initial_response(modal=True)
     async def automation_request(self, ctx: G0T0Context):
         """
         Used by players to submit an automation request
@@ -89,11 +94,12 @@ class Admin(commands.Cog):
         Returns:
             Interaction: Modal interaction to gather information about the request
         """
-        modal = AutomationRequestView(ctx.player.guild)
+        modal = AutomationRequestView(ctx.playerGuild)
         await ctx.send_modal(modal)
 
     @admin_commands.command(name="admin", description="Main administration command")
     @commands.check(is_admin)
+    @needs_context(ContextLevel.none)
     async def admin_admin(self, ctx: discord.ApplicationContext):
         """
         Handles the admin command for the admin cog.
@@ -111,6 +117,7 @@ class Admin(commands.Cog):
         description="Reloads either a specific cog, refresh DB information, or reload everything",
     )
     @commands.check(is_owner)
+    @needs_context(ContextLevel.none)
     async def reload_cog(
         self,
         ctx: G0T0Context,
@@ -152,13 +159,57 @@ class Admin(commands.Cog):
             self.bot.load_extension(f"Resolute.cogs.{cog}")
             await ctx.respond(f"Cog {cog} reloaded")
 
+    @admin_commands.command(
+        name="query_stats", description="Show the slowest database query shapes"
+    )
+    @commands.check(is_admin)
+    @needs_context(ContextLevel.none)
+    @initial_response(ephemeral=True)
+    async def query_stats(
+        self,
+        ctx: G0T0Context,
+        sort: discord.Option(
+            str,
+            description="Metric to sort by",
+            choices=["total", "p95", "max", "count", "pool_wait"],
+            default="total",
+        ),
+        reset: discord.Option(
+            bool, description="Clear the statistics afterwards", default=False
+        ),
+    ):
+        """
+        Shows the top database query shapes recorded by the bot, sorted by the given metric.
+
+        Args:
+            ctx (G0T0Context): Represents a Discord application command interaction context.
+            sort (str): Metric to sort by.
+            reset (bool): Clears the statistics after reporting them.
+        """
+        stats = self.bot.query_stats
+        lines = [f"Slow queries: {stats.slow:,}"]
+
+        for shape, metrics in stats.top(10, sort):
+            lines.append(
+                f"\n{metrics['count']:,}x total={metrics['total']:.2f}s p95={metrics['p95'] * 1000:.1f}ms "
+                f"max={metrics['max'] * 1000:.1f}ms pool={metrics['pool_wait']:.2f}s rows={metrics['rows']:,}\n"
+                f"{shape[:250]}"
+            )
+
+        if reset:
+            stats.reset()
+
+        await ctx.respond(f"```\n{chr(10).join(lines)[:1900]}```", ephemeral=True)
+
     @commands.group(hidden=True, invoke_without_command=True)
     @commands.check(is_owner)
+    @needs_context(ContextLevel.none)
     async def admin(self, ctx: discord.ApplicationContext):
         await ctx.send("Send a subcommand")
 
     @admin.command(hidden=True, name="eval")
     @commands.check(is_owner)
+    @needs_context(ContextLevel.none)
     async def admin_eval(self, ctx: discord.ApplicationContext, *, body: str):
         env = {
             "bot": self.bot,
@@ -226,14 +277,14 @@ class Admin(commands.Cog):
 
     @tasks.loop(hours=24)
     async def check_financials(self):
-        fin = await Financial.get_financial_data(self.bot)
+        fin = await Financial.get_financial_data(self.bot, refresh=True)
         current_time = datetime.datetime.now(datetime.timezone.utc)
 
         if fin.last_reset is None or fin.last_reset.month != current_time.month:
             begin_month = current_time.replace(
                 day=1, hour=0, minute=0, second=0, microsecond=0
             )
-            store_items = await Store.get_items(self.bot)
+            store_items = await Store.get_items(self.bot, refresh=True)
 
             fin.last_reset = current_time
             goal = fin.monthly_goal
@@ -269,5 +320,5 @@ class Admin(commands.Cog):
                             )
 
             await fin.update()
-            await RefDashboard.update_financial_dashboards(self.bot)
+            RefDashboard.queue_financial_refresh(self.bot)
             log.info("Finanical month reset")
@@ -5,9 +5,11 @@ from discord.ext import commands
 
 from Resolute.bot import G0T0Bot, G0T0Context
 from Resolute.constants import ZWSP3
+from Resolute.helpers import needs_context
 from Resolute.models.categories.categories import Faction
 from Resolute.models.embeds import PlayerEmbed
 from Resolute.models.objects.adventures import Adventure
+from Resolute.models.objects.enum import ContextLevel
 from Resolute.models.objects.exceptions import (
     CharacterNotFound,
     G0T0Error,
@@ -52,6 +54,7 @@ class Adventures(commands.Cog):
     @commands.slash_command(
         name="adventures", description="Shows active adventures for a player"
     )
+    @needs_context(ContextLevel.full)
     async def adventure_get(
         self,
         ctx: G0T0Context,
@@ -150,6 +153,7 @@ class Adventures(commands.Cog):
         return [f.value for f in self.bot.compendium.get_values(Faction)] or []
 
     @adventure_commands.command(name="create", description="Creates a new adventure")
+    @needs_context(ContextLevel.guild)
     async def adventure_create(
         self,
         ctx: G0T0Context,
@@ -201,7 +205,7 @@ class Adventures(commands.Cog):
         if discord.utils.get(ctx.guild.roles, name=role_name):
             raise G0T0Error(f"Role `@{role_name}` already exists")
         else:
-            g = ctx.player.guild
+            g = ctx.playerGuild
             adventure_role: discord.Role = await g.guild.create_role(
                 name=role_name,
                 mentionable=True,
@@ -322,6 +326,7 @@ class Adventures(commands.Cog):
         name="manage",
         description="Manage an adventure. Either run in the adventure channel or specify a role/category",
     )
+    @needs_context(ContextLevel.guild)
     async def adventure_manage(
         self,
         ctx: G0T0Context,
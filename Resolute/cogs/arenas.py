@@ -1,23 +1,26 @@
+import asyncio
 import logging
 
 import discord
 from discord.commands import SlashCommandGroup
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from Resolute.bot import G0T0Bot, G0T0Context
 from Resolute.constants import CHANNEL_BREAK, THUMBNAIL
-from Resolute.helpers import confirm
+from Resolute.helpers import confirm, needs_context
 from Resolute.models.categories import ArenaTier, ArenaType
 from Resolute.models.embeds import PlayerEmbed
 from Resolute.models.embeds.arenas import ArenaStatusEmbed
 from Resolute.models.embeds.players import ArenaPostEmbed
 from Resolute.models.objects.arenas import Arena
+from Resolute.models.objects.enum import ContextLevel
 from Resolute.models.objects.exceptions import (
     ArenaNotFound,
     CharacterNotFound,
     G0T0Error,
 )
-from Resolute.models.objects.logs import DBLog
+from Resolute.models.objects.guilds import PlayerGuild
+from Resolute.models.objects.logs import DBLogBatch
 from Resolute.models.objects.players import ArenaPost, Player
 from Resolute.models.views.arena_view import (
     ArenaCharacterSelect,
@@ -46,7 +49,9 @@ class Arenas(commands.Cog):
             Initializes the Arenas cog with the given bot instance.
         on_compendium_loaded():
             Asynchronous method called when the compendium is loaded.
-            Adds CharacterArenaViewUI and ArenaCharacterSelect views to the bot.
+            Adds CharacterArenaViewUI and ArenaCharacterSelect views to the bot and starts the arena board sweep.
+        on_message(message: Message):
+            Registers player-authored posts in the arena board channel.
         arena_request(ctx: ApplicationContext):
             Processes the player's request to join an arena and performs eligibility checks.
         arena_claim(ctx: ApplicationContext, type: Option):
@@ -84,9 +89,36 @@ class Arenas(commands.Cog):
         self.bot.add_view(CharacterArenaViewUI.new(self.bot))
         self.bot.add_view(ArenaCharacterSelect(self.bot))
 
+        if not self.reconcile_arena_board.is_running():
+            asyncio.ensure_future(self.reconcile_arena_board.start())
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        """
+        Registers posts made directly by players in the arena board channel so they can be removed
+        by id when the player joins an arena or leaves the server.
+        Args:
+            message (Message): The message that was sent.
+        """
+        if (
+            not hasattr(self.bot, "db")
+            or not message.guild
+            or message.author.bot
+            or message.webhook_id
+        ):
+            return
+
+        g: PlayerGuild = await PlayerGuild.get_player_guild(self.bot, message.guild.id)
+
+        if g.arena_board_channel and message.channel.id == g.arena_board_channel.id:
+            await ArenaPost.register(
+                self.bot, message.guild.id, message.author.id, message.id
+            )
+
     @commands.slash_command(
         name="arena_request", description="Request to join an arena"
     )
+    @needs_context(ContextLevel.full)
     async def arena_request(self, ctx: G0T0Context):
         """
         Handles an arena request from a player.
@@ -141,6 +173,7 @@ class Arenas(commands.Cog):
     @arena_commands.command(
         name="claim", description="Opens an arena in this channel and sets you as host"
     )
+    @needs_context(ContextLevel.none)
     async def arena_claim(
         self,
         ctx: G0T0Context,
@@ -193,6 +226,7 @@ class Arenas(commands.Cog):
     @arena_commands.command(
         name="status", description="Shows the current status of this arena."
     )
+    @needs_context(ContextLevel.none)
     async def arena_status(self, ctx: G0T0Context):
         """
         Retrieves and sends the status of the current arena in the context channel.
@@ -219,6 +253,7 @@ class Arenas(commands.Cog):
     @arena_commands.command(
         name="add", description="Adds the specified player to this arena"
     )
+    @needs_context(ContextLevel.none)
     async def arena_add(
         self,
         ctx: G0T0Context,
@@ -262,6 +297,7 @@ class Arenas(commands.Cog):
     @arena_commands.command(
         name="remove", description="Removes the specified player from this arena"
     )
+    @needs_context(ContextLevel.none)
     async def arena_remove(
         self,
         ctx: G0T0Context,
@@ -311,6 +347,7 @@ class Arenas(commands.Cog):
     @arena_commands.command(
         name="phase", description="Records the outcome of an arena phase"
     )
+    @needs_context(ContextLevel.none)
     async def arena_phase(
         self,
         ctx: G0T0Context,
@@ -349,41 +386,29 @@ class Arenas(commands.Cog):
             )
 
         arena.completed_phases += 1
-        await arena.upsert()
+        bonus_phase = (
+            arena.completed_phases % 2 == 0
+            or arena.completed_phases == arena.tier.max_phases
+        ) and result == "WIN"
+
+        # Load the host and every participant at once and build all logs in memory
+        batch = DBLogBatch(self.bot, ctx.guild.id, ctx.author)
+        await batch.load_players(
+            [arena.host_id] + [c.player_id for c in arena.player_characters]
+        )
 
         # Host Log
-        host = await Player.get_player(self.bot, arena.host_id, ctx.guild.id)
-        await DBLog.create(self.bot, ctx, host, ctx.author, "ARENA_HOST", silent=True)
+        batch.add(arena.host_id, "ARENA_HOST")
 
         # Rewards
         for character in arena.player_characters:
-            player = await Player.get_player(
-                self.bot, character.player_id, ctx.guild.id
-            )
-            await DBLog.create(
-                self.bot,
-                ctx,
-                player,
-                ctx.author,
-                "ARENA",
-                character=character,
-                notes=result,
-                silent=True,
-            )
+            batch.add(character.player_id, "ARENA", character=character, notes=result)
 
-            if (
-                arena.completed_phases % 2 == 0
-                or arena.completed_phases == arena.tier.max_phases
-            ) and result == "WIN":
-                await DBLog.create(
-                    self.bot,
-                    ctx,
-                    player,
-                    ctx.author,
-                    "ARENA_BONUS",
-                    character=character,
-                    silent=True,
-                )
+            if bonus_phase:
+                batch.add(character.player_id, "ARENA_BONUS", character=character)
+
+        # Arena phase and every log land together or not at all
+        await batch.commit(arena.upsert_query())
 
         await ArenaStatusEmbed(ctx, arena).update()
 
@@ -419,6 +444,7 @@ class Arenas(commands.Cog):
             await ctx.channel.send(CHANNEL_BREAK)
 
     @arena_commands.command(name="close", description="Closes out a finished arena")
+    @needs_context(ContextLevel.none)
     async def arena_close(self, ctx: G0T0Context):
         """
         Closes an active arena in the current channel.
@@ -453,3 +479,72 @@ class Arenas(commands.Cog):
         await arena.close()
         await ctx.respond(f"Arena closed. This channel is now free for use")
         await ctx.channel.send(CHANNEL_BREAK)
+
+    # --------------------------- #
+    # Tasks
+    # --------------------------- #
+    @tasks.loop(hours=6)
+    async def reconcile_arena_board(self):
+        """
+        Reconciles the arena board registry with each guild's arena board channel.
+        Registry rows for messages that no longer exist are dropped, unregistered posts are adopted,
+        and posts belonging to members who are no longer in the guild are deleted.
+        """
+        for guild in self.bot.guilds:
+            g: PlayerGuild = await PlayerGuild.get_player_guild(self.bot, guild.id)
+
+            if not g.arena_board_channel:
+                continue
+
+            try:
+                registered = await ArenaPost.get_guild_posts(self.bot, guild.id)
+                can_delete = g.arena_board_channel.permissions_for(
+                    guild.me
+                ).manage_messages
+                seen = set()
+                adopted = 0
+                orphaned = 0
+
+                async for message in g.arena_board_channel.history(limit=None):
+                    if not message.author.bot:
+                        owner_id = message.author.id
+                    elif (
+                        message.embeds
+                        and message.embeds[0].footer
+                        and str(message.embeds[0].footer.text).isdigit()
+                    ):
+                        owner_id = int(message.embeds[0].footer.text)
+                    else:
+                        continue
+
+                    if not guild.get_member(owner_id) and can_delete:
+                        try:
+                            await message.delete()
+                            orphaned += 1
+                        except discord.NotFound:
+                            pass
+                        continue
+
+                    seen.add(message.id)
+
+                    if registered.get(message.id) != owner_id:
+                        await ArenaPost.register(
+                            self.bot, guild.id, owner_id, message.id
+                        )
+                        adopted += 1
+
+                stale = registered.keys() - seen
+                await ArenaPost.unregister(self.bot, stale)
+
+                if adopted or orphaned or stale:
+                    log.info(
+                        f"ARENA BOARD: {guild.name} [{guild.id}] - {adopted} adopted, {orphaned} orphaned post(s) deleted, "
+                        f"{len(stale)} stale registry row(s) removed"
+                    )
+            except Exception as error:
+                if isinstance(error, discord.HTTPException):
+                    log.warning(
+                        f"ARENA BOARD: Unable to reconcile arena board for {guild.name} [{guild.id}]"
+                    )
+                else:
+                    log.error(error)
@@ -4,7 +4,9 @@ import discord
 from discord.ext import commands
 
 from Resolute.bot import G0T0Bot, G0T0Context
+from Resolute.helpers import needs_context
 from Resolute.models.embeds import ErrorEmbed
+from Resolute.models.objects.enum import ContextLevel
 from Resolute.models.objects.guilds import PlayerGuild
 from Resolute.models.views.channel_admin import ChannelAdminUI
 
@@ -57,6 +59,7 @@ class ChannelAdmin(commands.Cog):
         name="manage",
         description="Room settings",
     )
+    @needs_context(ContextLevel.player)
     async def channel_settings(self, ctx: G0T0Context):
         """
         Handles the channel settings command.
@@ -5,16 +5,13 @@ from discord.ext import commands
 
 from Resolute.bot import G0T0Bot
 from Resolute.constants import APPROVAL_EMOJI, DENIED_EMOJI
-from Resolute.helpers import dm_check, try_delete
+from Resolute.helpers import dm_check, initial_response, needs_context, try_delete
 from Resolute.models.embeds.players import PlayerOverviewEmbed
 from Resolute.bot import G0T0Context
-from Resolute.models.objects.enum import ApplicationType
+from Resolute.models.objects.enum import ApplicationType, ContextLevel, RequestStatus
 from Resolute.models.objects.applications import PlayerApplication
-from Resolute.models.objects.exceptions import (
-    ApplicationNotFound,
-    CharacterNotFound,
-    G0T0Error,
-)
+from Resolute.models.objects.exceptions import CharacterNotFound, G0T0Error
+from Resolute.models.objects.guilds import PlayerGuild
 from Resolute.models.objects.players import Player
 from Resolute.models.objects.webhook import G0T0Webhook
 from Resolute.models.views.applications import (
@@ -61,6 +58,10 @@ class Character(commands.Cog):
             Command for making a new character request.
         edit_application(ctx: discord.ApplicationContext, application_id: discord.Option):
             Command for editing an application.
+        on_raw_reaction_add(payload: discord.RawReactionActionEvent):
+            Records staff approvals and denials on applications.
+        on_raw_reaction_remove(payload: discord.RawReactionActionEvent):
+            Reopens an application when its approval or denial is removed.
     """
 
     bot: G0T0Bot
@@ -74,8 +75,66 @@ class Character(commands.Cog):
         self.bot = bot
         log.info(f"Cog 'Characters' loaded")
 
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        if (
+            not hasattr(self.bot, "db")
+            or not payload.guild_id
+            or not payload.member
+            or payload.emoji.name not in APPROVAL_EMOJI + DENIED_EMOJI
+        ):
+            return
+
+        guild = await PlayerGuild.get_player_guild(self.bot, payload.guild_id)
+
+        if (
+            guild.application_channel
+            and payload.channel_id == guild.application_channel.id
+            and guild.is_staff(payload.member)
+        ):
+            await PlayerApplication.set_status(
+                self.bot,
+                payload.message_id,
+                (
+                    RequestStatus.approved
+                    if payload.emoji.name in APPROVAL_EMOJI
+                    else RequestStatus.denied
+                ),
+            )
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        if (
+            not hasattr(self.bot, "db")
+            or not payload.guild_id
+            or payload.emoji.name not in APPROVAL_EMOJI + DENIED_EMOJI
+        ):
+            return
+
+        guild = await PlayerGuild.get_player_guild(self.bot, payload.guild_id)
+
+        if (
+            guild.application_channel
+            and payload.channel_id == guild.application_channel.id
+        ):
+            message = await guild.application_channel.fetch_message(payload.message_id)
+            emoji = [
+                x.emoji.name if hasattr(x.emoji, "name") else x.emoji
+                for x in message.reactions
+            ]
+
+            if any(e in APPROVAL_EMOJI for e in emoji):
+                status = RequestStatus.approved
+            elif any(e in DENIED_EMOJI for e in emoji):
+                status = RequestStatus.denied
+            else:
+                status = RequestStatus.pending
+
+            await PlayerApplication.set_status(self.bot, payload.message_id, status)
+
     @commands.command(name="say", contexts=[discord.InteractionContextType.guild])
     @commands.check(dm_check)
+    @needs_context(ContextLevel.player)
     async def character_say(self, ctx: G0T0Context):
         """
         Handles the character say command, allowing a player to send a message as one of their characters.
@@ -101,6 +160,7 @@ class Character(commands.Cog):
     @character_admin_commands.command(
         name="manage", description="Manage a players character(s)"
     )
+    @needs_context(ContextLevel.none)
     async def character_manage(
         self,
         ctx: G0T0Context,
@@ -126,6 +186,7 @@ class Character(commands.Cog):
         name="get",
         description="Displays character information for a player's character",
     )
+    @needs_context(ContextLevel.full)
     async def character_get(
         self,
         ctx: G0T0Context,
@@ -167,6 +228,7 @@ class Character(commands.Cog):
         await ctx.delete()
 
     @commands.slash_command(name="settings", description="Character settings")
+    @needs_context(ContextLevel.player)
     async def character_settings(self, ctx: G0T0Context):
         """
         Handles the character settings command.
@@ -189,6 +251,7 @@ class Character(commands.Cog):
         name="rp_request",
         description="RP Board Request",
     )
+    @needs_context(ContextLevel.player)
     async def rp_request(self, ctx: G0T0Context):
         """
         Handles a roleplay request from a user.
@@ -209,6 +272,8 @@ class Character(commands.Cog):
         await ctx.delete()
 
     @commands.slash_command(name="level_request", description="Level Request")
+    @needs_context(ContextLevel.full)
+    @initial_response(modal=True)
     async def character_level_request(self, ctx: G0T0Context):
         """
         Handles a character level request from a user.
@@ -259,6 +324,7 @@ class Character(commands.Cog):
     @commands.slash_command(
         name="new_character_request", description="New Character Request"
     )
+    @needs_context(ContextLevel.player)
     async def new_character_request(self, ctx: G0T0Context):
         """
         Handles the request to create a new character.
@@ -288,6 +354,8 @@ class Character(commands.Cog):
         await ctx.delete()
 
     @commands.slash_command(name="edit_application", description="Edit an application")
+    @needs_context(ContextLevel.player)
+    @initial_response(modal=True)
     async def edit_application(
         self,
         ctx: G0T0Context,
@@ -309,35 +377,22 @@ class Character(commands.Cog):
         Returns:
             None
         """
-        if ctx.player.guild.application_channel:
-            if application_id:
-                try:
-                    message = await ctx.player.guild.application_channel.fetch_message(
-                        int(application_id)
-                    )
-                except ValueError:
-                    raise G0T0Error("Invalid application identifier")
-                except discord.NotFound:
-                    raise ApplicationNotFound()
-            else:
-                try:
-                    message = await ctx.player.guild.application_channel.fetch_message(
-                        ctx.channel.id
-                    )
-                except:
-                    raise ApplicationNotFound()
-
-        emoji = [
-            x.emoji.name if hasattr(x.emoji, "name") else x.emoji
-            for x in message.reactions
-        ]
-        if any(e in APPROVAL_EMOJI for e in emoji):
-            raise G0T0Error("Application is already approved. Cannot edit at this time")
-        elif any(e in DENIED_EMOJI for e in emoji):
-            raise G0T0Error("Application marked as invalid and cannot me modified")
+        if application_id:
+            try:
+                message_id = int(application_id)
+            except ValueError:
+                raise G0T0Error("Invalid application identifier")
+        else:
+            # Application threads share their id with the application message
+            message_id = ctx.channel.id
 
         application = PlayerApplication(self.bot, ctx.author, edit=True)
-        await application.load(message)
+        await application.load(message_id, ctx.player.guild.application_channel)
+
+        if application.status == RequestStatus.approved:
+            raise G0T0Error("Application is already approved. Cannot edit at this time")
+        elif application.status == RequestStatus.denied:
+            raise G0T0Error("Application marked as invalid and cannot me modified")
 
         if application.application.type in [
             ApplicationType.new,
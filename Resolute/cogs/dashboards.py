@@ -6,10 +6,11 @@ from discord.ext import commands, tasks
 
 from Resolute.bot import G0T0Bot, G0T0Context
 from Resolute.constants import DASHBOARD_REFRESH_INTERVAL, ZWSP3
+from Resolute.helpers import needs_context
 from Resolute.models.objects.dashboards import (
     RefDashboard,
 )
-from Resolute.models.objects.enum import QueryResultType
+from Resolute.models.objects.enum import ContextLevel, QueryResultType
 from Resolute.models.views.dashboards import DashboardSettingsUI
 
 log = logging.getLogger(__name__)
@@ -97,6 +98,7 @@ class Dashboards(commands.Cog):
         name="manage",
         description="Manage dashboards",
     )
+    @needs_context(ContextLevel.none)
     async def dashboard_manage(self, ctx: G0T0Context):
         """
         Manages the dashboard settings for the user.
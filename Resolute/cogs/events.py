@@ -11,7 +11,7 @@ from Resolute.models.objects.applications import PlayerApplication
 from Resolute.models.objects.dashboards import RefDashboard
 from Resolute.models.objects.financial import Financial
 from Resolute.models.objects.guilds import PlayerGuild
-from Resolute.models.objects.players import Player
+from Resolute.models.objects.players import ArenaPost, Player
 from Resolute.models.objects.store import Store
 
 log = logging.getLogger(__name__)
@@ -51,7 +51,7 @@ class Events(commands.Cog):
         1. Cleans up the reference table by upserting the application data.
         2. Checks if the player exists in the bot's database.
         3. If the player exists:
-            - Cleans up the arena board by purging messages from the removed member.
+            - Cleans up the arena board by deleting the removed member's registered posts.
             - Sets the player's member attribute to the removed user if an exit channel is present.
         4. If the player does not exist:
             - Retrieves the player's guild information.
@@ -66,12 +66,14 @@ class Events(commands.Cog):
             self.bot, int(payload.user.id), payload.guild_id, lookup_only=True
         ):
             # Cleanup Arena Board
-            def predicate(message):
-                return message.author == payload.user
-
             if player.guild.arena_board_channel:
                 try:
-                    await player.guild.arena_board_channel.purge(check=predicate)
+                    await ArenaPost.delete_posts(
+                        self.bot,
+                        player.guild.arena_board_channel,
+                        payload.guild_id,
+                        player.id,
+                    )
                 except Exception as error:
                     if isinstance(error, discord.HTTPException):
                         pass
@@ -218,18 +220,17 @@ class Events(commands.Cog):
     async def _handle_entitlements(self, entitlement: discord.Entitlement) -> None:
         """
         Handle the entitlements for a user.
-        This function processes the entitlements by updating the financial data
-        and dashboards based on the store items and their costs.
+        This function processes the entitlements by updating the cached financial data
+        based on the store item's cost and queueing a financial dashboard refresh. Bursts of
+        entitlements are coalesced into a single dashboard render.
         Args:
             entitlement (Entitlement): The entitlement object containing SKU ID.
         Returns:
             None
         """
-        store_items = await Store.get_items(self.bot)
-
         fin = await Financial.get_financial_data(self.bot)
 
-        if store := next((s for s in store_items if s.sku == entitlement.sku_id), None):
+        if store := await Store.get_item(self.bot, entitlement.sku_id):
             fin.monthly_total += store.user_cost
 
             if fin.adjusted_total > fin.monthly_goal:
@@ -238,4 +239,4 @@ class Events(commands.Cog):
                 )
 
         await fin.update()
-        await RefDashboard.update_financial_dashboards(self.bot)
+        RefDashboard.queue_financial_refresh(self.bot)
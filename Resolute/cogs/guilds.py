@@ -9,19 +9,23 @@ import discord
 from discord.ext import commands, tasks
 
 from Resolute.bot import G0T0Bot, G0T0Context
-from Resolute.helpers import confirm, is_admin
+from Resolute.helpers import confirm, is_admin, needs_context
 from Resolute.helpers.general_helpers import process_message
 from Resolute.models.embeds import PaginatedEmbed
 from Resolute.models.embeds.guilds import ResetEmbed
 from Resolute.models.objects.characters import PlayerCharacter
-from Resolute.models.objects.enum import QueryResultType
+from Resolute.models.objects.enum import ContextLevel, QueryResultType
 from Resolute.models.objects.guilds import PlayerGuild
 from Resolute.models.objects.logs import DBLog
-from Resolute.models.objects.players import Player
+from Resolute.models.objects.players import Player, RPPost
 from Resolute.models.views.guild_settings import GuildSettingsUI
 
 log = logging.getLogger(__name__)
 
+RP_CLEANUP_WORKERS = 5
+BULK_DELETE_LIMIT = 100
+RP_BACKFILL_BATCH = 500
+
 
 def setup(bot: commands.Bot):
     bot.add_cog(Guilds(bot))
@@ -46,6 +50,8 @@ class Guilds(commands.Cog):
             Command to manually trigger the weekly reset for a server.
         guild_announcements(ctx):
             Command to manually push announcements to the guild's announcement channel.
+        guild_resync_tier_roles(ctx):
+            Command to resync member and tier roles for every player in the guild.
         push_announcements(guild, complete_time=None, **kwargs):
             Sends announcements to the guild's announcement channel.
         perform_weekly_reset(g):
@@ -65,6 +71,7 @@ class Guilds(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        self._rp_backfilled: set[int] = set()
         log.info(f"Cog 'Guilds' loaded")
 
     @commands.Cog.listener()
@@ -90,6 +97,7 @@ class Guilds(commands.Cog):
         name="settings", description="Modify the current guild/server settings"
     )
     @commands.check(is_admin)
+    @needs_context(ContextLevel.guild)
     async def guild_settings(self, ctx: G0T0Context):
         """
         Handles the guild settings command.
@@ -101,7 +109,7 @@ class Guilds(commands.Cog):
         Returns:
             Coroutine: A coroutine that deletes the context message.
         """
-        ui = GuildSettingsUI.new(self.bot, ctx.author, ctx.player.guild)
+        ui = GuildSettingsUI.new(self.bot, ctx.author, ctx.playerGuild)
 
         await ui.send_to(ctx)
         return await ctx.delete()
@@ -110,6 +118,7 @@ class Guilds(commands.Cog):
         name="weekly_reset", description="Performs a weekly reset for the server"
     )
     @commands.check(is_admin)
+    @needs_context(ContextLevel.guild)
     async def guild_weekly_reset(self, ctx: G0T0Context):
         """
         Manually performs a weekly reset for the guild.
@@ -136,13 +145,14 @@ class Guilds(commands.Cog):
         elif not conf:
             return await ctx.respond(f"Ok, cancelling.", delete_after=10)
 
-        await self.perform_weekly_reset(ctx.player.guild)
+        await self.perform_weekly_reset(ctx.playerGuild)
         return await ctx.respond("Weekly reset manually completed")
 
     @guilds_commands.command(
         name="send_announcements", description="Send announcements only"
     )
     @commands.check(is_admin)
+    @needs_context(ContextLevel.guild)
     async def guild_announcements(self, ctx: G0T0Context):
         """
         Manually push guild announcements.
@@ -170,13 +180,49 @@ class Guilds(commands.Cog):
         elif not conf:
             return await ctx.respond(f"Ok, cancelling.", delete_after=10)
 
-        ctx.player.guild = await self.push_announcements(
-            ctx.player.guild, None, title="Announcements"
+        ctx.playerGuild = await self.push_announcements(
+            ctx.playerGuild, None, title="Announcements"
         )
-        await ctx.player.guild.upsert()
-        self.bot.dispatch("refresh_guild_cache", ctx.player.guild)
+        await ctx.playerGuild.upsert()
+        self.bot.dispatch("refresh_guild_cache", ctx.playerGuild)
         return await ctx.respond("Announcements manually completed")
 
+    @guilds_commands.command(
+        name="resync_tier_roles",
+        description="Resyncs member and tier roles for everyone in the server",
+    )
+    @commands.check(is_admin)
+    @needs_context(ContextLevel.guild)
+    async def guild_resync_tier_roles(self, ctx: G0T0Context):
+        """
+        Manually resyncs the member and tier roles for every player in the guild.
+        The role diffs are computed up front and applied in the background through a rate limited worker,
+        with a summary posted to the channel once it finishes.
+        Args:
+            ctx (ApplicationContext): The context of the command invocation.
+        Returns:
+            None
+        """
+        guild = ctx.playerGuild
+        channel = ctx.channel
+
+        async def resync():
+            start = timer()
+            updated = await Player.resync_guild_tier_roles(
+                self.bot, guild, f"Tier role resync by {ctx.author.name}"
+            )
+            end = timer()
+
+            log.info(
+                f"TIER ROLES: {updated} member{'s' if updated != 1 else ''} updated for {guild.guild.name} [{guild.id}] in {end - start:.2f}s"
+            )
+            await channel.send(
+                f"Tier role resync complete. {updated} member{'s' if updated != 1 else ''} updated."
+            )
+
+        asyncio.create_task(resync())
+        return await ctx.respond("Resyncing tier roles. I'll post here when it's done.")
+
     async def push_announcements(
         self, guild: PlayerGuild, complete_time: float = None, **kwargs
     ) -> PlayerGuild:
@@ -395,40 +441,98 @@ class Guilds(commands.Cog):
     async def cleanup_rp_posts(self):
         """
         Asynchronously cleans up role-playing (RP) posts in the designated RP post channels of all guilds.
-        This method deletes messages that are older than 72 hours and were sent by bots using webhooks.
+        This method deletes RP board posts that are older than 72 hours, using the message ids and created
+        timestamps recorded when the posts were made.
         Steps:
         1. Calculate the cutoff time as the current time minus 72 hours.
-        2. Iterate through all guilds the bot is a member of.
-        3. For each guild, retrieve the PlayerGuild object.
-        4. Define a predicate function to identify messages sent by bots using webhooks.
-        5. If the guild has an RP post channel, attempt to purge messages that match the predicate and are older than the cutoff time.
-        6. Log the number of deleted messages if any were deleted.
-        7. Handle and log any exceptions that occur during the purge process.
-        Raises:
-            HTTPException: If there is an error purging messages in the RP post channel.
-            Exception: For any other exceptions that occur during the purge process.
+        2. Process the guilds the bot is a member of concurrently, up to RP_CLEANUP_WORKERS at a time.
+        3. Register the RP board history of guilds that haven't completed a backfill yet, which covers posts made
+           before posts were being recorded. A guild is only marked complete once its whole history was scanned,
+           so a failed backfill is retried on the next run.
+        4. Select the expired message ids for the guild and bulk delete them in batches of 100.
+        5. Log the number of deleted messages and the time taken for each guild.
         """
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=72)
+        semaphore = asyncio.Semaphore(RP_CLEANUP_WORKERS)
+
+        async def cleanup_guild(guild: discord.Guild):
+            async with semaphore:
+                await self._cleanup_guild_rp_posts(guild, cutoff_time)
+
+        await asyncio.gather(*[cleanup_guild(guild) for guild in self.bot.guilds])
+
+    async def _cleanup_guild_rp_posts(
+        self, guild: discord.Guild, cutoff_time: datetime
+    ) -> None:
+        start = timer()
+        g: PlayerGuild = await PlayerGuild.get_player_guild(self.bot, guild.id)
+
+        if not g.rp_post_channel:
+            return
+
+        deleted = 0
+
+        try:
+            if guild.id not in self._rp_backfilled:
+                if not await RPPost.is_backfilled(self.bot, guild.id):
+                    await self._backfill_rp_posts(g)
+                    await RPPost.mark_backfilled(self.bot, guild.id)
+                self._rp_backfilled.add(guild.id)
+
+            message_ids = await RPPost.get_expired(self.bot, guild.id, cutoff_time)
+
+            for i in range(0, len(message_ids), BULK_DELETE_LIMIT):
+                batch = message_ids[i : i + BULK_DELETE_LIMIT]
+                deleted += await self._delete_rp_posts(g.rp_post_channel, batch)
+                await RPPost.unregister(self.bot, batch)
+        except Exception as error:
+            if isinstance(error, discord.HTTPException):
+                log.error(
+                    f"RP BOARD: Error deleting messages in {g.rp_post_channel.name}"
+                )
+            else:
+                log.error(error)
 
-        for guild in self.bot.guilds:
-            g: PlayerGuild = await PlayerGuild.get_player_guild(self.bot, guild.id)
+        end = timer()
 
-            def predicate(message: discord.Message):
-                return message.author.bot and message.webhook_id is not None
+        log.info(
+            f"RP BOARD: {deleted} message{'s' if deleted != 1 else ''} deleted from {g.rp_post_channel.name} for {g.guild.name} [{g.guild.id}] in {end - start:.2f}s"
+        )
 
-            if g.rp_post_channel:
+    async def _delete_rp_posts(
+        self, channel: discord.TextChannel, message_ids: list[int]
+    ) -> int:
+        try:
+            await channel.delete_messages([discord.Object(id=m) for m in message_ids])
+            return len(message_ids)
+        except discord.HTTPException:
+            # Bulk delete rejects the whole batch if any message is missing or too old
+            count = 0
+            for message_id in message_ids:
                 try:
-                    deleted_messages = await g.rp_post_channel.purge(
-                        limit=None, before=cutoff_time, check=predicate
-                    )
-                    if len(deleted_messages) > 0:
-                        log.info(
-                            f"RP BOARD: {len(deleted_messages)} message{'s' if len(deleted_messages) > 1 else ''} deleted from {g.rp_post_channel.name} for {g.guild.name} [{g.guild.id}]"
-                        )
-                except Exception as error:
-                    if isinstance(error, discord.HTTPException):
-                        log.error(
-                            f"RP BOARD: Error purging messages in {g.rp_post_channel.name}"
-                        )
-                    else:
-                        log.error(error)
+                    await channel.get_partial_message(message_id).delete()
+                    count += 1
+                except discord.NotFound:
+                    pass
+            return count
+
+    async def _backfill_rp_posts(self, g: PlayerGuild) -> None:
+        posts = []
+
+        async for message in g.rp_post_channel.history(limit=None):
+            if not message.author.bot or message.webhook_id is None:
+                continue
+
+            footer = message.embeds[0].footer.text if message.embeds else None
+            posts.append(
+                (
+                    message,
+                    int(footer) if footer and footer.isdigit() else message.author.id,
+                )
+            )
+
+            if len(posts) >= RP_BACKFILL_BATCH:
+                await RPPost.register_many(self.bot, posts)
+                posts = []
+
+        await RPPost.register_many(self.bot, posts)
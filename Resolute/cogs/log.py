@@ -5,9 +5,10 @@ from discord.ext import commands
 
 from Resolute.bot import G0T0Bot, G0T0Context
 from Resolute.constants import ZWSP3
-from Resolute.helpers import is_admin, is_staff
+from Resolute.helpers import is_admin, is_staff, needs_context
 from Resolute.helpers.general_helpers import confirm
 from Resolute.models.embeds.logs import LogHxEmbed, LogStatsEmbed
+from Resolute.models.objects.enum import ContextLevel
 from Resolute.models.objects.exceptions import (
     CharacterNotFound,
     G0T0Error,
@@ -68,6 +69,7 @@ class Log(commands.Cog):
 
     @log_commands.command(name="rp", description="Logs a completed RP")
     @commands.check(is_staff)
+    @needs_context(ContextLevel.player)
     async def rp_log(
         self,
         ctx: G0T0Context,
@@ -100,6 +102,7 @@ class Log(commands.Cog):
 
     @log_commands.command(name="snapshot", description="Logs a completed snapshot")
     @commands.check(is_staff)
+    @needs_context(ContextLevel.player)
     async def snapshot_log(
         self,
         ctx: G0T0Context,
@@ -115,6 +118,7 @@ class Log(commands.Cog):
         name="bonus", description="Give bonus gold and/or xp to a player"
     )
     @commands.check(is_staff)
+    @needs_context(ContextLevel.player)
     async def bonus_log(
         self,
         ctx: G0T0Context,
@@ -167,6 +171,7 @@ class Log(commands.Cog):
         name="buy", description="Logs the sale of an item to a player"
     )
     @commands.check(is_staff)
+    @needs_context(ContextLevel.player)
     async def buy_log(
         self,
         ctx: G0T0Context,
@@ -233,6 +238,7 @@ class Log(commands.Cog):
         description="Logs the sale of an item from a player. Not for player establishment sales",
     )
     @commands.check(is_staff)
+    @needs_context(ContextLevel.player)
     async def sell_log(
         self,
         ctx: G0T0Context,
@@ -298,6 +304,7 @@ class Log(commands.Cog):
 
     @log_commands.command(name="null", description="Nullifies a log")
     @commands.check(is_admin)
+    @needs_context(ContextLevel.none)
     async def null_log(
         self,
         ctx: G0T0Context,
@@ -355,6 +362,7 @@ class Log(commands.Cog):
             await log_entry.null(ctx, reason, bulk)
 
     @log_commands.command(name="stats", description="Log statistics for a character")
+    @needs_context(ContextLevel.none)
     async def log_stats(
         self,
         ctx: G0T0Context,
@@ -368,7 +376,7 @@ class Log(commands.Cog):
         player = await Player.get_player(
             self.bot, member.id, ctx.guild.id, inactive=True
         )
-        player_stats = await player.get_stats(self.bot)
+        player_stats, character_stats = await player.get_stats(self.bot)
 
         embeds = []
         embed = LogStatsEmbed(player, player_stats)
@@ -377,8 +385,7 @@ class Log(commands.Cog):
                 player.characters, key=lambda c: c.active, reverse=True
             )
             for character in sorted_characters:
-                char_stats = await character.get_stats(self.bot)
-                if char_stats:
+                if char_stats := character_stats.get(character.id):
                     embed.add_field(
                         name=f"{character.name}{' (*inactive*)' if not character.active else ''}",
                         value=f"{ZWSP3}**Starting Credits**: {char_stats['credit starting']:,}\n"
@@ -399,7 +406,7 @@ class Log(commands.Cog):
 
                 if len(embed.fields) > 20:
                     embeds.append(embed)
-                    embed = LogStatsEmbed(self.bot, player, player_stats, False)
+                    embed = LogStatsEmbed(player, player_stats, False)
 
         if embed not in embeds:
             embeds.append(embed)
@@ -411,6 +418,7 @@ class Log(commands.Cog):
     @log_commands.command(
         name="get_history", description="Get the last weeks worth of logs for a player"
     )
+    @needs_context(ContextLevel.none)
     async def get_log_hx(
         self,
         ctx: G0T0Context,
@@ -4,6 +4,8 @@ import discord
 from discord.ext import commands
 
 from Resolute.bot import G0T0Bot, G0T0Context
+from Resolute.helpers import needs_context
+from Resolute.models.objects.enum import ContextLevel
 from Resolute.models.objects.exceptions import CharacterNotFound
 from Resolute.models.views.market import MarketPromptUI, TransactionPromptUI
 
@@ -36,6 +38,7 @@ class Market(commands.Cog):
         log.info(f"Cog 'Market' loaded")
 
     @market_commands.command(name="request", description="Setup a market request")
+    @needs_context(ContextLevel.player)
     async def market_request(self, ctx: G0T0Context):
         """
         Handles a market request from a user.
@@ -6,9 +6,16 @@ from discord.ext import commands
 
 from Resolute.bot import G0T0Bot, G0T0Context
 from Resolute.constants import APPROVAL_EMOJI, DENIED_EMOJI, EDIT_EMOJI, NULL_EMOJI
-from Resolute.helpers import confirm, is_admin, is_staff
+from Resolute.helpers import (
+    confirm,
+    initial_response,
+    is_admin,
+    is_staff,
+    needs_context,
+)
 from Resolute.models.embeds.logs import LogEmbed
-from Resolute.models.objects.enum import WebhookType
+from Resolute.models.objects.enum import ContextLevel, RequestStatus, WebhookType
+from Resolute.models.objects.guilds import PlayerGuild
 from Resolute.models.objects.market import MarketTransaction
 from Resolute.models.objects.players import ArenaPost
 from Resolute.models.objects.exceptions import G0T0Error, LogNotFound
@@ -33,7 +40,60 @@ class Messages(commands.Cog):
         self.bot = bot
         log.info(f"Cog 'Messages' loaded")
 
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        """
+        Marks a market request as denied when staff react to it with a denied emoji.
+        Args:
+            payload (RawReactionActionEvent): The reaction event payload.
+        """
+        if (
+            not hasattr(self.bot, "db")
+            or not payload.guild_id
+            or payload.user_id == self.bot.user.id
+            or str(payload.emoji) not in DENIED_EMOJI
+        ):
+            return
+
+        guild = await PlayerGuild.get_player_guild(self.bot, payload.guild_id)
+
+        if (
+            guild.market_channel
+            and payload.channel_id == guild.market_channel.id
+            and payload.member
+            and guild.is_staff(payload.member)
+        ):
+            await MarketTransaction.set_status(
+                self.bot, payload.message_id, RequestStatus.denied
+            )
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        """
+        Reopens a denied market request once its last denied emoji is removed.
+        Args:
+            payload (RawReactionActionEvent): The reaction event payload.
+        """
+        if (
+            not hasattr(self.bot, "db")
+            or not payload.guild_id
+            or str(payload.emoji) not in DENIED_EMOJI
+        ):
+            return
+
+        guild = await PlayerGuild.get_player_guild(self.bot, payload.guild_id)
+
+        if guild.market_channel and payload.channel_id == guild.market_channel.id:
+            message = await guild.market_channel.fetch_message(payload.message_id)
+
+            if not any(r.emoji in DENIED_EMOJI for r in message.reactions):
+                await MarketTransaction.set_status(
+                    self.bot, payload.message_id, RequestStatus.pending
+                )
+
     @commands.message_command(name="Edit")
+    @needs_context(ContextLevel.full)
+    @initial_response(modal=True)
     async def message_edit(self, ctx: G0T0Context, message: discord.Message):
         player = ctx.player
 
@@ -42,22 +102,11 @@ class Messages(commands.Cog):
             player.guild.market_channel
             and message.channel.id == player.guild.market_channel.id
         ):
-            if transaction := await MarketTransaction.get_request(self.bot, message):
+            if transaction := await MarketTransaction.get_request(
+                self.bot, message, player
+            ):
                 transaction: MarketTransaction
-
-                # Check if transaction was denied previously
-                if len(message.reactions) > 0:
-                    for reaction in message.reactions:
-                        if reaction.emoji in DENIED_EMOJI:
-                            users = await reaction.users().flatten()
-                            for user in users:
-                                if (
-                                    player.guild.is_staff(player.member)
-                                    or user.id == self.bot.user.id
-                                ):
-                                    raise G0T0Error(
-                                        f"Transaction was previously denied. Please make a new request"
-                                    )
+                self._check_transaction_status(transaction)
 
                 if transaction.player.id != ctx.author.id:
                     raise G0T0Error("You can only edit your own transactions")
@@ -123,6 +172,7 @@ class Messages(commands.Cog):
         await ctx.delete()
 
     @commands.message_command(name="Delete")
+    @needs_context(ContextLevel.player)
     async def message_delete(self, ctx: G0T0Context, message: discord.Message):
         player = ctx.player
 
@@ -135,32 +185,24 @@ class Messages(commands.Cog):
                 raise G0T0Error("You cannot edit this arena board post")
 
             await message.delete()
+            await ArenaPost.unregister(self.bot, [message.id])
 
         # Market
         elif (
             player.guild.market_channel
             and message.channel.id == player.guild.market_channel.id
         ):
-            if transaction := await MarketTransaction.get_request(self.bot, message):
+            if transaction := await MarketTransaction.get_request(
+                self.bot, message, player
+            ):
                 transaction: MarketTransaction
-                if len(message.reactions) > 0:
-                    for reaction in message.reactions:
-                        if reaction.emoji in DENIED_EMOJI:
-                            users = await reaction.users().flatten()
-
-                            for user in users:
-                                if (
-                                    player.guild.is_staff(player.member)
-                                    or user.id == self.bot.user.id
-                                ):
-                                    raise G0T0Error(
-                                        f"Transaction was previously denied. Please make a new request"
-                                    )
+                self._check_transaction_status(transaction)
 
                 if transaction.player.id != ctx.author.id:
                     raise G0T0Error("You can only edit your own transactions")
 
                 await message.delete()
+                await transaction.delete(self.bot)
 
         # RP Post
         elif (
@@ -205,26 +247,15 @@ class Messages(commands.Cog):
 
     @commands.message_command(name="Approve")
     @commands.check(is_staff)
+    @needs_context(ContextLevel.guild)
     async def message_approve(self, ctx: G0T0Context, message: discord.Message):
-        guild = ctx.player.guild
+        guild = ctx.playerGuild
 
         # Market Transactions
         if guild.market_channel and message.channel.id == guild.market_channel.id:
             if transaction := await MarketTransaction.get_request(self.bot, message):
                 transaction: MarketTransaction
-                # Check if transaction was denied previously
-                if len(message.reactions) > 0:
-                    for reaction in message.reactions:
-                        if reaction.emoji in DENIED_EMOJI:
-                            users = await reaction.users().flatten()
-                            for user in users:
-                                if (
-                                    guild.is_staff(ctx.player.member)
-                                    or user.id == self.bot.user.id
-                                ):
-                                    raise G0T0Error(
-                                        f"Transaction was previously denied. Please make a new request"
-                                    )
+                self._check_transaction_status(transaction)
 
                 # Selling items
                 if transaction.type.value == "Sell Items":
@@ -243,6 +274,9 @@ class Messages(commands.Cog):
                         show_values=True,
                         silent=True,
                     )
+                    await MarketTransaction.set_status(
+                        self.bot, message.id, RequestStatus.approved, log_entry.id
+                    )
                     await message.edit(content=None, embed=LogEmbed(log_entry, True))
 
                 else:
@@ -260,9 +294,15 @@ class Messages(commands.Cog):
                             show_values=True,
                             ignore_handicap=True,
                         )
+                        await MarketTransaction.set_status(
+                            self.bot, message.id, RequestStatus.approved, log_entry.id
+                        )
                         await message.add_reaction(APPROVAL_EMOJI[0])
                         await message.edit(content="", embed=LogEmbed(log_entry, True))
                     except Exception as error:
+                        await MarketTransaction.set_status(
+                            self.bot, message.id, RequestStatus.denied
+                        )
                         await message.clear_reactions()
                         await message.add_reaction(DENIED_EMOJI[0])
                         raise error
@@ -283,6 +323,7 @@ class Messages(commands.Cog):
 
     @commands.message_command(name="Null")
     @commands.check(is_admin)
+    @needs_context(ContextLevel.none)
     async def message_null(self, ctx: G0T0Context, message: discord.Message):
         await ctx.defer()
         log_entry = await self._get_log_from_entry(message)
@@ -310,6 +351,14 @@ class Messages(commands.Cog):
 
         return log_entry
 
+    def _check_transaction_status(self, transaction: MarketTransaction) -> None:
+        if transaction.status == RequestStatus.denied:
+            raise G0T0Error(
+                f"Transaction was previously denied. Please make a new request"
+            )
+        elif transaction.status == RequestStatus.approved:
+            raise G0T0Error(f"Transaction has already been approved")
+
     def _get_match(self, pattern, text, group=1, default=None):
         match = re.search(pattern, text, re.DOTALL)
         return match.group(group) if match and match.group(group) != "None" else default
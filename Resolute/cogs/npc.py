@@ -31,6 +31,7 @@ class NPC(commands.Cog):
         for npc in npcs:
             await npc.register_command(self.bot)
         end = timer()
+        self.bot.startup.record("npc_commands", end - start)
         log.info(f"NPC: NPC's loaded in [ {end-start:.2f} ]s")
 
     def create_npc_command(self, npc: NonPlayableCharacter):
@@ -4,8 +4,9 @@ import discord
 from discord.ext import commands
 
 from Resolute.bot import G0T0Bot, G0T0Context
-from Resolute.helpers import is_admin
+from Resolute.helpers import is_admin, needs_context
 from Resolute.models.objects.adventures import Adventure
+from Resolute.models.objects.enum import ContextLevel
 from Resolute.models.objects.exceptions import AdventureNotFound, G0T0Error
 from Resolute.models.objects.guilds import PlayerGuild
 from Resolute.models.views.rooms import RoomSettingsUI
@@ -42,6 +43,7 @@ class Room(commands.Cog):
         log.info(f"Cog 'Room' loaded")
 
     @room_commands.command(name="settings", description="Room settings")
+    @needs_context(ContextLevel.none)
     async def room_settings(self, ctx: G0T0Context):
         """
         Handles the room settings for a given context.
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 import discord
@@ -5,9 +6,11 @@ from discord.commands import SlashCommandGroup
 from discord.ext import commands
 
 from Resolute.bot import G0T0Bot, G0T0Context
-from Resolute.helpers import is_admin
+from Resolute.helpers import is_admin, needs_context
 from Resolute.models.embeds import ErrorEmbed
-from Resolute.models.objects.shatterpoint import Shatterpoint
+from Resolute.models.objects.enum import ContextLevel
+from Resolute.models.objects.guilds import PlayerGuild
+from Resolute.models.objects.shatterpoint import Shatterpoint, ShatterpointCheckpoint
 from Resolute.models.views.shatterpoint import ShatterpointSettingsUI
 
 log = logging.getLogger(__name__)
@@ -26,8 +29,8 @@ class Shatterpoints(commands.Cog):
     Methods:
         __init__(bot):
             Initializes the Shatterpoints cog.
-        on_db_connected():
-            Event listener that resets the busy flag in the database when the bot connects to the database.
+        on_compendium_loaded():
+            Event listener that resumes interrupted scrapes, or resets the busy flag if there is nothing to resume.
         shatterpoint_manage(ctx: ApplicationContext):
             Command to manage a shatterpoint. Only accessible to admins.
     """
@@ -47,9 +50,10 @@ class Shatterpoints(commands.Cog):
     @commands.Cog.listener()
     async def on_compendium_loaded(self):
         """
-        Event handler that is called when the database connection is established.
-        This method acquires a connection from the bot's database pool and executes
-        a query to reset the busy flag.
+        Event handler that is called once the compendium is loaded.
+        Any shatterpoint still flagged as busy was interrupted mid-scrape. Channels with an incomplete
+        checkpoint are resumed from their last checkpointed message. If there is nothing to resume the
+        busy flag is reset and the member is notified.
         Returns:
             None
         """
@@ -58,17 +62,45 @@ class Shatterpoints(commands.Cog):
             busy_shatterpoints = await Shatterpoint.get_busy_shatterpoints(self.bot)
 
             for shatterpoint in busy_shatterpoints:
+                checkpoints = await ShatterpointCheckpoint.get_incomplete_checkpoints(
+                    self.bot, shatterpoint.guild_id
+                )
+                channels = [
+                    self.bot.get_channel(c.channel_id)
+                    for c in checkpoints
+                    if self.bot.get_channel(c.channel_id)
+                ]
+
+                if shatterpoint.busy_member and channels:
+                    guild = await PlayerGuild.get_player_guild(
+                        self.bot, shatterpoint.guild_id
+                    )
+                    await shatterpoint.busy_member.send(
+                        f"**{shatterpoint.name}**: Bot went down or shard reset during scraping. Resuming where it left off."
+                    )
+
+                    log.info(
+                        f"Shatterpoint [{shatterpoint.guild_id}]: Resuming scrape of {', '.join([str(c.id) for c in channels])}"
+                    )
+                    asyncio.create_task(
+                        shatterpoint.scrape_channels(
+                            self.bot, channels, guild, shatterpoint.busy_member
+                        )
+                    )
+                    continue
+
                 if shatterpoint.busy_member:
                     await shatterpoint.busy_member.send(
                         embed=ErrorEmbed(
                             f"**{shatterpoint.name}**: Issue scraping the channel. Bot went down or shard reset during process. Please check your settings to ensure no data was written, and re-scrape."
                         )
                     )
-                    shatterpoint.busy_member = None
-                    await shatterpoint.upsert()
+                shatterpoint.busy_member = None
+                await shatterpoint.upsert()
 
     @shatterpoint_commands.command(name="manage", description="Manage a shatterpoint")
     @commands.check(is_admin)
+    @needs_context(ContextLevel.none)
     async def shatterpoint_manage(self, ctx: G0T0Context):
         """
         Manages the shatterpoint settings for the guild.
@@ -4,7 +4,8 @@ import discord
 from discord.ext import commands
 
 from Resolute.bot import G0T0Bot, G0T0Context
-from Resolute.helpers import is_staff
+from Resolute.helpers import is_staff, needs_context
+from Resolute.models.objects.enum import ContextLevel
 from Resolute.models.objects.players import Player
 from Resolute.models.views.character_view import CharacterManageUI
 
@@ -24,6 +25,7 @@ class Users(commands.Cog):
 
     @commands.user_command(name="Manage")
     @commands.check(is_staff)
+    @needs_context(ContextLevel.none)
     async def user_manage(self, ctx: G0T0Context, user: discord.Member):
         player = await Player.get_player(self.bot, user.id, user.guild.id)
         ui = CharacterManageUI.new(self.bot, ctx.author, player)
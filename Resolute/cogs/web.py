@@ -1,14 +1,16 @@
 import logging
 
 from discord.ext import commands
-from quart import abort, jsonify, request
+from quart import Response, abort, jsonify, request
 
 from Resolute.bot import G0T0Bot
-from Resolute.constants import AUTH_TOKEN, ERROR_CHANNEL
+from Resolute.constants import AUTH_TOKEN, ERROR_CHANNEL, METRICS_TOKEN
 from Resolute.models.objects.guilds import PlayerGuild
 
 log = logging.getLogger(__name__)
 
+LOCAL_ADDRESSES = ("127.0.0.1", "::1")
+
 
 def setup(bot: G0T0Bot):
     bot.add_cog(WebCog(bot))
@@ -31,6 +33,8 @@ class WebCog(commands.Cog):
                     Reloads the compendium categories and sends a message to the error channel.
                 /guild_update (POST):
                     Reloads the guild cache and sends a message to the error channel.
+                /metrics (GET):
+                    Returns in-process metrics in the Prometheus text format.
     """
 
     bot: G0T0Bot
@@ -55,6 +59,10 @@ class WebCog(commands.Cog):
 
         @bot.web_app.before_request
         async def verify_token():
+            # /metrics has its own token so scrapers don't need the admin one
+            if request.path == "/metrics":
+                return
+
             auth_token = request.headers.get("auth-token")
 
             if not auth_token or auth_token != AUTH_TOKEN:
@@ -67,6 +75,8 @@ class WebCog(commands.Cog):
         Routes:
             /reload (POST): Reloads the compendium categories and sends a notification to the error channel.
             /guild_update (POST): Reloads the guild cache and sends a notification to the error channel.
+            /metrics (GET): Returns in-process metrics in the Prometheus text format. Requires `METRICS_TOKEN` as a
+                bearer token if set, otherwise only answers local requests. Never queries the database.
         Args:
             bot (G0T0Bot): The bot instance to which the routes are added.
         Functions:
@@ -96,3 +106,15 @@ class WebCog(commands.Cog):
             bot.dispatch("refresh_guild_cache", guild)
             await bot.get_channel(int(ERROR_CHANNEL)).send(data["text"])
             return jsonify({"text": "Guild Cache Reloaded!"}), 200
+
+        @bot.web_app.route("/metrics", methods=["GET"])
+        async def metrics():
+            if METRICS_TOKEN:
+                if request.headers.get("authorization") != f"Bearer {METRICS_TOKEN}":
+                    return jsonify({"error": "You don't have access to this"}), 401
+            elif request.remote_addr not in LOCAL_ADDRESSES:
+                return jsonify({"error": "You don't have access to this"}), 401
+
+            return Response(
+                bot.metrics.render(bot), content_type="text/plain; version=0.0.4"
+            )
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from timeit import default_timer as timer
 
@@ -63,12 +64,19 @@ class Compendium:
         if not hasattr(bot, "db"):
             return
 
+        async def load(category: CompendiumObject) -> list:
+            async with bot.db.acquire() as conn:
+                return await get_table_values(conn, category)
+
+        # Categories are independent, so load them side by side and swap them in together
         start = timer()
-        async with bot.db.acquire() as conn:
-            for category in self.categories:
-                setattr(self, category.__key__, await get_table_values(conn, category))
+        values = await asyncio.gather(*[load(c) for c in self.categories])
+        for category, value in zip(self.categories, values):
+            setattr(self, category.__key__, value)
 
         end = timer()
+        bot.startup.record("compendium", end - start)
+        bot.readiness.mark_ready("compendium")
         log.info(f"COMPENDIUM: Categories reloaded in [ {end - start:.2f} ]s")
         bot.dispatch("compendium_loaded")
 
@@ -13,10 +13,17 @@ DEFAULT_PREFIX = os.environ.get("COMMAND_PREFIX", ">")
 DEBUG_GUILDS = json.loads(os.environ["GUILD"]) if "GUILD" in os.environ else None
 DASHBOARD_REFRESH_INTERVAL = float(os.environ.get("DASHBOARD_REFRESH_INTERVAL", 15))
 ERROR_CHANNEL = os.environ.get("ERROR_CHANNEL")
+SEND_QUEUE_MAX_DEPTH = int(os.environ.get("SEND_QUEUE_MAX_DEPTH", 50))
+CACHE_DIR = os.environ.get("CACHE_DIR", ".cache")
+SLOW_QUERY_THRESHOLD = float(os.environ.get("SLOW_QUERY_THRESHOLD", 0.5))
+COMMAND_TIME_BUDGET = float(os.environ.get("COMMAND_TIME_BUDGET", 3))
+LOOP_BLOCK_THRESHOLD = float(os.environ.get("LOOP_BLOCK_THRESHOLD", 0.25))
+READY_TIMEOUT = float(os.environ.get("READY_TIMEOUT", 60))
 
 # Database Stuff
 DB_URL = os.environ.get("DATABASE_URL", "")
 AUTH_TOKEN = os.environ.get("AUTH_TOKEN", "")
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
 PORT = int(os.getenv("PORT", 8080))
 
 # Misc
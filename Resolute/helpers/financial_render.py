@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from Resolute.constants import CACHE_DIR
+
+log = logging.getLogger(__name__)
+
+FINANCIAL_BACKGROUND_URL = "https://res.cloudinary.com/jerrick/image/upload/d_642250b563292b35f27461a7.png,f_jpg,fl_progressive,q_auto,w_1024/y3mdgvccfyvmemabidd0.jpg"
+FINANCIAL_BASE_FILE = "financial_base.png"
+
+# Progress bar properties
+IMAGE_SIZE = (800, 400)
+BAR_WIDTH = 700
+BAR_HEIGHT = 50
+BAR_X = 50
+BAR_Y = 300
+CORNER_RADIUS = 20
+SHADOW_OFFSET = 10
+
+# PIL and requests are imported where they are used so they stay out of startup.
+# PIL releases the GIL for most of its work, so a single thread keeps renders off the event loop
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="financial-render")
+_base_layer: bytes = None
+_last_render: tuple[int, bytes] = None
+
+
+def build_base_layer(background_bytes: bytes) -> bytes:
+    """
+    Builds the static part of the financial progress image: the resized background, the blurred bar shadow
+    and the empty bar. Only the filled portion of the bar changes between renders.
+    Args:
+        background_bytes (bytes): The raw background image.
+    Returns:
+        bytes: The base layer as a PNG.
+    """
+    from PIL import Image, ImageDraw, ImageFilter
+
+    background = Image.open(BytesIO(background_bytes)).convert("RGBA")
+    background = background.resize(IMAGE_SIZE)
+
+    shadow = Image.new("RGBA", background.size, (0, 0, 0, 0))
+    shadow_draw = ImageDraw.Draw(shadow)
+    shadow_draw.rounded_rectangle(
+        [
+            BAR_X + SHADOW_OFFSET,
+            BAR_Y + SHADOW_OFFSET,
+            BAR_X + BAR_WIDTH + SHADOW_OFFSET,
+            BAR_Y + BAR_HEIGHT + SHADOW_OFFSET,
+        ],
+        fill=(0, 0, 0, 100),
+        radius=CORNER_RADIUS,
+    )
+    shadow = shadow.filter(ImageFilter.GaussianBlur(10))
+
+    background = Image.alpha_composite(background, shadow)
+
+    draw = ImageDraw.Draw(background)
+    draw.rounded_rectangle(
+        [BAR_X, BAR_Y, BAR_X + BAR_WIDTH, BAR_Y + BAR_HEIGHT],
+        fill="gray",
+        outline="white",
+        width=2,
+        radius=CORNER_RADIUS,
+    )
+
+    buffer = BytesIO()
+    background.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def render_progress(base_layer: bytes, fill_width: int) -> bytes:
+    """
+    Draws the filled portion of the progress bar on top of the base layer.
+    Args:
+        base_layer (bytes): The PNG built by `build_base_layer`.
+        fill_width (int): Width of the filled bar in pixels.
+    Returns:
+        bytes: The finished image as a PNG.
+    """
+    from PIL import Image, ImageDraw
+
+    image = Image.open(BytesIO(base_layer))
+    draw = ImageDraw.Draw(image)
+    draw.rounded_rectangle(
+        [BAR_X, BAR_Y, BAR_X + fill_width, BAR_Y + BAR_HEIGHT],
+        fill="green",
+        radius=CORNER_RADIUS,
+    )
+
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _load_base_layer() -> bytes:
+    path = os.path.join(CACHE_DIR, FINANCIAL_BASE_FILE)
+
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    import requests
+
+    res = requests.get(FINANCIAL_BACKGROUND_URL, timeout=30)
+    if res.status_code != 200:
+        raise Exception("Failed to download image")
+
+    base_layer = build_base_layer(res.content)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(base_layer)
+    except OSError as error:
+        log.warning(f"Unable to cache financial background: {error}")
+
+    return base_layer
+
+
+async def get_progress_image(progress: float) -> bytes:
+    """
+    Returns the financial progress image for the given progress.
+    The background is downloaded once and cached on disk along with the shadow and empty bar. Renders run in
+    a worker thread, and are skipped entirely when the filled width of the bar has not changed.
+    Args:
+        progress (float): Progress towards the monthly goal, capped at 1.
+    Returns:
+        bytes: The progress image as a PNG.
+    """
+    global _base_layer, _last_render
+
+    loop = asyncio.get_running_loop()
+    fill_width = int(BAR_WIDTH * min(max(progress, 0), 1))
+
+    if _last_render and _last_render[0] == fill_width:
+        return _last_render[1]
+
+    if _base_layer is None:
+        _base_layer = await loop.run_in_executor(_executor, _load_base_layer)
+
+    image = await loop.run_in_executor(
+        _executor, render_progress, _base_layer, fill_width
+    )
+    _last_render = (fill_width, image)
+
+    return image
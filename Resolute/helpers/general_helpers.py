@@ -7,6 +7,7 @@ import discord
 from sqlalchemy.util import asyncio
 
 from Resolute.constants import BOT_OWNERS
+from Resolute.models.objects.enum import ContextLevel
 from Resolute.models.objects.exceptions import G0T0CommandError
 
 if TYPE_CHECKING:
@@ -14,6 +15,55 @@ if TYPE_CHECKING:
     from Resolute.models.objects.characters import PlayerCharacter
 
 
+def needs_context(level: ContextLevel):
+    """
+    Declares how much of the invoking player's context a command needs. `G0T0Bot.before_invoke_setup` only loads
+    that much into `ctx.player` and `ctx.playerGuild`. Goes below the command decorator, like `commands.check`.
+
+    :param level: ContextLevel the command needs
+    """
+
+    def decorator(func):
+        func.__context_level__ = level
+        return func
+
+    return decorator
+
+
+def get_context_level(command) -> ContextLevel | None:
+    """
+    Returns the ContextLevel a command declared with `needs_context`, or None if it didn't declare one.
+    """
+    return getattr(getattr(command, "callback", None), "__context_level__", None)
+
+
+def initial_response(ephemeral: bool = False, modal: bool = False):
+    """
+    Declares how a command first responds to its interaction. If the readiness gate holds the command long enough
+    to defer it, it defers with the same visibility. Commands that may open a modal are rejected instead, since a
+    deferred interaction can't show one. Goes below the command decorator, like `needs_context`.
+
+    :param ephemeral: Whether the first response is only visible to the invoker
+    :param modal: Whether the command may respond with a modal
+    """
+
+    def decorator(func):
+        func.__initial_response__ = (ephemeral, modal)
+        return func
+
+    return decorator
+
+
+def get_initial_response(command) -> tuple[bool, bool]:
+    """
+    Returns whether a command's first response is ephemeral and whether it may be a modal, as declared with
+    `initial_response`. Commands that didn't declare it respond publicly without a modal.
+    """
+    return getattr(
+        getattr(command, "callback", None), "__initial_response__", (False, False)
+    )
+
+
 def dm_check(ctx: discord.ApplicationContext) -> bool:
     if not ctx.guild:
         raise G0T0CommandError("Command is not available in DM's")
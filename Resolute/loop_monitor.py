@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import traceback
+from collections import deque
+from time import monotonic
+
+from Resolute.constants import LOOP_BLOCK_THRESHOLD
+
+log = logging.getLogger(__name__)
+
+LAG_INTERVAL = 0.5
+LAG_SAMPLES = 240
+REPORT_INTERVAL = 600
+REPORT_LIMIT = 5
+
+_PROJECT_PATH = f"{os.sep}Resolute{os.sep}"
+
+
+class BlockingCall(object):
+    """
+    A location that held the event loop past the block threshold.
+    Attributes:
+        location (str): The innermost project frame (or innermost frame) of the captured stack.
+        stack (str): The formatted stack captured when the block was detected.
+        count (int): Number of blocks attributed to the location.
+        total (float): Seconds the loop was blocked at the location.
+        max (float): Longest single block at the location.
+    """
+
+    def __init__(self, location: str, stack: str):
+        self.location = location
+        self.stack = stack
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class LoopMonitor(object):
+    """
+    Measures event loop lag and catches callbacks that block the loop.
+    An async sampler records how late a periodic sleep wakes up and bumps a heartbeat. A watchdog thread watches
+    the heartbeat, and when it goes stale for longer than the block threshold captures the loop thread's stack,
+    the same information asyncio debug mode gives for slow callbacks but cheap enough to leave on in production.
+    The worst offenders are logged every `REPORT_INTERVAL` seconds.
+    Attributes:
+        interval (float): Seconds between samples.
+        threshold (float): Seconds the loop may be held before the stack is captured. 0 disables the watchdog.
+        lag (float): The most recent lag sample in seconds.
+        max_lag (float): The largest lag seen since startup.
+        blocked (int): Number of blocks detected since startup.
+    Methods:
+        start():
+            Starts sampling on the running loop and starts the watchdog thread.
+        stop():
+            Stops sampling and the watchdog.
+        metrics() -> dict:
+            Returns current, p95 and max lag and the number of blocks.
+        offenders(limit=REPORT_LIMIT) -> list[BlockingCall]:
+            Returns the locations that blocked the loop the longest since the last report.
+        report():
+            Logs the worst offenders and clears them.
+    """
+
+    def __init__(
+        self, interval: float = LAG_INTERVAL, threshold: float = LOOP_BLOCK_THRESHOLD
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.blocked = 0
+        self._samples: deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._task: asyncio.Task = None
+
+        self._heartbeat = monotonic()
+        self._loop_thread: int = None
+        self._watchdog: threading.Thread = None
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._offenders: dict[str, BlockingCall] = {}
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._loop_thread = threading.get_ident()
+            self._heartbeat = monotonic()
+            self._task = asyncio.create_task(self._sample())
+
+        if self.threshold and (self._watchdog is None or not self._watchdog.is_alive()):
+            self._stopped.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch, name="loop-watchdog", daemon=True
+            )
+            self._watchdog.start()
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+        self._stopped.set()
+
+    def metrics(self) -> dict:
+        ordered = sorted(self._samples)
+
+        return {
+            "lag": self.lag,
+            "p95": ordered[int(len(ordered) * 0.95)] if ordered else 0,
+            "max": self.max_lag,
+            "blocked": self.blocked,
+        }
+
+    def offenders(self, limit: int = REPORT_LIMIT) -> list[BlockingCall]:
+        with self._lock:
+            offenders = list(self._offenders.values())
+
+        return sorted(offenders, key=lambda o: o.total, reverse=True)[:limit]
+
+    def report(self) -> None:
+        offenders = self.offenders()
+
+        with self._lock:
+            self._offenders.clear()
+
+        for offender in offenders:
+            log.warning(
+                f"Event loop blocked {offender.count}x at {offender.location} "
+                f"(total {offender.total:.2f}s, max {offender.max:.2f}s)\n{offender.stack}"
+            )
+
+    async def _sample(self) -> None:
+        last_report = monotonic()
+
+        while True:
+            start = monotonic()
+            await asyncio.sleep(self.interval)
+            now = monotonic()
+
+            self._heartbeat = now
+            self.lag = max(now - start - self.interval, 0)
+            self.max_lag = max(self.max_lag, self.lag)
+            self._samples.append(self.lag)
+
+            if now - last_report >= REPORT_INTERVAL:
+                last_report = now
+                self.report()
+
+    def _watch(self) -> None:
+        stalled_heartbeat = None
+        offender: BlockingCall = None
+        blocked_for = 0.0
+
+        while not self._stopped.wait(min(self.interval, self.threshold) / 2):
+            heartbeat = self._heartbeat
+
+            if offender and heartbeat != stalled_heartbeat:
+                with self._lock:
+                    offender.total += blocked_for
+                    offender.max = max(offender.max, blocked_for)
+                offender = None
+
+            blocked_for = monotonic() - heartbeat - self.interval
+
+            if offender or blocked_for < self.threshold:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+
+            stack = traceback.extract_stack(frame)
+            location = next(
+                (f for f in reversed(stack) if _PROJECT_PATH in f.filename), stack[-1]
+            )
+            key = f"{location.filename}:{location.lineno} in {location.name}"
+
+            with self._lock:
+                offender = self._offenders.setdefault(
+                    key, BlockingCall(key, "".join(stack.format()))
+                )
+                offender.count += 1
+
+            self.blocked += 1
+            stalled_heartbeat = heartbeat
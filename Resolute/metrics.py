@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import functools
+import logging
+from timeit import default_timer as timer
+from typing import TYPE_CHECKING
+
+from discord.ext import commands, tasks
+
+from Resolute.models.objects.enum import ContextLevel
+from Resolute.query_stats import LATENCY_BUCKETS
+
+if TYPE_CHECKING:
+    from Resolute.bot import G0T0Bot
+
+log = logging.getLogger(__name__)
+
+COMMAND_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+LOOP_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class Histogram(object):
+    def __init__(self, buckets: tuple[float, ...]):
+        self.bounds = buckets
+        self.buckets = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.buckets[i] += 1
+                break
+
+    def lines(self, name: str, **labels) -> list[str]:
+        return _histogram_lines(
+            name, self.bounds, self.buckets, self.count, self.sum, **labels
+        )
+
+
+def _histogram_lines(
+    name: str,
+    bounds: tuple[float, ...],
+    buckets: list[int],
+    count: int,
+    total: float,
+    **labels,
+) -> list[str]:
+    lines = []
+    cumulative = 0
+
+    for bound, value in zip(bounds, buckets):
+        cumulative += value
+        lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {cumulative}")
+
+    lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {count}")
+    lines.append(f"{name}_sum{_labels(**labels)} {total}")
+    lines.append(f"{name}_count{_labels(**labels)} {count}")
+    return lines
+
+
+class Metrics(object):
+    """
+    In-process counters for the `/metrics` endpoint. Everything is kept in memory so a scrape never touches
+    the database or Discord.
+    Attributes:
+        commands (dict[str, Histogram]): Command durations by command name.
+        loops (dict[str, Histogram]): Task loop iteration durations by loop name.
+        cache_hits (dict[str, int]): Cache hits by cache name.
+        cache_misses (dict[str, int]): Cache misses by cache name.
+        contexts (dict[tuple[str, str], int]): Context loads by command and declared level.
+    Methods:
+        observe_command(command, seconds):
+            Records a command duration.
+        observe_context(command, level):
+            Records the context loaded for a command. Commands without a declared level count as "undeclared".
+        cache_hit(cache) / cache_miss(cache):
+            Records a cache lookup.
+        instrument_loops(cog):
+            Times every iteration of the cog's task loops.
+        render(bot) -> str:
+            Renders all metrics in the Prometheus text format.
+    """
+
+    def __init__(self):
+        self.commands: dict[str, Histogram] = {}
+        self.loops: dict[str, Histogram] = {}
+        self.cache_hits: dict[str, int] = {}
+        self.cache_misses: dict[str, int] = {}
+        self.contexts: dict[tuple[str, str], int] = {}
+
+    def observe_command(self, command: str, seconds: float) -> None:
+        self.commands.setdefault(command, Histogram(COMMAND_BUCKETS)).observe(seconds)
+
+    def observe_context(self, command: str, level: ContextLevel | None) -> None:
+        key = (command, level.name if level else "undeclared")
+        self.contexts[key] = self.contexts.get(key, 0) + 1
+
+    def cache_hit(self, cache: str) -> None:
+        self.cache_hits[cache] = self.cache_hits.get(cache, 0) + 1
+
+    def cache_miss(self, cache: str) -> None:
+        self.cache_misses[cache] = self.cache_misses.get(cache, 0) + 1
+
+    def instrument_loops(self, cog: commands.Cog) -> None:
+        for name, attr in vars(type(cog)).items():
+            if not isinstance(attr, tasks.Loop):
+                continue
+
+            loop: tasks.Loop = getattr(cog, name)
+            if getattr(loop.coro, "__timed__", False):
+                continue
+
+            histogram = self.loops.setdefault(
+                f"{cog.qualified_name}.{name}", Histogram(LOOP_BUCKETS)
+            )
+            loop.coro = self._timed(loop.coro, histogram)
+
+    @staticmethod
+    def _timed(coro, histogram: Histogram):
+        @functools.wraps(coro)
+        async def wrapper(*args, **kwargs):
+            start = timer()
+            try:
+                return await coro(*args, **kwargs)
+            finally:
+                histogram.observe(timer() - start)
+
+        wrapper.__timed__ = True
+        return wrapper
+
+    def render(self, bot: G0T0Bot) -> str:
+        lines = [
+            "# TYPE resolute_command_duration_seconds histogram",
+        ]
+        for command, histogram in self.commands.items():
+            lines += histogram.lines(
+                "resolute_command_duration_seconds", command=command
+            )
+
+        lines.append("# TYPE resolute_task_loop_duration_seconds histogram")
+        for loop, histogram in self.loops.items():
+            lines += histogram.lines("resolute_task_loop_duration_seconds", loop=loop)
+
+        lines.append("# TYPE resolute_command_context_total counter")
+        for (command, level), count in self.contexts.items():
+            lines.append(
+                f"resolute_command_context_total{_labels(command=command, level=level)} {count}"
+            )
+
+        lines.append("# TYPE resolute_cache_requests_total counter")
+        for cache in sorted({*self.cache_hits, *self.cache_misses}):
+            lines.append(
+                f"resolute_cache_requests_total{_labels(cache=cache, result='hit')} {self.cache_hits.get(cache, 0)}"
+            )
+            lines.append(
+                f"resolute_cache_requests_total{_labels(cache=cache, result='miss')} {self.cache_misses.get(cache, 0)}"
+            )
+
+        if getattr(bot, "db", None):
+            lines += [
+                "# TYPE resolute_db_pool_size gauge",
+                f"resolute_db_pool_size {bot.db.size}",
+                "# TYPE resolute_db_pool_free gauge",
+                f"resolute_db_pool_free {bot.db.freesize}",
+                "# TYPE resolute_db_pool_max gauge",
+                f"resolute_db_pool_max {bot.db.maxsize}",
+            ]
+
+        query_metrics = bot.query_stats.metrics()
+        lines += [
+            "# TYPE resolute_slow_queries_total counter",
+            f"resolute_slow_queries_total {query_metrics['slow']}",
+            "# TYPE resolute_query_duration_seconds histogram",
+        ]
+        pool_wait = []
+        rows = []
+        for shape, stats in query_metrics["statements"].items():
+            lines += _histogram_lines(
+                "resolute_query_duration_seconds",
+                LATENCY_BUCKETS,
+                list(stats["buckets"].values())[:-1],
+                stats["count"],
+                stats["total"],
+                statement=shape,
+            )
+            pool_wait.append(
+                f"resolute_query_pool_wait_seconds_total{_labels(statement=shape)} {stats['pool_wait']}"
+            )
+            rows.append(
+                f"resolute_query_rows_total{_labels(statement=shape)} {stats['rows']}"
+            )
+        lines += ["# TYPE resolute_query_pool_wait_seconds_total counter", *pool_wait]
+        lines += ["# TYPE resolute_query_rows_total counter", *rows]
+
+        queue_metrics = bot.send_queue.metrics()
+        lines += [
+            "# TYPE resolute_send_queue_depth gauge",
+            f"resolute_send_queue_depth {queue_metrics['depth']}",
+            "# TYPE resolute_send_queue_dropped_total counter",
+            f"resolute_send_queue_dropped_total {queue_metrics['dropped']}",
+            "# TYPE resolute_send_queue_rate_limited_total counter",
+            f"resolute_send_queue_rate_limited_total {queue_metrics['rate_limited']}",
+        ]
+
+        lag = bot.loop_monitor.metrics()
+        lines += [
+            "# TYPE resolute_event_loop_lag_seconds gauge",
+            f"resolute_event_loop_lag_seconds {lag['lag']}",
+            "# TYPE resolute_event_loop_lag_p95_seconds gauge",
+            f"resolute_event_loop_lag_p95_seconds {lag['p95']}",
+            "# TYPE resolute_event_loop_lag_max_seconds gauge",
+            f"resolute_event_loop_lag_max_seconds {lag['max']}",
+            "# TYPE resolute_event_loop_blocked_total counter",
+            f"resolute_event_loop_blocked_total {lag['blocked']}",
+        ]
+
+        readiness = bot.readiness.metrics()
+        lines += [
+            "# TYPE resolute_ready gauge",
+            f"resolute_ready {int(readiness['ready'])}",
+            "# TYPE resolute_readiness_queue_depth gauge",
+            f"resolute_readiness_queue_depth {readiness['depth']}",
+            "# TYPE resolute_readiness_oldest_wait_seconds gauge",
+            f"resolute_readiness_oldest_wait_seconds {readiness['oldest']}",
+            "# TYPE resolute_readiness_waits_total counter",
+            f"resolute_readiness_waits_total {readiness['waited']}",
+            "# TYPE resolute_readiness_wait_seconds_total counter",
+            f"resolute_readiness_wait_seconds_total {readiness['wait_total']}",
+            "# TYPE resolute_readiness_wait_max_seconds gauge",
+            f"resolute_readiness_wait_max_seconds {readiness['wait_max']}",
+            "# TYPE resolute_readiness_timeouts_total counter",
+            f"resolute_readiness_timeouts_total {readiness['timeouts']}",
+            "# TYPE resolute_readiness_rejected_total counter",
+            f"resolute_readiness_rejected_total {readiness['rejected']}",
+        ]
+
+        lines.append("# TYPE resolute_startup_phase_seconds gauge")
+        for phase, (_, seconds) in bot.startup.phases.items():
+            lines.append(
+                f"resolute_startup_phase_seconds{_labels(phase=phase)} {seconds}"
+            )
+
+        return "\n".join(lines) + "\n"
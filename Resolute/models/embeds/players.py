@@ -92,8 +92,9 @@ class ArenaPostEmbed(PlayerEmbed):
             if self.post.message:
                 await webhook.edit_message(self.post.message.id, embed=self)
                 await self.post.message.clear_reactions()
+                message_id = self.post.message.id
             else:
-                await webhook.send(
+                message = await webhook.send(
                     username=self.post.player.member.display_name,
                     avatar_url=(
                         self.post.player.member.display_avatar.url
@@ -101,7 +102,16 @@ class ArenaPostEmbed(PlayerEmbed):
                         else None
                     ),
                     embed=self,
+                    wait=True,
                 )
+                message_id = message.id
+
+            await ArenaPost.register(
+                self.post.player._bot,
+                self.post.player.guild_id,
+                self.post.player.id,
+                message_id,
+            )
             return True
         return False
 
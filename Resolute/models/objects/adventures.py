@@ -11,6 +11,7 @@ from sqlalchemy.dialects.postgresql import ARRAY
 from Resolute.models import metadata
 from Resolute.models.categories.categories import Faction
 from Resolute.models.objects import RelatedList
+from Resolute.models.objects.enum import QueryResultType
 from Resolute.models.objects.exceptions import AdventureNotFound
 from Resolute.models.objects.npc import NonPlayableCharacter
 from Resolute.models.objects.characters import PlayerCharacter
@@ -45,6 +46,7 @@ class Adventure(object):
         upsert(): Asynchronously upserts an adventure record in the database.
         update_dm_permissions(member, remove=False): Updates the Dungeon Master's permissions for the adventure.
         get_npc(**kwargs): Retrieves an NPC based on the provided criteria.
+        load_related(bot, adventures): Loads characters and NPCs for many adventures at once.
     """
 
     adventures_table = sa.Table(
@@ -87,9 +89,10 @@ class Adventure(object):
         )
         factions = fields.Method(None, "load_factions")
 
-        def __init__(self, bot: G0T0Bot, **kwargs):
+        def __init__(self, bot: G0T0Bot, load_related: bool = True, **kwargs):
             super().__init__(**kwargs)
             self.bot = bot
+            self.load_related = load_related
 
         @post_load
         async def make_adventure(self, data, **kwargs) -> "Adventure":
@@ -100,8 +103,8 @@ class Adventure(object):
                 role=guild.get_role(data["role_id"]),
                 category_channel=self.bot.get_channel(data["category_channel_id"]),
             )
-            await self.get_characters(adventure)
-            await self.get_npcs(adventure)
+            if self.load_related:
+                await Adventure.load_related(self.bot, [adventure])
             return adventure
 
         def load_timestamp(
@@ -123,25 +126,6 @@ class Adventure(object):
                 factions.append(self.bot.compendium.get_object(Faction, f))
             return factions
 
-        async def get_characters(self, adventure: "Adventure") -> None:
-            if adventure.characters:
-                for char_id in adventure.characters:
-                    if char := await PlayerCharacter.get_character(self.bot, char_id):
-                        adventure._player_characters.append(char)
-
-        async def get_npcs(self, adventure: "Adventure") -> None:
-            query = NonPlayableCharacter.npc_table.select().where(
-                sa.and_(NonPlayableCharacter.npc_table.c.adventure_id == adventure.id)
-            )
-
-            async with self.bot.db.acquire() as conn:
-                results = await conn.execute(query)
-                rows = await results.fetchall()
-
-            adventure.npcs = [
-                NonPlayableCharacter.NPCSchema(self.bot.db).load(row) for row in rows
-            ]
-
     def __init__(
         self,
         db: aiopg.sa.Engine,
@@ -303,6 +287,47 @@ class Adventure(object):
 
         return None
 
+    @staticmethod
+    async def load_related(bot: G0T0Bot, adventures: list["Adventure"]) -> None:
+        """
+        Loads the characters and NPCs for the given adventures. The number of queries does not depend on how
+        many adventures or characters there are.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            adventures (list[Adventure]): Adventures loaded without their related objects.
+        """
+        if not adventures:
+            return
+
+        character_ids = {c for adventure in adventures for c in adventure.characters}
+        characters = (
+            {
+                c.id: c
+                for c in await PlayerCharacter.get_characters(
+                    bot, None, character_ids=list(character_ids), inactive=True
+                )
+            }
+            if character_ids
+            else {}
+        )
+
+        npc_query = NonPlayableCharacter.npc_table.select().where(
+            NonPlayableCharacter.npc_table.c.adventure_id.in_(
+                [adventure.id for adventure in adventures]
+            )
+        )
+        npcs: dict[int, list[NonPlayableCharacter]] = {}
+
+        for row in await bot.query(npc_query, QueryResultType.multiple):
+            npc = NonPlayableCharacter.NPCSchema(bot.db).load(row)
+            npcs.setdefault(npc.adventure_id, []).append(npc)
+
+        for adventure in adventures:
+            adventure._player_characters.extend(
+                characters[c] for c in adventure.characters if c in characters
+            )
+            adventure.npcs = npcs.get(adventure.id, [])
+
     @staticmethod
     async def fetch_from_ctx(ctx: G0T0Context, **kwargs) -> "Adventure":
         adventure_id = kwargs.get("adventure_id")
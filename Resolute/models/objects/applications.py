@@ -1,14 +1,23 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+import json
 import re
+from datetime import datetime, timezone
 
 import discord
 import sqlalchemy as sa
 from marshmallow import Schema, fields
+from sqlalchemy.dialects.postgresql import JSONB, insert
+
+from Resolute.constants import APPROVAL_EMOJI, DENIED_EMOJI
 from Resolute.models import metadata
-from Resolute.models.objects.enum import ApplicationType, QueryResultType
-from Resolute.models.objects.exceptions import G0T0Error
+from Resolute.models.objects.enum import (
+    ApplicationType,
+    QueryResultType,
+    RequestStatus,
+)
+from Resolute.models.objects.exceptions import ApplicationNotFound, G0T0Error
 from Resolute.models.objects.characters import PlayerCharacter
 
 if TYPE_CHECKING:
@@ -317,8 +326,12 @@ class NewCharacterApplication(object):
         Checks if the application can be submitted.
     format_app(owner: Member, staff: Role = None):
         Formats the application for display.
+    to_dict():
+        Returns the application as a JSON serializable dictionary.
+    async from_dict(bot, data: dict, message: Message = None):
+        Builds the application from a stored dictionary.
     async load(bot, content: str = None, message: Message = None):
-        Loads the application from the given content or message.
+        Parses the application from formatted content. Only used for applications saved before they were stored as data.
     """
 
     def __init__(self, **kwargs):
@@ -421,6 +434,52 @@ class NewCharacterApplication(object):
             f"**Link:** {self.link}"
         )
 
+    def to_dict(self) -> dict:
+        return {
+            "type": self.type.value,
+            "character_id": self.character.id if self.character else None,
+            "name": self.name,
+            "base_scores": vars(self.base_scores),
+            "species": vars(self.species),
+            "char_class": vars(self.char_class),
+            "background": vars(self.background),
+            "credits": self.credits,
+            "homeworld": self.homeworld,
+            "join_motivation": self.join_motivation,
+            "good_motivation": self.good_motivation,
+            "link": self.link,
+            "hp": self.hp,
+            "level": self.level,
+        }
+
+    @staticmethod
+    async def from_dict(
+        bot, data: dict, message: discord.Message = None
+    ) -> "NewCharacterApplication":
+        application = NewCharacterApplication(
+            message=message,
+            type=ApplicationType(data["type"]),
+            name=data.get("name", ""),
+            base_scores=AppBaseScores(**data.get("base_scores", {})),
+            species=AppSpecies(**data.get("species", {})),
+            char_class=AppClass(**data.get("char_class", {})),
+            background=AppBackground(**data.get("background", {})),
+            credits=data.get("credits", "0"),
+            homeworld=data.get("homeworld", ""),
+            join_motivation=data.get("join_motivation", ""),
+            good_motivation=data.get("good_motivation", ""),
+            link=data.get("link", ""),
+            hp=data.get("hp", ""),
+            level=data.get("level", "1"),
+        )
+
+        if data.get("character_id"):
+            application.character = await PlayerCharacter.get_character(
+                bot, data["character_id"]
+            )
+
+        return application
+
     async def load(
         self, bot, content: str = None, message: discord.Message = None
     ) -> "NewCharacterApplication":
@@ -594,8 +653,12 @@ class LevelUpApplication(object):
     -------
     format_app(owner: Member, staff: Role = None):
         Formats the application details into a string for display.
+    to_dict():
+        Returns the application as a JSON serializable dictionary.
+    async from_dict(bot, data: dict, message: Message = None):
+        Builds the application from a stored dictionary.
     async load(bot, content: str = None, message: Message = None):
-        Loads the application details from a message or content string.
+        Parses the application from formatted content. Only used for applications saved before they were stored as data.
     """
 
     def __init__(self, **kwargs):
@@ -642,6 +705,37 @@ class LevelUpApplication(object):
             f"**Link:** {self.link}\n\n"
         )
 
+    def to_dict(self) -> dict:
+        return {
+            "type": self.type.value,
+            "character_id": self.character.id if self.character else None,
+            "level": self.level,
+            "hp": self.hp,
+            "feats": self.feats,
+            "changes": self.changes,
+            "link": self.link,
+        }
+
+    @staticmethod
+    async def from_dict(
+        bot, data: dict, message: discord.Message = None
+    ) -> "LevelUpApplication":
+        application = LevelUpApplication(
+            message=message,
+            level=data.get("level"),
+            hp=data.get("hp"),
+            feats=data.get("feats"),
+            changes=data.get("changes"),
+            link=data.get("link"),
+        )
+
+        if data.get("character_id"):
+            application.character = await PlayerCharacter.get_character(
+                bot, data["character_id"]
+            )
+
+        return application
+
     async def load(
         self, bot, content: str = None, message: discord.Message = None
     ) -> "LevelUpApplication":
@@ -694,16 +788,22 @@ class PlayerApplication(object):
         The owner of the application.
     application : NewCharacterApplication | LevelUpApplication
         The application instance.
+    status : RequestStatus
+        The review status of a submitted application.
     Methods:
     --------
     __init__(bot, owner, **kwargs):
         Initializes the PlayerApplication with the given bot and owner.
-    async upsert():
-        Inserts or updates the player's application in the database.
+    async insert():
+        Saves the player's in-progress application to the database.
     async delete():
-        Deletes the player's application from the database.
-    async load(message: Message = None):
-        Loads the player's application from the database or a given message.
+        Deletes the player's in-progress application from the database.
+    async load(message_id: int = None, channel: TextChannel = None):
+        Loads the player's in-progress application, or a submitted application by its message id.
+    async store(bot, guild_id, owner_id, application, message_id):
+        Saves a submitted application keyed by its owner and message.
+    async set_status(bot, message_id, status):
+        Updates the review status of a submitted application.
     """
 
     cached: bool = False
@@ -715,6 +815,20 @@ class PlayerApplication(object):
         sa.Column("application", sa.String, nullable=False),
     )
 
+    applications_table = sa.Table(
+        "character_applications",
+        metadata,
+        sa.Column("message_id", sa.BigInteger, primary_key=True),
+        sa.Column("guild_id", sa.BigInteger, nullable=False),
+        sa.Column("owner_id", sa.BigInteger, nullable=False),
+        sa.Column("type", sa.String, nullable=False),
+        sa.Column("status", sa.String, nullable=False),
+        sa.Column("data", JSONB, nullable=False),
+        sa.Column("created_ts", sa.TIMESTAMP(timezone=timezone.utc)),
+        sa.Column("updated_ts", sa.TIMESTAMP(timezone=timezone.utc)),
+        sa.Index("idx_character_applications_owner", "owner_id", "message_id"),
+    )
+
     class ApplicationSchema(Schema):
         id = fields.Integer(required=True)
         application = fields.String(required=True)
@@ -724,6 +838,7 @@ class PlayerApplication(object):
         self.owner = owner
         type: ApplicationType = kwargs.get("type", ApplicationType.new)
         self.edit: bool = kwargs.get("edit", False)
+        self.status: RequestStatus = kwargs.get("status", RequestStatus.pending)
 
         if type in [
             ApplicationType.new,
@@ -736,15 +851,13 @@ class PlayerApplication(object):
 
     async def insert(self) -> None:
         """
-        Asynchronously inserts or updates the player's application in the database.
-        If the application exists, it formats the application data for the owner and
-        inserts or updates it in the database using an asynchronous connection.
+        Asynchronously saves the player's in-progress application in the database.
         Returns:
             None
         """
         if self.application:
             query = PlayerApplication.ref_applications_table.insert().values(
-                id=self.owner.id, application=self.application.format_app(self.owner)
+                id=self.owner.id, application=json.dumps(self.application.to_dict())
             )
             await self._bot.query(query, QueryResultType.none)
 
@@ -762,19 +875,23 @@ class PlayerApplication(object):
 
         await self._bot.query(query, QueryResultType.none)
 
-    async def load(self, message: discord.Message = None) -> "PlayerApplication":
+    async def load(
+        self, message_id: int = None, channel: discord.TextChannel = None
+    ) -> "PlayerApplication":
         """
         Asynchronously loads the application data for the player.
-        If a message is provided, it uses the content of the message to load the application.
-        If no message is provided, it fetches the application data from the database.
+        If a message id is given, the submitted application is read from the application store by owner and
+        message id. Otherwise the player's in-progress application is loaded.
         Args:
-            message (Message, optional): The message containing the application data. Defaults to None.
+            message_id (int, optional): The ID of the submitted application's message. Defaults to None.
+            channel (TextChannel, optional): The application channel the message was posted in. Defaults to None.
         Returns:
             PlayerApplication: The loaded player application.
         Raises:
+            ApplicationNotFound: If no application exists for the message.
             G0T0Error: If the application type is unknown or if the application does not belong to the player.
         """
-        if not message:
+        if not message_id:
             query = PlayerApplication.ref_applications_table.select().where(
                 PlayerApplication.ref_applications_table.c.id == self.owner.id
             )
@@ -786,10 +903,127 @@ class PlayerApplication(object):
 
             application = PlayerApplication.ApplicationSchema().load(row)
             self.cached = True
-            content = application["application"]
-        else:
-            content = message.content
 
+            try:
+                data = json.loads(application["application"])
+            except json.JSONDecodeError:
+                return await self._load_legacy(application["application"])
+
+            self.application = await self._from_dict(data)
+            return self
+
+        query = PlayerApplication.applications_table.select().where(
+            PlayerApplication.applications_table.c.message_id == message_id
+        )
+
+        row = await self._bot.query(query)
+
+        if row is None:
+            return await self._load_legacy_message(message_id, channel)
+        elif row["owner_id"] != self.owner.id:
+            raise G0T0Error("Not your application")
+
+        self.status = RequestStatus(row["status"])
+        self.application = await self._from_dict(
+            row["data"],
+            channel.get_partial_message(message_id) if channel else None,
+        )
+
+        return self
+
+    @staticmethod
+    async def store(
+        bot: G0T0Bot,
+        guild_id: int,
+        owner_id: int,
+        application: NewCharacterApplication | LevelUpApplication,
+        message_id: int,
+    ) -> None:
+        """
+        Saves a submitted application keyed by its owner and message. Resubmitting an application puts it
+        back to pending.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            guild_id (int): The ID of the guild the application was submitted in.
+            owner_id (int): The ID of the application's owner.
+            application (NewCharacterApplication | LevelUpApplication): The application.
+            message_id (int): The ID of the application message.
+        """
+        now = datetime.now(timezone.utc)
+        update_dict = {
+            "type": application.type.value,
+            "status": RequestStatus.pending.value,
+            "data": application.to_dict(),
+            "updated_ts": now,
+        }
+
+        query = (
+            insert(PlayerApplication.applications_table)
+            .values(
+                message_id=message_id,
+                guild_id=guild_id,
+                owner_id=owner_id,
+                created_ts=now,
+                **update_dict,
+            )
+            .on_conflict_do_update(index_elements=["message_id"], set_=update_dict)
+        )
+
+        await bot.query(query, QueryResultType.none)
+
+    @staticmethod
+    async def set_status(bot: G0T0Bot, message_id: int, status: RequestStatus) -> None:
+        query = (
+            PlayerApplication.applications_table.update()
+            .where(PlayerApplication.applications_table.c.message_id == message_id)
+            .values(status=status.value, updated_ts=datetime.now(timezone.utc))
+        )
+
+        await bot.query(query, QueryResultType.none)
+
+    async def _from_dict(
+        self, data: dict, message: discord.Message = None
+    ) -> NewCharacterApplication | LevelUpApplication:
+        if ApplicationType(data["type"]) == ApplicationType.level:
+            return await LevelUpApplication.from_dict(self._bot, data, message)
+
+        return await NewCharacterApplication.from_dict(self._bot, data, message)
+
+    async def _load_legacy_message(
+        self, message_id: int, channel: discord.TextChannel
+    ) -> "PlayerApplication":
+        # Applications submitted before they were stored are read from their message once and saved
+        if not channel:
+            raise ApplicationNotFound()
+
+        try:
+            message = await channel.fetch_message(message_id)
+        except discord.NotFound:
+            raise ApplicationNotFound()
+
+        emoji = [
+            x.emoji.name if hasattr(x.emoji, "name") else x.emoji
+            for x in message.reactions
+        ]
+
+        if any(e in APPROVAL_EMOJI for e in emoji):
+            self.status = RequestStatus.approved
+        elif any(e in DENIED_EMOJI for e in emoji):
+            self.status = RequestStatus.denied
+
+        await self._load_legacy(message.content, message)
+        await PlayerApplication.store(
+            self._bot, message.guild.id, self.owner.id, self.application, message.id
+        )
+
+        if self.status != RequestStatus.pending:
+            await PlayerApplication.set_status(self._bot, message.id, self.status)
+
+        return self
+
+    async def _load_legacy(
+        self, content: str, message: discord.Message = None
+    ) -> "PlayerApplication":
         player_match = re.search(r"^\*\*Player:\*\* (.+)", content, re.MULTILINE)
         type_match = re.search(r"^\*\*(.*?)\*\*\s\|", content, re.MULTILINE)
         type_string = (
@@ -814,3 +1048,5 @@ class PlayerApplication(object):
                 raise G0T0Error("Unsure what tye of application this is")
         else:
             raise G0T0Error("Not your application")
+
+        return self
@@ -44,8 +44,10 @@ class Arena(object):
         channel (TextChannel): The text channel associated with the arena.
     Methods:
         update_tier(): Updates the tier of the arena based on the average level of player characters.
+        upsert_query(): Builds the insert or update query for the arena.
         upsert(): Inserts or updates the arena in the database.
         close(): Closes the arena, updates the end timestamp, and deletes the pinned message in the channel.
+        load_related(bot, arenas): Loads the characters for many arenas at once.
     """
 
     arenas_table = sa.Table(
@@ -92,15 +94,17 @@ class Arena(object):
             fields.Integer, required=False, allow_none=True, default=[]
         )
 
-        def __init__(self, bot: G0T0Bot, **kwargs):
+        def __init__(self, bot: G0T0Bot, load_related: bool = True, **kwargs):
             super().__init__(**kwargs)
             self.bot = bot
+            self.load_related = load_related
 
         @post_load
         async def make_arena(self, data, **kwargs) -> "Arena":
             arena = Arena(self.bot.db, self.bot.compendium, **data)
             arena.channel = self.bot.get_channel(arena.channel_id)
-            await self.get_characters(arena)
+            if self.load_related:
+                await Arena.load_related(self.bot, [arena])
             return arena
 
         def load_tier(self, value) -> ArenaTier:
@@ -124,12 +128,6 @@ class Arena(object):
                 tzinfo=timezone.utc,
             )
 
-        async def get_characters(self, arena: "Arena") -> None:
-            for char in arena.characters:
-                arena.player_characters.append(
-                    await PlayerCharacter.get_character(self.bot, char)
-                )
-
     def __init__(
         self,
         db: aiopg.sa.Engine,
@@ -199,15 +197,11 @@ class Arena(object):
                 tier = bisect.bisect(levels, avg_level)
                 self.tier = self._compendium.get_object(ArenaTier, tier)
 
-    async def upsert(self) -> None:
+    def upsert_query(self):
         """
-        Asynchronously upserts the current arena object into the database.
-        This method acquires a connection from the database pool and executes
-        an upsert operation using the `upsert_arena_query` function, which
-        ensures that the current arena object is either inserted or updated
-        in the database.
-        Raises:
-            Exception: If the database operation fails.
+        Builds the insert or update query for the current arena object.
+        Returns:
+            Insert | Update: The query to write the arena.
         """
         update_dict = {
             "pin_message_id": self.pin_message_id,
@@ -243,8 +237,19 @@ class Arena(object):
                 .returning(Arena.arenas_table)
             )
 
+        return query
+
+    async def upsert(self) -> None:
+        """
+        Asynchronously upserts the current arena object into the database.
+        This method acquires a connection from the database pool and executes
+        the query from `upsert_query`, which ensures that the current arena
+        object is either inserted or updated in the database.
+        Raises:
+            Exception: If the database operation fails.
+        """
         async with self._db.acquire() as conn:
-            await conn.execute(query)
+            await conn.execute(self.upsert_query())
 
     async def close(self) -> None:
         """
@@ -265,6 +270,31 @@ class Arena(object):
         if message := await self.channel.fetch_message(self.pin_message_id):
             await message.delete(reason="Closing Arena")
 
+    @staticmethod
+    async def load_related(bot: G0T0Bot, arenas: list["Arena"]) -> None:
+        """
+        Loads the characters for the given arenas with a fixed number of queries.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            arenas (list[Arena]): Arenas loaded without their characters.
+        """
+        character_ids = {c for arena in arenas for c in arena.characters or []}
+
+        if not character_ids:
+            return
+
+        characters = {
+            c.id: c
+            for c in await PlayerCharacter.get_characters(
+                bot, None, character_ids=list(character_ids), inactive=True
+            )
+        }
+
+        for arena in arenas:
+            for char in list(arena.characters or []):
+                if char in characters:
+                    arena.player_characters.append(characters[char])
+
     @staticmethod
     async def get_arena(bot: G0T0Bot, channel_id: int) -> "Arena":
         query = Arena.arenas_table.select().where(
@@ -8,6 +8,7 @@ from marshmallow import Schema, fields, post_load
 from sqlalchemy.dialects.postgresql import ARRAY
 
 from Resolute.models import metadata
+from Resolute.models.objects.enum import QueryResultType
 from Resolute.models.categories import (
     CharacterArchetype,
     CharacterClass,
@@ -352,16 +353,24 @@ class PlayerCharacter(object):
         nickname = fields.String(required=False, allow_none=True)
         dob = fields.Integer(required=False, allow_none=True)
 
-        def __init__(self, db: aiopg.sa.Engine, compendium: Compendium, **kwargs):
+        def __init__(
+            self,
+            db: aiopg.sa.Engine,
+            compendium: Compendium,
+            load_related: bool = True,
+            **kwargs,
+        ):
             super().__init__(**kwargs)
             self.db = db
             self.compendium = compendium
+            self.load_related = load_related
 
         @post_load
         async def make_character(self, data, **kwargs) -> "PlayerCharacter":
             character = PlayerCharacter(self.db, self.compendium, **data)
-            await self.get_classes(character)
-            await self.get_renown(character)
+            if self.load_related:
+                await self.get_classes(character)
+                await self.get_renown(character)
             return character
 
         def load_species(self, value) -> CharacterSpecies:
@@ -598,130 +607,86 @@ class PlayerCharacter(object):
 
         return character
 
-    async def get_stats(self, bot: G0T0Bot) -> dict:
-        from Resolute.models.objects.logs import DBLog
-
-        new_character_activity = bot.compendium.get_activity("NEW_CHARACTER")
-        conversion_activity = bot.compendium.get_activity("CONVERSION")
-
-        query = (
-            sa.select(
-                DBLog.log_table.c.character_id,
-                sa.func.count(DBLog.log_table.c.id).label("#"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    DBLog.log_table.c.cc > 0,
-                                    DBLog.log_table.c.activity
-                                    != new_character_activity.id,
-                                ),
-                                DBLog.log_table.c.cc,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("cc debt"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    DBLog.log_table.c.cc > 0,
-                                    DBLog.log_table.c.activity
-                                    != new_character_activity.id,
-                                ),
-                                DBLog.log_table.c.cc,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("cc credit"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    DBLog.log_table.c.cc > 0,
-                                    DBLog.log_table.c.activity
-                                    == new_character_activity.id,
-                                ),
-                                DBLog.log_table.c.cc,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("cc starting"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    DBLog.log_table.c.credits > 0,
-                                    DBLog.log_table.c.activity
-                                    != new_character_activity.id,
-                                ),
-                                DBLog.log_table.c.credits,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("credit debt"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    DBLog.log_table.c.cc < 0,
-                                    DBLog.log_table.c.activity
-                                    != new_character_activity.id,
-                                ),
-                                DBLog.log_table.c.credits,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("credit credit"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    DBLog.log_table.c.credits > 0,
-                                    DBLog.log_table.c.activity
-                                    == new_character_activity.id,
-                                ),
-                                DBLog.log_table.c.credits,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("credit starting"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                DBLog.log_table.c.activity == conversion_activity.id,
-                                DBLog.log_table.c.credits,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("credits converted"),
-            )
-            .group_by(DBLog.log_table.c.character_id)
+    @staticmethod
+    async def get_characters(
+        bot: G0T0Bot,
+        guild_id: int | None,
+        player_ids: list[int] = None,
+        character_ids: list[int] = None,
+        inactive: bool = False,
+    ) -> list["PlayerCharacter"]:
+        """
+        Loads many characters at once. Characters, classes and renown are each fetched with a single query
+        regardless of how many characters are loaded.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            guild_id (int): The ID of the guild, or None to load from any guild.
+            player_ids (list[int], optional): Only load characters belonging to these players.
+            character_ids (list[int], optional): Only load these characters.
+            inactive (bool, optional): Include inactive characters. Defaults to False.
+        Returns:
+            list[PlayerCharacter]: The loaded characters, with classes and renown.
+        """
+        table = PlayerCharacter.characters_table
+        clauses = []
+
+        if guild_id is not None:
+            clauses.append(table.c.guild_id == guild_id)
+        if player_ids is not None:
+            clauses.append(table.c.player_id.in_(player_ids))
+        if character_ids is not None:
+            clauses.append(table.c.id.in_(character_ids))
+        if not inactive:
+            clauses.append(table.c.active == True)
+
+        rows = await bot.query(
+            table.select().where(sa.and_(*clauses)).order_by(table.c.id.asc()),
+            QueryResultType.multiple,
+        )
+
+        characters: list[PlayerCharacter] = [
+            await PlayerCharacter.CharacterSchema(
+                bot.db, bot.compendium, load_related=False
+            ).load(row)
+            for row in rows
+        ]
+
+        if not characters:
+            return characters
+
+        characters_by_id = {c.id: c for c in characters}
+
+        class_query = (
+            PlayerCharacterClass.character_class_table.select()
             .where(
                 sa.and_(
-                    DBLog.log_table.c.character_id == self.id,
-                    DBLog.log_table.c.invalid == False,
+                    PlayerCharacterClass.character_class_table.c.character_id.in_(
+                        list(characters_by_id.keys())
+                    ),
+                    PlayerCharacterClass.character_class_table.c.active == True,
                 )
             )
+            .order_by(PlayerCharacterClass.character_class_table.c.id.asc())
         )
 
-        row = await bot.query(query)
+        for row in await bot.query(class_query, QueryResultType.multiple):
+            char_class = PlayerCharacterClass.PlayerCharacterClassSchema(
+                bot.db, bot.compendium
+            ).load(row)
+            characters_by_id[char_class.character_id].classes.append(char_class)
 
-        if row is None:
-            return None
+        renown_query = (
+            CharacterRenown.renown_table.select()
+            .where(
+                CharacterRenown.renown_table.c.character_id.in_(
+                    list(characters_by_id.keys())
+                )
+            )
+            .order_by(CharacterRenown.renown_table.c.id.asc())
+        )
+
+        for row in await bot.query(renown_query, QueryResultType.multiple):
+            renown = CharacterRenown.RenownSchema(bot.db, bot.compendium).load(row)
+            characters_by_id[renown.character_id].renown.append(renown)
 
-        return dict(row)
+        return characters
@@ -1,12 +1,12 @@
 from __future__ import annotations
+import asyncio
 import calendar
+import hashlib
+import logging
 import datetime
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
-import requests
-from PIL import Image, ImageDraw, ImageFilter
-from texttable import Texttable
 from io import BytesIO
 
 import aiopg.sa
@@ -17,17 +17,27 @@ from sqlalchemy.dialects.postgresql import ARRAY, insert
 
 from Resolute.constants import CHANNEL_BREAK, ZWSP3
 from Resolute.models import metadata
-from Resolute.models.categories.categories import DashboardType
+from Resolute.models.categories.categories import CharacterClass, DashboardType
 from Resolute.models.objects import RelatedList
 from Resolute.helpers import get_last_message_in_channel
-from Resolute.models.objects.enum import QueryResultType
+from Resolute.helpers.financial_render import get_progress_image
+from Resolute.models.objects.enum import QueryResultType, SendPriority
 from Resolute.models.objects.exceptions import G0T0Error
+from Resolute.models.objects.characters import (
+    PlayerCharacter,
+    PlayerCharacterClass,
+)
 from Resolute.models.objects.financial import Financial
 from Resolute.models.objects.guilds import PlayerGuild
 
 if TYPE_CHECKING:
     from Resolute.bot import G0T0Bot
 
+log = logging.getLogger(__name__)
+
+# Seconds to wait for further updates before re-rendering financial dashboards
+FINANCIAL_REFRESH_DELAY = 5
+
 
 class RPDashboardCategory(object):
     """
@@ -112,8 +122,19 @@ class RefDashboard(object):
         Asynchronously inserts or updates the dashboard in the database.
     delete():
         Asynchronously deletes the dashboard from the database.
+    edit_table(bot, message, table) -> Message:
+        Edits a table dashboard post if the table has changed since the last edit.
+    refresh(bot, message=None, **kwargs):
+        Asynchronously re-renders the dashboard post.
+    render_financial(bot) -> dict:
+        Renders the financial progress post shared by FINANCIAL dashboards.
+    queue_financial_refresh(bot):
+        Schedules a coalesced refresh of every FINANCIAL dashboard.
     """
 
+    _financial_refresh: asyncio.Task = None
+    _financial_pending: bool = False
+
     ref_dashboard_table = sa.Table(
         "ref_dashboards",
         metadata,
@@ -128,6 +149,14 @@ class RefDashboard(object):
         ),  # ref: > c_dashboard_type.id
     )
 
+    ref_dashboard_content_table = sa.Table(
+        "ref_dashboard_content",
+        metadata,
+        sa.Column("post_id", sa.BigInteger, primary_key=True, nullable=False),
+        sa.Column("content_hash", sa.String, nullable=False),
+        sa.Column("updated_ts", sa.TIMESTAMP(timezone=timezone.utc), nullable=False),
+    )
+
     class RefDashboardSchema(Schema):
         bot: G0T0Bot = None
         category_channel_id = fields.Integer(required=False, allow_none=True)
@@ -237,9 +266,13 @@ class RefDashboard(object):
         query = RefDashboard.ref_dashboard_table.delete().where(
             RefDashboard.ref_dashboard_table.c.post_id == self.post_id
         )
+        content_query = RefDashboard.ref_dashboard_content_table.delete().where(
+            RefDashboard.ref_dashboard_content_table.c.post_id == self.post_id
+        )
 
         async with self._db.acquire() as conn:
             await conn.execute(query)
+            await conn.execute(content_query)
 
     @staticmethod
     async def get_dashboard(bot: G0T0Bot, **kwargs) -> "RefDashboard":
@@ -278,7 +311,83 @@ class RefDashboard(object):
 
         return d
 
-    async def refresh(self, bot: G0T0Bot, message: discord.Message = None) -> None:
+    async def edit_post(
+        self, bot: G0T0Bot, message: discord.Message, **kwargs
+    ) -> discord.Message:
+        """
+        Queues an edit of the dashboard post behind any user-facing posts in the channel.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            message (Message): The dashboard post to edit.
+            **kwargs: Arguments passed to `Message.edit`. A `file_bytes` tuple of (filename, bytes) is rebuilt
+                into a fresh `discord.File` for each attempt.
+        Returns:
+            Message: The edited message, or None if the edit was dropped.
+        """
+        file_bytes = kwargs.pop("file_bytes", None)
+
+        def _edit():
+            if file_bytes:
+                kwargs["file"] = discord.File(
+                    BytesIO(file_bytes[1]), filename=file_bytes[0]
+                )
+            return message.edit(**kwargs)
+
+        return await bot.send_queue.submit(
+            message.channel, _edit, SendPriority.background
+        )
+
+    async def edit_table(
+        self, bot: G0T0Bot, message: discord.Message, table: str
+    ) -> discord.Message:
+        """
+        Edits a table dashboard post only when the table has changed since the last edit.
+        The hash of the last posted table and the time it changed are stored separately from the post, so the
+        "Last Updated" footer reflects when the data last changed rather than when it was last checked.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            message (Message): The dashboard post to edit.
+            table (str): The rendered table.
+        Returns:
+            Message: The edited message, or None if the table is unchanged or the edit was dropped.
+        """
+        content_hash = hashlib.sha256(table.encode()).hexdigest()
+        content_table = RefDashboard.ref_dashboard_content_table
+
+        row = await bot.query(
+            content_table.select().where(content_table.c.post_id == self.post_id)
+        )
+
+        if row and row["content_hash"] == content_hash:
+            return None
+
+        updated_ts = datetime.now(timezone.utc)
+        footer = f"Last Updated - <t:{calendar.timegm(updated_ts.timetuple())}:F>"
+
+        edited = await self.edit_post(
+            bot, message, content=f"```\n{table}```{footer}", embed=None
+        )
+
+        if edited:
+            query = (
+                insert(content_table)
+                .values(
+                    post_id=self.post_id,
+                    content_hash=content_hash,
+                    updated_ts=updated_ts,
+                )
+                .on_conflict_do_update(
+                    index_elements=["post_id"],
+                    set_=dict(content_hash=content_hash, updated_ts=updated_ts),
+                )
+            )
+            await bot.query(query, QueryResultType.none)
+
+        return edited
+
+    async def refresh(
+        self, bot: G0T0Bot, message: discord.Message = None, **kwargs
+    ) -> None:
         original_message = await self.get_pinned_post()
 
         if isinstance(original_message, bool):
@@ -368,139 +477,121 @@ class RefDashboard(object):
                         name=field.name, value=field.channel_output(), inline=False
                     )
 
-                return await original_message.edit(content="", embed=embed)
+                return await self.edit_post(
+                    bot, original_message, content="", embed=embed
+                )
 
         elif self.dashboard_type.value.upper() == "CCENSUS":
-            census = []
             result = await bot.query(
-                DashboardViews.class_census_table.select(), QueryResultType.multiple
+                DashboardViews.class_census(original_message.guild.id),
+                QueryResultType.multiple,
             )
 
-            for row in result:
-                census.append([row["Class"], row["#"]])
+            from texttable import Texttable
 
             class_table = Texttable()
             class_table.set_cols_align(["l", "r"])
             class_table.set_cols_valign(["m", "m"])
             class_table.set_cols_width([15, 5])
             class_table.header(["Class", "#"])
-            class_table.add_rows(census, header=False)
-
-            footer = f"Last Updated - <t:{calendar.timegm(datetime.now(timezone.utc).timetuple())}:F>"
-
-            return await original_message.edit(
-                content=f"```\n{class_table.draw()}```{footer}", embed=None
+            class_table.add_rows(
+                [[row["Class"], row["#"]] for row in result], header=False
             )
 
-        elif self.dashboard_type.value.upper() == "LDIST":
-            dist = []
+            return await self.edit_table(bot, original_message, class_table.draw())
 
+        elif self.dashboard_type.value.upper() == "LDIST":
             result = await bot.query(
-                DashboardViews.level_distribution_table.select(),
+                DashboardViews.level_distribution(original_message.guild.id),
                 QueryResultType.multiple,
             )
 
-            for row in result:
-                dist.append([row["level"], row["#"]])
+            from texttable import Texttable
 
             dist_table = Texttable()
             dist_table.set_cols_align(["l", "r"])
             dist_table.set_cols_valign(["m", "m"])
             dist_table.set_cols_width([10, 5])
             dist_table.header(["Level", "#"])
-            dist_table.add_rows(dist, header=False)
-
-            footer = f"Last Updated - <t:{calendar.timegm(datetime.now(timezone.utc).timetuple())}:F>"
-
-            return await original_message.edit(
-                content=f"```\n{dist_table.draw()}```{footer}", embed=None
+            dist_table.add_rows(
+                [[row["level"], row["#"]] for row in result], header=False
             )
 
+            return await self.edit_table(bot, original_message, dist_table.draw())
+
         elif self.dashboard_type.value.upper() == "FINANCIAL":
-            fin: Financial = await Financial.get_financial_data(bot)
-            res = requests.get(
-                "https://res.cloudinary.com/jerrick/image/upload/d_642250b563292b35f27461a7.png,f_jpg,fl_progressive,q_auto,w_1024/y3mdgvccfyvmemabidd0.jpg"
-            )
-            if res.status_code != 200:
-                raise Exception("Failed to download image")
-
-            background = Image.open(BytesIO(res.content)).convert("RGBA")
-            background = background.resize((800, 400))
-
-            background = Image.open(BytesIO(res.content)).convert("RGBA")
-            background = background.resize((800, 400))
-
-            # Progress bar properties
-            bar_width = 700
-            bar_height = 50
-            bar_x = 50
-            bar_y = 300
-            corner_radius = 20
-            shadow_offset = 10
-
-            # Calculate progress
-            progress = min(
-                fin.adjusted_total / fin.monthly_goal, 1
-            )  # Cap progress at 100% for the main bar
-
-            shadow = Image.new("RGBA", background.size, (0, 0, 0, 0))
-            shadow_draw = ImageDraw.Draw(shadow)
-
-            shadow_color = (0, 0, 0, 100)
-
-            shadow_rect = [
-                bar_x + shadow_offset,
-                bar_y + shadow_offset,
-                bar_x + bar_width + shadow_offset,
-                bar_y + bar_height + shadow_offset,
-            ]
-            shadow_draw.rounded_rectangle(
-                shadow_rect, fill=shadow_color, radius=corner_radius
+            content = kwargs.get("financial") or await RefDashboard.render_financial(
+                bot
             )
-            shadow = shadow.filter(ImageFilter.GaussianBlur(10))
 
-            background = Image.alpha_composite(background, shadow)
+            original_message.attachments.clear()
+            return await self.edit_post(bot, original_message, **content)
 
-            draw = ImageDraw.Draw(background)
+    @staticmethod
+    async def render_financial(bot: G0T0Bot) -> dict:
+        """
+        Renders the financial progress embed and image from the cached financial data.
+        Args:
+            bot (G0T0Bot): The bot instance.
+        Returns:
+            dict: Keyword arguments for `edit_post`, shared by every FINANCIAL dashboard.
+        """
+        fin: Financial = await Financial.get_financial_data(bot)
+        # Cap progress at 100% for the main bar
+        progress = min(fin.adjusted_total / fin.monthly_goal, 1)
+        image = await get_progress_image(progress)
+
+        embed = discord.Embed(
+            title="G0-T0 Financial Progress",
+            description=f"Current Monthly Progress: ${fin.adjusted_total:.2f}\n"
+            f"Monthly Goal: ${fin.monthly_goal:.2f}\n"
+            f"Reserve: ${fin.reserve:.2f}",
+            color=discord.Color.gold(),
+            timestamp=discord.utils.utcnow(),
+        )
 
-            draw.rounded_rectangle(
-                [bar_x, bar_y, bar_x + bar_width, bar_y + bar_height],
-                fill="gray",
-                outline="white",
-                width=2,
-                radius=corner_radius,
-            )
+        embed.add_field(
+            name="Stretch Goals",
+            value="If we end up with enough reserve funds, we will look at making a website to house our content rulings / updates and work on better integrations with the bot.",
+        )
 
-            draw.rounded_rectangle(
-                [bar_x, bar_y, bar_x + int(bar_width * progress), bar_y + bar_height],
-                fill="green",
-                radius=corner_radius,
-            )
+        embed.set_image(url="attachment://progress.png")
+        embed.set_footer(text="Last Updated")
 
-            image_buffer = BytesIO()
-            background.save(image_buffer, format="PNG")
-            image_buffer.seek(0)
-
-            embed = discord.Embed(
-                title="G0-T0 Financial Progress",
-                description=f"Current Monthly Progress: ${fin.adjusted_total:.2f}\n"
-                f"Monthly Goal: ${fin.monthly_goal:.2f}\n"
-                f"Reserve: ${fin.reserve:.2f}",
-                color=discord.Color.gold(),
-                timestamp=discord.utils.utcnow(),
-            )
+        return {
+            "file_bytes": ("progress.png", image),
+            "embed": embed,
+            "content": "",
+        }
 
-            embed.add_field(
-                name="Stretch Goals",
-                value="If we end up with enough reserve funds, we will look at making a website to house our content rulings / updates and work on better integrations with the bot.",
+    @staticmethod
+    def queue_financial_refresh(bot: G0T0Bot) -> None:
+        """
+        Schedules a refresh of every FINANCIAL dashboard. Calls made while a refresh is already waiting are
+        folded into it, so a burst of updates produces a single render and one edit per dashboard.
+        Args:
+            bot (G0T0Bot): The bot instance.
+        """
+        RefDashboard._financial_pending = True
+
+        if (
+            RefDashboard._financial_refresh is None
+            or RefDashboard._financial_refresh.done()
+        ):
+            RefDashboard._financial_refresh = asyncio.create_task(
+                RefDashboard._run_financial_refresh(bot)
             )
 
-            embed.set_image(url="attachment://progress.png")
-            embed.set_footer(text="Last Updated")
+    @staticmethod
+    async def _run_financial_refresh(bot: G0T0Bot) -> None:
+        while RefDashboard._financial_pending:
+            await asyncio.sleep(FINANCIAL_REFRESH_DELAY)
+            RefDashboard._financial_pending = False
 
-            file = discord.File(image_buffer, filename="progress.png")
-            original_message.attachments.clear()
-            return await original_message.edit(file=file, embed=embed, content="")
+            try:
+                await RefDashboard.update_financial_dashboards(bot)
+            except Exception as error:
+                log.error(f"Unable to refresh financial dashboards: {error}")
 
     @staticmethod
     async def update_financial_dashboards(bot: G0T0Bot) -> None:
@@ -516,9 +607,14 @@ class RefDashboard(object):
 
         dashboards = [RefDashboard.RefDashboardSchema(bot).load(row) for row in rows]
 
+        if not dashboards:
+            return
+
+        content = await RefDashboard.render_financial(bot)
+
         for dashboard in dashboards:
             dashboard: RefDashboard
-            await dashboard.refresh(bot)
+            await dashboard.refresh(bot, financial=content)
 
 
 # PGSQL Views
@@ -536,3 +632,63 @@ class DashboardViews(object):
         sa.Column("level", sa.Integer, nullable=False),
         sa.Column("#", sa.Integer, nullable=False, default=0),
     )
+
+    @staticmethod
+    def class_census(guild_id: int) -> sa.sql.Select:
+        """
+        Per-guild variant of the "Class Census" view.
+        Args:
+            guild_id (int): The guild to count active characters for.
+        Returns:
+            Select: Rows of ("Class", "#") ordered by class name.
+        """
+        characters = PlayerCharacter.characters_table
+        classes = PlayerCharacterClass.character_class_table
+        class_names = CharacterClass.__table__
+
+        return (
+            sa.select(
+                class_names.c.value.label("Class"),
+                sa.func.count(classes.c.id).label("#"),
+            )
+            .select_from(
+                classes.join(
+                    characters, characters.c.id == classes.c.character_id
+                ).join(class_names, class_names.c.id == classes.c.primary_class)
+            )
+            .where(
+                sa.and_(
+                    characters.c.guild_id == guild_id,
+                    characters.c.active == True,
+                    classes.c.active == True,
+                )
+            )
+            .group_by(class_names.c.value)
+            .order_by(class_names.c.value.asc())
+        )
+
+    @staticmethod
+    def level_distribution(guild_id: int) -> sa.sql.Select:
+        """
+        Per-guild variant of the "Level Distribution" view.
+        Args:
+            guild_id (int): The guild to count active characters for.
+        Returns:
+            Select: Rows of ("level", "#") ordered by level.
+        """
+        characters = PlayerCharacter.characters_table
+
+        return (
+            sa.select(
+                characters.c.level.label("level"),
+                sa.func.count(characters.c.id).label("#"),
+            )
+            .where(
+                sa.and_(
+                    characters.c.guild_id == guild_id,
+                    characters.c.active == True,
+                )
+            )
+            .group_by(characters.c.level)
+            .order_by(characters.c.level.asc())
+        )
@@ -43,6 +43,20 @@ class AdjustOperator(Enum):
     greater = ">="
 
 
+class RequestStatus(Enum):
+    """
+    Enum representing the state of a request reviewed by staff, such as a market request or application.
+    Attributes:
+        pending (str): The request is waiting on staff.
+        denied (str): The request was denied and cannot be edited or approved.
+        approved (str): The request was approved.
+    """
+
+    pending = "Pending"
+    denied = "Denied"
+    approved = "Approved"
+
+
 class WebhookType(Enum):
     """
     Enum representing different types of webhooks.
@@ -57,8 +71,37 @@ class WebhookType(Enum):
     say = "say"
 
 
+class ContextLevel(Enum):
+    """
+    Enum representing how much of the invoking player's context a command needs loaded before it runs.
+    Attributes:
+        none (str): Nothing. `ctx.player` and `ctx.playerGuild` are left as None.
+        guild (str): Only `ctx.playerGuild`.
+        player (str): `ctx.playerGuild`, and `ctx.player` with their characters.
+        full (str): Also the player's quest progress, adventures and arenas.
+    """
+
+    none = "None"
+    guild = "Guild"
+    player = "Player"
+    full = "Full"
+
+
 class QueryResultType(Enum):
     single = "Single"
     multiple = "Multiple"
     scalar = "Scalar"
     none = "None"
+
+
+class SendPriority(Enum):
+    """
+    Enum representing the priority of an outbound Discord request in the send queue.
+    Lower values are sent first.
+    Attributes:
+        user (int): User-facing posts such as `>say` and NPC webhook messages.
+        background (int): Background edits such as dashboard refreshes.
+    """
+
+    user = 0
+    background = 1
@@ -35,7 +35,9 @@ class Financial(object):
     adjusted_total:
         Returns the monthly total adjusted for Discord's fee.
     update:
-        Asynchronously updates the financial information in the database.
+        Asynchronously updates the financial information in the database and the bot's cached copy.
+    get_financial_data(bot, refresh=False):
+        Returns the cached financial information, loading it from the database if needed.
     """
 
     financial_table = sa.Table(
@@ -54,15 +56,15 @@ class Financial(object):
     )
 
     class FinancialSchema(Schema):
-        db: aiopg.sa.Engine = None
+        bot: G0T0Bot = None
         month_count = fields.Integer(required=True)
         monthly_goal = fields.Number(required=True)
         monthly_total = fields.Number(required=True)
         reserve = fields.Number(required=True)
         last_reset = fields.Method(None, "load_timestamp", allow_none=True)
 
-        def __init__(self, db: aiopg.sa.Engine, **kwargs):
-            self.db = db
+        def __init__(self, bot: G0T0Bot, **kwargs):
+            self.bot = bot
             super().__init__(**kwargs)
 
         def load_timestamp(
@@ -80,10 +82,11 @@ class Financial(object):
 
         @post_load
         def make_finance(self, data, **kwargs) -> "Financial":
-            return Financial(self.db, **data)
+            return Financial(self.bot, **data)
 
-    def __init__(self, db, **kwargs):
-        self._db: aiopg.sa.Engine = db
+    def __init__(self, bot: G0T0Bot, **kwargs):
+        self._bot = bot
+        self._db: aiopg.sa.Engine = bot.db
         self.month_count = kwargs.get("month_count", 0)
         self.monthly_goal = kwargs.get("monthly_goal", 0)
         self.monthly_total = kwargs.get("monthly_total", 0)
@@ -105,16 +108,28 @@ class Financial(object):
 
         query = Financial.financial_table.update().values(**update_dict)
 
-        async with self._db.acquire() as conn:
-            await conn.execute(query)
+        try:
+            async with self._db.acquire() as conn:
+                await conn.execute(query)
+        except Exception:
+            # Drop the cached copy so the next read comes from the database
+            self._bot.financial = None
+            raise
+
+        self._bot.financial = self
 
     @staticmethod
-    async def get_financial_data(bot: G0T0Bot) -> "Financial":
+    async def get_financial_data(bot: G0T0Bot, refresh: bool = False) -> "Financial":
+        if bot.financial and not refresh:
+            bot.metrics.cache_hit("financial")
+            return bot.financial
+
+        bot.metrics.cache_miss("financial")
         row = await bot.query(Financial.financial_table.select())
 
         if row is None:
             return None
 
-        fin = Financial.FinancialSchema(bot.db).load(row)
+        bot.financial = Financial.FinancialSchema(bot).load(row)
 
-        return fin
+        return bot.financial
@@ -402,6 +402,19 @@ class PlayerGuild(object):
         else:
             return None
 
+    @property
+    def tier_roles(self) -> dict[int, discord.Role]:
+        roles = {
+            1: self.entry_role,
+            2: self.tier_2_role,
+            3: self.tier_3_role,
+            4: self.tier_4_role,
+            5: self.tier_5_role,
+            6: self.tier_6_role,
+        }
+
+        return {tier: role for tier, role in roles.items() if role}
+
     @property
     def get_last_reset(self) -> int:
         return calendar.timegm(self._last_reset.utctimetuple())
@@ -626,8 +639,10 @@ class PlayerGuild(object):
         if len(bot.player_guilds) > 0 and (
             guild := bot.player_guilds.get(str(guild_id))
         ):
+            bot.metrics.cache_hit("player_guild")
             return guild
 
+        bot.metrics.cache_miss("player_guild")
         guild = PlayerGuild(bot.db, guild=bot.get_guild(guild_id))
         guild: PlayerGuild = await guild.fetch()
 
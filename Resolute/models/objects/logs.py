@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 import discord
 import sqlalchemy as sa
 from marshmallow import Schema, fields, post_load
+from sqlalchemy.dialects.postgresql import insert
 from Resolute.constants import APPROVAL_EMOJI, ZWSP3
 from Resolute.helpers import confirm
 from Resolute.models import metadata
@@ -18,7 +19,7 @@ from Resolute.models.objects.exceptions import G0T0Error, TransactionError
 from Resolute.models.objects.players import Player
 from Resolute.models.categories import Activity
 from Resolute.models.objects.adventures import Adventure
-from Resolute.models.objects.characters import PlayerCharacter
+from Resolute.models.objects.characters import CharacterRenown, PlayerCharacter
 from Resolute.models.categories.categories import Faction
 from Resolute.models.categories.categories import CodeConversion
 
@@ -70,6 +71,7 @@ class DBLog(object):
         sa.Column("invalid", sa.BOOLEAN, nullable=False, default=False),
         sa.Column("player_id", sa.BigInteger, nullable=False),
         sa.Column("guild_id", sa.BigInteger, nullable=False),
+        sa.Index("idx_log_player_guild", "player_id", "guild_id", "invalid"),
     )
 
     class LogSchema(Schema):
@@ -536,3 +538,381 @@ class DBLog(object):
         logs = [await DBLog.LogSchema(bot).load(row) for row in rows]
 
         return logs
+
+
+class DBLogBatch(object):
+    """
+    Builds many log entries in memory and writes them in a single transaction.
+    Rewards are calculated the same way as `DBLog.create` (diversion limits, handicap, credit ratio,
+    credit conversion, level up tokens and author reward points), but players, characters and renown are
+    only written once per batch using multi-row statements instead of once per log.
+    Attributes:
+        _bot (G0T0Bot): The bot instance.
+        guild_id (int): The ID of the guild the logs are for.
+        author (Player): The author of the log entries.
+        players (dict[int, Player]): Players touched by the batch, keyed by ID.
+        logs (list[DBLog]): The log entries in the batch.
+    Methods:
+        load_players(player_ids):
+            Loads the given players, plus the author, with a fixed number of queries.
+        add(player, activity, **kwargs) -> DBLog:
+            Calculates a log entry and applies it to the in-memory player and character.
+        commit(*queries) -> list[DBLog]:
+            Writes all log entries, players, characters and renown, plus any extra queries, in one transaction.
+        totals() -> dict:
+            Returns the number of logs and the total CC, credits and renown in the batch.
+    """
+
+    def __init__(self, bot: G0T0Bot, guild_id: int, author: discord.Member | Player):
+        self._bot = bot
+        self.guild_id = guild_id
+        self._author_id = author.id
+        self.author: Player = author if isinstance(author, Player) else None
+        self.players: dict[int, Player] = {}
+        self.logs: list[DBLog] = []
+
+        self._characters: dict[int, PlayerCharacter] = {}
+        self._renown: list[CharacterRenown] = []
+
+    async def load_players(self, player_ids: list[int]) -> dict[int, Player]:
+        ids = [i for i in set(player_ids) | {self._author_id} if i not in self.players]
+
+        self.players.update(await Player.get_players(self._bot, ids, self.guild_id))
+
+        if self.author:
+            self.players[self.author.id] = self.author
+        else:
+            self.author = self.players[self._author_id]
+
+        return self.players
+
+    def add(
+        self,
+        player: Player | int,
+        activity: Activity | str,
+        **kwargs,
+    ) -> "DBLog":
+        """
+        Calculates a log entry and applies it to the in-memory player and character. Nothing is written
+        until `commit` is called.
+        Args:
+            player (Player | int): The player, or ID of a player loaded with `load_players`.
+            activity (Activity | str): The activity being logged.
+        Keyword Args:
+            cc (int): The amount of CC involved in the activity.
+            credits (int): The amount of credits involved in the activity.
+            renown (int): The amount of renown involved in the activity.
+            notes (str): Additional notes for the log entry.
+            character (PlayerCharacter): The character involved in the activity.
+            ignore_handicap (bool): Whether to ignore handicap adjustments.
+            faction (Faction): The faction involved in the activity.
+            adventure (Adventure): The adventure involved in the activity.
+        Returns:
+            DBLog: The log entry. `id` and `created_ts` are set on commit.
+        Raises:
+            G0T0Error: If required parameters are missing.
+            TransactionError: If the player cannot afford the transaction.
+        """
+        player: Player = self.players[player if isinstance(player, int) else player.id]
+        activity: Activity = (
+            activity
+            if isinstance(activity, Activity)
+            else self._bot.compendium.get_activity(activity)
+        )
+
+        cc = kwargs.get("cc")
+        credits = kwargs.get("credits", 0)
+        renown = kwargs.get("renown", 0)
+        notes = kwargs.get("notes")
+        ignore_handicap = kwargs.get("ignore_handicap", False)
+        faction: Faction = kwargs.get("faction")
+        adventure: Adventure = kwargs.get("adventure")
+        character: PlayerCharacter = kwargs.get("character")
+
+        if character:
+            character = self._characters.setdefault(
+                character.id,
+                next((c for c in player.characters if c.id == character.id), character),
+            )
+
+        # Calculations
+        reward_cc = cc if cc else activity.cc if activity.cc else 0
+        if activity.diversion and (player.div_cc + reward_cc > player.guild.div_limit):
+            reward_cc = max(0, player.guild.div_limit - player.div_cc)
+
+        handicap_adjustment = (
+            0
+            if ignore_handicap or player.guild.handicap_cc <= player.handicap_amount
+            else min(reward_cc, player.guild.handicap_cc - player.handicap_amount)
+        )
+        total_cc = reward_cc + handicap_adjustment
+
+        if activity.credit_ratio and character and credits == 0 and total_cc > 0:
+            rate: CodeConversion = self._bot.compendium.get_object(
+                CodeConversion, character.level
+            )
+            credits = ceil(total_cc * rate.value * activity.credit_ratio)
+
+        # Verification
+        if player.cc + total_cc < 0:
+            raise TransactionError(
+                f"{player.member.mention if player.member else player.id} cannot afford the {total_cc:,} CC cost."
+            )
+        elif (credits != 0 or renown != 0) and not character:
+            raise G0T0Error(
+                "Need to specify a character to do this type of transaction"
+            )
+        elif renown > 0 and not faction:
+            raise G0T0Error("No faction specified")
+        elif character and credits < 0 and character.credits + credits < 0:
+            rate: CodeConversion = self._bot.compendium.get_object(
+                CodeConversion, character.level
+            )
+            convertedCC = ceil((abs(credits) - character.credits) / rate.value)
+            if player.cc < convertedCC:
+                raise TransactionError(
+                    f"{character.name} cannot afford the {credits:,} credit cost or to convert the {convertedCC:,} needed."
+                )
+
+            self.add(
+                player,
+                "CONVERSION",
+                cc=-convertedCC,
+                character=character,
+                credits=convertedCC * rate.value,
+                notes=notes,
+                ignore_handicap=True,
+            )
+
+        # Updates
+        if character:
+            character.credits += credits
+
+        player.cc += total_cc
+        player.handicap_amount += handicap_adjustment
+        player.div_cc += reward_cc if activity.diversion else 0
+
+        if faction:
+            character_renown = next(
+                (r for r in character.renown if r.faction.id == faction.id), None
+            )
+            if not character_renown:
+                character_renown = CharacterRenown(
+                    self._bot.db,
+                    self._bot.compendium,
+                    faction=faction,
+                    character_id=character.id,
+                )
+                character.renown.append(character_renown)
+            character_renown.renown += renown
+
+            if character_renown not in self._renown:
+                self._renown.append(character_renown)
+
+        if activity.level_up_token:
+            if (
+                player.guild.earned_level_up_max
+                and player.level_ups_earned < player.guild.earned_level_up_max
+                and player.level_tokens < player.guild.earned_level_up_max
+            ):
+                player.level_tokens += 1
+                player.level_ups_earned += 1
+
+        if self.author.guild.reward_threshold and activity.value != "LOG_REWARD":
+            self.author.points += activity.points
+
+        log_entry = DBLog(
+            self._bot,
+            guild_id=self.guild_id,
+            author=self.author,
+            player_id=player.id,
+            player=player,
+            activity=activity,
+            notes=notes,
+            character_id=character.id if character else None,
+            character=character,
+            cc=total_cc,
+            credits=credits,
+            renown=renown,
+            adventure_id=adventure.id if adventure else None,
+            faction=faction,
+        )
+        self.logs.append(log_entry)
+
+        return log_entry
+
+    def totals(self) -> dict:
+        return {
+            "logs": len(self.logs),
+            "players": len({l.player_id for l in self.logs}),
+            "cc": sum(l.cc for l in self.logs),
+            "credits": sum(l.credits for l in self.logs),
+            "renown": sum(l.renown for l in self.logs),
+        }
+
+    async def commit(self, *queries) -> list["DBLog"]:
+        """
+        Writes every log entry, player, character and renown change in the batch in a single transaction.
+        Author reward points are settled first, so any LOG_REWARD entry is part of the same transaction.
+        Nothing is written if any statement fails.
+        Args:
+            *queries: Additional statements to execute in the same transaction, such as the arena a phase
+                is being logged for.
+        Returns:
+            list[DBLog]: The written log entries, with `id` and `created_ts` set.
+        """
+        if not self.logs:
+            if queries:
+                async with self._bot.db.acquire() as conn:
+                    async with conn.begin():
+                        for query in queries:
+                            await conn.execute(query)
+            return self.logs
+
+        reward_log: DBLog = None
+        author = self.author
+
+        # Author Rewards
+        if (
+            author.guild.reward_threshold
+            and author.points >= author.guild.reward_threshold
+        ):
+            qty = max(1, author.points // author.guild.reward_threshold)
+            act: Activity = self._bot.compendium.get_activity("LOG_REWARD")
+            reward_log = self.add(
+                author,
+                act,
+                cc=act.cc * qty,
+                notes=f"Rewards for {author.guild.reward_threshold*qty} points",
+            )
+            reward_log.author = Player(
+                self._bot, self._bot.user.id, self.guild_id, member=self._bot.user
+            )
+            author.points = max(
+                0, author.points - (author.guild.reward_threshold * qty)
+            )
+
+        now = datetime.now(timezone.utc)
+        log_query = (
+            DBLog.log_table.insert()
+            .values(
+                [
+                    {
+                        "author": l.author.id,
+                        "player_id": l.player_id,
+                        "guild_id": l.guild_id,
+                        "activity": l.activity.id,
+                        "notes": l.notes,
+                        "character_id": l.character_id,
+                        "cc": l.cc,
+                        "credits": l.credits,
+                        "renown": l.renown,
+                        "faction": l.faction.id if l.faction else None,
+                        "adventure_id": l.adventure_id,
+                        "invalid": False,
+                        "created_ts": now,
+                    }
+                    for l in self.logs
+                ]
+            )
+            .returning(DBLog.log_table.c.id, DBLog.log_table.c.created_ts)
+        )
+
+        players = list(self.players.values())
+        player_query = insert(Player.player_table).values(
+            [
+                {
+                    "id": p.id,
+                    "guild_id": p.guild_id,
+                    "handicap_amount": p.handicap_amount,
+                    "cc": p.cc,
+                    "div_cc": p.div_cc,
+                    "points": p.points,
+                    "activity_points": p.activity_points,
+                    "activity_level": p.activity_level,
+                    "statistics": p.statistics,
+                    "level_tokens": p.level_tokens,
+                    "level_ups_earned": p.level_ups_earned,
+                }
+                for p in players
+            ]
+        )
+        player_query = player_query.on_conflict_do_update(
+            index_elements=["id", "guild_id"],
+            set_={
+                c: player_query.excluded[c]
+                for c in [
+                    "handicap_amount",
+                    "cc",
+                    "div_cc",
+                    "points",
+                    "level_tokens",
+                    "level_ups_earned",
+                ]
+            },
+        )
+
+        async with self._bot.db.acquire() as conn:
+            async with conn.begin():
+                results = await conn.execute(log_query)
+                rows = await results.fetchall()
+
+                await conn.execute(player_query)
+
+                if self._characters:
+                    credit_values = sa.values(
+                        sa.column("id", sa.Integer),
+                        sa.column("credits", sa.Integer),
+                        name="credit_values",
+                    ).data([(c.id, c.credits) for c in self._characters.values()])
+
+                    await conn.execute(
+                        PlayerCharacter.characters_table.update()
+                        .where(
+                            PlayerCharacter.characters_table.c.id == credit_values.c.id
+                        )
+                        .values(credits=credit_values.c.credits)
+                    )
+
+                if existing := [r for r in self._renown if r.id is not None]:
+                    renown_values = sa.values(
+                        sa.column("id", sa.Integer),
+                        sa.column("renown", sa.Integer),
+                        name="renown_values",
+                    ).data([(r.id, r.renown) for r in existing])
+
+                    await conn.execute(
+                        CharacterRenown.renown_table.update()
+                        .where(CharacterRenown.renown_table.c.id == renown_values.c.id)
+                        .values(renown=renown_values.c.renown)
+                    )
+
+                if new := [r for r in self._renown if r.id is None]:
+                    results = await conn.execute(
+                        CharacterRenown.renown_table.insert()
+                        .values(
+                            [
+                                {
+                                    "character_id": r.character_id,
+                                    "faction": r.faction.id,
+                                    "renown": r.renown,
+                                }
+                                for r in new
+                            ]
+                        )
+                        .returning(CharacterRenown.renown_table.c.id)
+                    )
+                    for renown, row in zip(new, await results.fetchall()):
+                        renown.id = row["id"]
+
+                for query in queries:
+                    await conn.execute(query)
+
+        for log_entry, row in zip(self.logs, rows):
+            log_entry.id = row["id"]
+            log_entry.created_ts = row["created_ts"]
+
+        if reward_log and author.guild.staff_channel:
+            await author.guild.staff_channel.send(embed=LogEmbed(reward_log, True))
+
+        return self.logs
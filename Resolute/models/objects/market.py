@@ -1,10 +1,17 @@
 import re
+from datetime import datetime, timezone
 
 import discord
+import sqlalchemy as sa
+from marshmallow import Schema, fields, post_load
+from sqlalchemy.dialects.postgresql import insert
 
 from Resolute.bot import G0T0Bot
+from Resolute.constants import DENIED_EMOJI
+from Resolute.models import metadata
 from Resolute.models.categories.categories import TransactionSubType, TransactionType
 from Resolute.models.objects.characters import PlayerCharacter
+from Resolute.models.objects.enum import RequestStatus, QueryResultType
 from Resolute.models.objects.exceptions import G0T0Error
 from Resolute.models.objects.players import Player
 
@@ -21,12 +28,87 @@ class MarketTransaction(object):
         credits (int): The amount of credits involved in the transaction.
         character (PlayerCharacter): The character involved in the transaction.
         message (Message): The message associated with the transaction.
+        status (RequestStatus): The state of the request. Defaults to RequestStatus.pending.
+        log_id (int): The ID of the log created when the request was approved.
     Methods:
         format_type: Returns a formatted string representation of the transaction type and subtype.
         log_notes: Returns a formatted string of the transaction type and notes.
-        get_request(bot, message): Asynchronously parses a message to create a MarketTransaction instance.
+        upsert(bot): Saves the transaction, keyed by its message id.
+        delete(bot): Removes the transaction.
+        set_status(bot, message_id, status, log_id=None): Updates the status of a stored transaction.
+        get_request(bot, message, player=None): Asynchronously loads the transaction for a market message.
     """
 
+    market_table = sa.Table(
+        "market_transactions",
+        metadata,
+        sa.Column("message_id", sa.BigInteger, primary_key=True),
+        sa.Column("guild_id", sa.BigInteger, nullable=False),
+        sa.Column("player_id", sa.BigInteger, nullable=False),
+        sa.Column("character_id", sa.Integer, nullable=True),
+        sa.Column("type_id", sa.Integer, nullable=True),
+        sa.Column("subtype_id", sa.Integer, nullable=True),
+        sa.Column("notes", sa.String, nullable=True),
+        sa.Column("cc", sa.Integer, nullable=False, default=0),
+        sa.Column("credits", sa.Integer, nullable=False, default=0),
+        sa.Column("status", sa.String, nullable=False),
+        sa.Column("log_id", sa.Integer, nullable=True),
+        sa.Column("created_ts", sa.TIMESTAMP(timezone=timezone.utc)),
+    )
+
+    class MarketSchema(Schema):
+        bot: G0T0Bot = None
+        player: Player = None
+        message: discord.Message = None
+
+        message_id = fields.Integer(required=True)
+        guild_id = fields.Integer(required=True)
+        player_id = fields.Integer(required=True)
+        character_id = fields.Integer(allow_none=True)
+        type_id = fields.Integer(allow_none=True)
+        subtype_id = fields.Integer(allow_none=True)
+        notes = fields.String(allow_none=True)
+        cc = fields.Integer()
+        credits = fields.Integer()
+        status = fields.Method(None, "load_status")
+        log_id = fields.Integer(allow_none=True)
+        created_ts = fields.Raw(allow_none=True)
+
+        def __init__(
+            self, bot: G0T0Bot, player: Player, message: discord.Message, **kwargs
+        ):
+            super().__init__(**kwargs)
+            self.bot = bot
+            self.player = player
+            self.message = message
+
+        @post_load
+        async def make_transaction(self, data, **kwargs) -> "MarketTransaction":
+            character = None
+
+            if character_id := data.get("character_id"):
+                character = next(
+                    (c for c in self.player.characters if c.id == character_id), None
+                ) or await PlayerCharacter.get_character(self.bot, character_id)
+
+            return MarketTransaction(
+                self.player,
+                type=self.bot.compendium.get_object(TransactionType, data["type_id"]),
+                subtype=self.bot.compendium.get_object(
+                    TransactionSubType, data["subtype_id"]
+                ),
+                notes=data.get("notes"),
+                cc=data.get("cc", 0),
+                credits=data.get("credits", 0),
+                character=character,
+                message=self.message,
+                status=data["status"],
+                log_id=data.get("log_id"),
+            )
+
+        def load_status(self, value):
+            return RequestStatus(value)
+
     def __init__(self, player: Player, **kwargs):
         self.player = player
 
@@ -37,6 +119,8 @@ class MarketTransaction(object):
         self.credits: int = kwargs.get("credits", 0)
         self.character: PlayerCharacter = kwargs.get("character")
         self.message: discord.Message = kwargs.get("message")
+        self.status: RequestStatus = kwargs.get("status", RequestStatus.pending)
+        self.log_id: int = kwargs.get("log_id")
 
     @property
     def format_type(self) -> str:
@@ -48,10 +132,100 @@ class MarketTransaction(object):
     def log_notes(self) -> str:
         return f"{self.format_type}\n\n{self.notes}"
 
+    async def upsert(self, bot: G0T0Bot) -> None:
+        update_dict = {
+            "character_id": self.character.id if self.character else None,
+            "type_id": self.type.id if self.type else None,
+            "subtype_id": self.subtype.id if self.subtype else None,
+            "notes": self.notes,
+            "cc": self.cc,
+            "credits": self.credits,
+            "status": self.status.value,
+            "log_id": self.log_id,
+        }
+
+        insert_dict = {
+            **update_dict,
+            "message_id": self.message.id,
+            "guild_id": self.message.guild.id,
+            "player_id": self.player.id,
+            "created_ts": datetime.now(timezone.utc),
+        }
+
+        query = (
+            insert(MarketTransaction.market_table)
+            .values(**insert_dict)
+            .on_conflict_do_update(index_elements=["message_id"], set_=update_dict)
+        )
+
+        await bot.query(query, QueryResultType.none)
+
+    async def delete(self, bot: G0T0Bot) -> None:
+        query = MarketTransaction.market_table.delete().where(
+            MarketTransaction.market_table.c.message_id == self.message.id
+        )
+
+        await bot.query(query, QueryResultType.none)
+
+    @staticmethod
+    async def set_status(
+        bot: G0T0Bot, message_id: int, status: RequestStatus, log_id: int = None
+    ) -> bool:
+        """
+        Updates the status of a stored transaction without loading it.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            message_id (int): The ID of the market message.
+            status (RequestStatus): The new status.
+            log_id (int, optional): The ID of the log created on approval.
+        Returns:
+            bool: True if a transaction exists for the message.
+        """
+        values = {"status": status.value}
+        if log_id is not None:
+            values["log_id"] = log_id
+
+        query = (
+            MarketTransaction.market_table.update()
+            .where(MarketTransaction.market_table.c.message_id == message_id)
+            .values(**values)
+            .returning(MarketTransaction.market_table.c.message_id)
+        )
+
+        return await bot.query(query, QueryResultType.scalar) is not None
+
+    @staticmethod
     async def get_request(
-        bot: G0T0Bot, message: discord.Message
+        bot: G0T0Bot, message: discord.Message, player: Player = None
     ) -> "MarketTransaction":
+        """
+        Loads the market transaction for a message with a single lookup by message id.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            message (Message): The market message.
+            player (Player, optional): An already loaded player to reuse if they own the transaction.
+        Returns:
+            MarketTransaction: The transaction, or None if the message is not a market request.
+        """
+        query = MarketTransaction.market_table.select().where(
+            MarketTransaction.market_table.c.message_id == message.id
+        )
+
+        row = await bot.query(query)
+
+        if row is None:
+            return await MarketTransaction._load_legacy_request(bot, message)
+
+        if player is None or player.id != row["player_id"]:
+            player = await Player.get_player(bot, row["player_id"], row["guild_id"])
 
+        return await MarketTransaction.MarketSchema(bot, player, message).load(row)
+
+    @staticmethod
+    async def _load_legacy_request(
+        bot: G0T0Bot, message: discord.Message
+    ) -> "MarketTransaction":
+        # Requests posted before transactions were stored are parsed once and saved
         def get_match(pattern, text, group=1, default=None):
             match = re.search(pattern, text, re.DOTALL)
             return (
@@ -65,6 +239,9 @@ class MarketTransaction(object):
         except:
             raise G0T0Error("This is not the command you're looking for. Move along.")
 
+        if not embed.description:
+            return None
+
         player_id = get_match(r"\*\*Player\*\*:\s*<@(\d+)>\n", embed.description)
         char_id = get_match(r"\*\*Character\*\*:.*\[(\d+)\]", embed.description)
         type = get_match(f"(?<=\*\*Type\*\*:)\s(.*?)(?=\n)", embed.description)
@@ -87,11 +264,14 @@ class MarketTransaction(object):
             notes = None
 
         player = await Player.get_player(bot, int(player_id), message.guild.id)
+        character = next(
+            (c for c in player.characters if c.id == int(char_id)), None
+        ) or await PlayerCharacter.get_character(bot, char_id)
 
-        if char_id:
-            character = await PlayerCharacter.get_character(bot, char_id)
-        else:
-            character = None
+        status = RequestStatus.pending
+        for reaction in message.reactions:
+            if reaction.emoji in DENIED_EMOJI:
+                status = RequestStatus.denied
 
         transaction = MarketTransaction(
             player,
@@ -102,6 +282,9 @@ class MarketTransaction(object):
             credits=int(credits.replace(",", "")),
             character=character,
             message=message,
+            status=status,
         )
 
+        await transaction.upsert(bot)
+
         return transaction
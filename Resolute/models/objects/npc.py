@@ -10,7 +10,12 @@ from sqlalchemy.dialects.postgresql import ARRAY, insert
 
 import Resolute.helpers as gh
 from Resolute.models import metadata
-from Resolute.models.objects.enum import QueryResultType, WebhookType
+from Resolute.models.objects.enum import (
+    ContextLevel,
+    QueryResultType,
+    SendPriority,
+    WebhookType,
+)
 
 if TYPE_CHECKING:
     from Resolute.bot import G0T0Bot
@@ -39,7 +44,7 @@ class NonPlayableCharacter(object):
     npc_table = sa.Table(
         "ref_npc",
         metadata,
-        sa.Column("guild_id", sa.Integer, nullable=False),
+        sa.Column("guild_id", sa.BigInteger, nullable=False),
         sa.Column("key", sa.String, nullable=False),
         sa.Column("name", sa.String, nullable=False),
         sa.Column("avatar_url", sa.String, nullable=True),
@@ -119,32 +124,50 @@ class NonPlayableCharacter(object):
     async def send_webhook_message(
         self, ctx: discord.ApplicationContext, content: str
     ) -> None:
-        webhook = await gh.get_webhook(ctx.channel)
-
-        if isinstance(ctx.channel, discord.Thread):
-            await webhook.send(
-                username=self.name,
-                avatar_url=self.avatar_url if self.avatar_url else None,
-                content=content,
-                thread=ctx.channel,
-            )
-
-        else:
-            await webhook.send(
-                username=self.name,
-                avatar_url=self.avatar_url if self.avatar_url else None,
-                content=content,
-            )
+        async def _send():
+            webhook = await gh.get_webhook(ctx.channel)
+
+            if isinstance(ctx.channel, discord.Thread):
+                await webhook.send(
+                    username=self.name,
+                    avatar_url=self.avatar_url if self.avatar_url else None,
+                    content=content,
+                    thread=ctx.channel,
+                )
+
+            else:
+                await webhook.send(
+                    username=self.name,
+                    avatar_url=self.avatar_url if self.avatar_url else None,
+                    content=content,
+                )
+
+        await ctx.bot.send_queue.submit(
+            ctx.channel,
+            _send,
+            SendPriority.user,
+            ctx.bot.send_queue.webhook_bucket(ctx.channel),
+        )
 
     async def edit_webhook_message(
         self, ctx: discord.ApplicationContext, message_id: int, content: str
     ) -> None:
-        webhook = await gh.get_webhook(ctx.channel)
-
-        if isinstance(ctx.channel, discord.Thread):
-            await webhook.edit_message(message_id, content=content, thread=ctx.channel)
-        else:
-            await webhook.edit_message(message_id, content=content)
+        async def _edit():
+            webhook = await gh.get_webhook(ctx.channel)
+
+            if isinstance(ctx.channel, discord.Thread):
+                await webhook.edit_message(
+                    message_id, content=content, thread=ctx.channel
+                )
+            else:
+                await webhook.edit_message(message_id, content=content)
+
+        await ctx.bot.send_queue.submit(
+            ctx.channel,
+            _edit,
+            SendPriority.user,
+            ctx.bot.send_queue.webhook_bucket(ctx.channel),
+        )
 
     async def register_command(self, bot: G0T0Bot):
         async def npc_command(ctx):
@@ -156,7 +179,9 @@ class NonPlayableCharacter(object):
             ).send()
 
         if bot.get_command(self.key) is None:
-            cmd = commands.Command(npc_command, name=self.key)
+            cmd = commands.Command(
+                gh.needs_context(ContextLevel.player)(npc_command), name=self.key
+            )
             cmd.add_check(gh.dm_check)
             bot.add_command(cmd)
 
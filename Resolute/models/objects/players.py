@@ -1,15 +1,17 @@
 from __future__ import annotations
+import asyncio
 import operator
 from typing import TYPE_CHECKING
 
 import json
 import logging
+from datetime import datetime, timezone
 from timeit import default_timer as timer
 
 import discord
 import sqlalchemy as sa
 from marshmallow import Schema, fields, post_load
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.dialects.postgresql import JSONB, insert
 
 from Resolute.helpers.general_helpers import get_selection
 from Resolute.models.embeds import ErrorEmbed
@@ -24,17 +26,22 @@ from Resolute.models.categories.categories import (
     LevelTier,
 )
 from Resolute.models.embeds.arenas import ArenaStatusEmbed
-from Resolute.models.objects.enum import ApplicationType, ArenaPostType, QueryResultType
+from Resolute.models.objects.enum import (
+    ApplicationType,
+    ArenaPostType,
+    QueryResultType,
+    SendPriority,
+)
 from Resolute.models.objects.adventures import Adventure
 from Resolute.models.objects.arenas import Arena
 
 from Resolute.models.objects.characters import (
     PlayerCharacter,
     PlayerCharacterClass,
-    CharacterRenown,
 )
 from Resolute.models.objects.exceptions import G0T0Error
 from Resolute.models.objects.guilds import PlayerGuild
+from Resolute.send_queue import RouteBucket
 
 if TYPE_CHECKING:
     from Resolute.bot import G0T0Bot
@@ -42,6 +49,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Member edits share a per-guild route, so guild-wide resyncs are kept well under it
+ROLE_EDIT_LIMIT = (5, 5.0)
+
 
 class Player(object):
     """
@@ -78,6 +88,9 @@ class Player(object):
         add_to_arena(interaction, character, arena): Adds the player's character to the specified arena.
         can_join_arena(arena_type, character): Checks if the player can join the specified arena.
         create_character(type, new_character, new_class, **kwargs): Creates a new character for the player.
+        manage_player_tier_roles(bot, reason): Applies the player's member and tier roles in a single edit.
+        get_tier_roles(compendium, guild, member, levels): Computes the roles a member should have.
+        resync_guild_tier_roles(bot, guild, reason): Reconciles tier roles for every member of a guild.
     """
 
     player_table = sa.Table(
@@ -111,85 +124,41 @@ class Player(object):
         level_tokens = fields.Integer()
         level_ups_earned = fields.Integer()
 
-        def __init__(self, bot: G0T0Bot, inactive: bool, **kwargs):
+        def __init__(
+            self,
+            bot: G0T0Bot,
+            inactive: bool,
+            load_related: bool = True,
+            load_graph: bool = True,
+            **kwargs,
+        ):
             super().__init__(**kwargs)
             self.bot = bot
             self.inactive = inactive
+            self.load_related = load_related
+            self.load_graph = load_graph
 
         @post_load
         async def make_discord_player(self, data, **kwargs):
             player = Player(self.bot, **data)
-            await self.get_characters(player)
-            await self.get_player_quests(player)
-            await self.get_adventures(player)
-            await self.get_arenas(player)
+            if self.load_related:
+                await self.get_characters(player)
+
+                if self.load_graph:
+                    await self.get_player_quests(player)
+                    await self.get_adventures(player)
+                    await self.get_arenas(player)
             player.member = self.bot.get_guild(player.guild_id).get_member(player.id)
             player.guild = await PlayerGuild.get_player_guild(self.bot, player.guild_id)
             return player
 
         async def get_characters(self, player: "Player") -> None:
-            if self.inactive:
-                query = PlayerCharacter.characters_table.select().where(
-                    sa.and_(
-                        PlayerCharacter.characters_table.c.player_id == player.id,
-                        PlayerCharacter.characters_table.c.guild_id == player.guild_id,
-                    )
-                )
-            else:
-                query = PlayerCharacter.characters_table.select().where(
-                    sa.and_(
-                        PlayerCharacter.characters_table.c.player_id == player.id,
-                        PlayerCharacter.characters_table.c.guild_id == player.guild_id,
-                        PlayerCharacter.characters_table.c.active == True,
-                    )
-                )
-
-            rows = await self.bot.query(query, QueryResultType.multiple)
-
-            character_list: list[PlayerCharacter] = [
-                await PlayerCharacter.CharacterSchema(
-                    self.bot.db, self.bot.compendium
-                ).load(row)
-                for row in rows
-            ]
-
-            for character in character_list:
-                renown_query = (
-                    CharacterRenown.renown_table.select()
-                    .where(CharacterRenown.renown_table.c.character_id == character.id)
-                    .order_by(CharacterRenown.renown_table.c.id.asc())
-                )
-
-                class_query = (
-                    PlayerCharacterClass.character_class_table.select()
-                    .where(
-                        sa.and_(
-                            PlayerCharacterClass.character_class_table.c.character_id
-                            == character.id,
-                            PlayerCharacterClass.character_class_table.c.active == True,
-                        )
-                    )
-                    .order_by(PlayerCharacterClass.character_class_table.c.id.asc())
-                )
-
-                character.classes = [
-                    PlayerCharacterClass.PlayerCharacterClassSchema(
-                        self.bot.db, self.bot.compendium
-                    ).load(row)
-                    for row in await self.bot.query(
-                        class_query, QueryResultType.multiple
-                    )
-                ]
-                character.renown = [
-                    CharacterRenown.RenownSchema(self.bot.db, self.bot.compendium).load(
-                        row
-                    )
-                    for row in await self.bot.query(
-                        renown_query, QueryResultType.multiple
-                    )
-                ]
-
-            player.characters = character_list
+            player.characters = await PlayerCharacter.get_characters(
+                self.bot,
+                player.guild_id,
+                player_ids=[player.id],
+                inactive=self.inactive,
+            )
 
         async def get_player_quests(self, player: "Player") -> None:
             from .logs import DBLog
@@ -232,62 +201,46 @@ class Player(object):
             player.needed_arenas = 1 if player.highest_level_character.level == 1 else 2
 
         async def get_adventures(self, player: "Player") -> None:
-            dm_query = (
-                Adventure.adventures_table.select()
-                .where(
-                    sa.and_(
-                        Adventure.adventures_table.c.dms.contains([player.id]),
-                        Adventure.adventures_table.c.end_ts == sa.null(),
-                    )
-                )
-                .order_by(Adventure.adventures_table.c.id.asc())
-            )
-
-            rows = await self.bot.query(dm_query, QueryResultType.multiple)
+            table = Adventure.adventures_table
+            membership = [table.c.dms.contains([player.id])]
 
-            for character in player.characters:
-                char_query = (
-                    Adventure.adventures_table.select()
-                    .where(
-                        sa.and_(
-                            Adventure.adventures_table.c.characters.contains(
-                                [character.id]
-                            ),
-                            Adventure.adventures_table.c.end_ts == sa.null(),
-                        )
-                    )
-                    .order_by(Adventure.adventures_table.c.id.asc())
+            if player.characters:
+                membership.append(
+                    table.c.characters.overlap([c.id for c in player.characters])
                 )
 
-                rows.extend(await self.bot.query(char_query, QueryResultType.multiple))
-
-            player.adventures.extend(
-                [await Adventure.AdventureSchema(self.bot).load(row) for row in rows]
+            query = (
+                table.select()
+                .where(sa.and_(sa.or_(*membership), table.c.end_ts == sa.null()))
+                .order_by(table.c.id.asc())
             )
 
-        async def get_arenas(self, player: "Player") -> None:
-            rows = []
+            adventures = [
+                await Adventure.AdventureSchema(self.bot, load_related=False).load(row)
+                for row in await self.bot.query(query, QueryResultType.multiple)
+            ]
+            await Adventure.load_related(self.bot, adventures)
 
-            host_arena_query = Arena.arenas_table.select().where(
-                sa.and_(
-                    Arena.arenas_table.c.host_id == player.id,
-                    Arena.arenas_table.c.end_ts == sa.null(),
-                )
-            )
+            player.adventures.extend(adventures)
 
-            rows = await self.bot.query(host_arena_query, QueryResultType.multiple)
+        async def get_arenas(self, player: "Player") -> None:
+            table = Arena.arenas_table
+            membership = [table.c.host_id == player.id]
 
-            for character in player.characters:
-                char_query = Arena.arenas_table.select().where(
-                    sa.and_(
-                        Arena.arenas_table.c.characters.contains([character.id]),
-                        Arena.arenas_table.c.end_ts == sa.null(),
-                    )
+            if player.characters:
+                membership.append(
+                    table.c.characters.overlap([c.id for c in player.characters])
                 )
 
-                rows.extend(await self.bot.query(char_query, QueryResultType.multiple))
+            query = table.select().where(
+                sa.and_(sa.or_(*membership), table.c.end_ts == sa.null())
+            )
 
-            arenas = [await Arena.ArenaSchema(self.bot).load(row) for row in rows]
+            arenas = [
+                await Arena.ArenaSchema(self.bot, load_related=False).load(row)
+                for row in await self.bot.query(query, QueryResultType.multiple)
+            ]
+            await Arena.load_related(self.bot, arenas)
 
             player.arenas.extend(arenas)
 
@@ -371,39 +324,57 @@ class Player(object):
     async def send_webhook_message(
         self, ctx: discord.ApplicationContext, character: PlayerCharacter, content: str
     ) -> None:
-        webhook = await get_webhook(ctx.channel)
-
-        if isinstance(ctx.channel, discord.Thread):
-            await webhook.send(
-                username=f"[{character.level}] {character.name} // {self.member.display_name}",
-                avatar_url=(
-                    self.member.display_avatar.url
-                    if self.member.display_avatar and not character.avatar_url
-                    else None if not character.avatar_url else character.avatar_url
-                ),
-                content=content,
-                thread=ctx.channel,
-            )
-        else:
-            await webhook.send(
-                username=f"[{character.level}] {character.name} // {self.member.display_name}",
-                avatar_url=(
-                    self.member.display_avatar.url
-                    if self.member.display_avatar and not character.avatar_url
-                    else None if not character.avatar_url else character.avatar_url
-                ),
-                content=content,
-            )
+        async def _send():
+            webhook = await get_webhook(ctx.channel)
+
+            if isinstance(ctx.channel, discord.Thread):
+                await webhook.send(
+                    username=f"[{character.level}] {character.name} // {self.member.display_name}",
+                    avatar_url=(
+                        self.member.display_avatar.url
+                        if self.member.display_avatar and not character.avatar_url
+                        else None if not character.avatar_url else character.avatar_url
+                    ),
+                    content=content,
+                    thread=ctx.channel,
+                )
+            else:
+                await webhook.send(
+                    username=f"[{character.level}] {character.name} // {self.member.display_name}",
+                    avatar_url=(
+                        self.member.display_avatar.url
+                        if self.member.display_avatar and not character.avatar_url
+                        else None if not character.avatar_url else character.avatar_url
+                    ),
+                    content=content,
+                )
+
+        await ctx.bot.send_queue.submit(
+            ctx.channel,
+            _send,
+            SendPriority.user,
+            ctx.bot.send_queue.webhook_bucket(ctx.channel),
+        )
 
     async def edit_webhook_message(
         self, ctx: discord.ApplicationContext, message_id: int, content: str
     ) -> None:
-        webhook = await get_webhook(ctx.channel)
+        async def _edit():
+            webhook = await get_webhook(ctx.channel)
 
-        if isinstance(ctx.channel, (discord.Thread, discord.ForumChannel)):
-            await webhook.edit_message(message_id, content=content, thread=ctx.channel)
-        else:
-            await webhook.edit_message(message_id, content=content)
+            if isinstance(ctx.channel, (discord.Thread, discord.ForumChannel)):
+                await webhook.edit_message(
+                    message_id, content=content, thread=ctx.channel
+                )
+            else:
+                await webhook.edit_message(message_id, content=content)
+
+        await ctx.bot.send_queue.submit(
+            ctx.channel,
+            _edit,
+            SendPriority.user,
+            ctx.bot.send_queue.webhook_bucket(ctx.channel),
+        )
 
     async def update_command_count(self, command: str) -> None:
         stats = json.loads(self.statistics if self.statistics else "{}")
@@ -417,7 +388,72 @@ class Player(object):
 
         self.statistics = json.dumps(stats)
 
-        await self.upsert()
+        # Only the statistics change, so skip the reload `upsert` would do
+        query = (
+            Player.player_table.update()
+            .where(
+                sa.and_(
+                    Player.player_table.c.id == self.id,
+                    Player.player_table.c.guild_id == self.guild_id,
+                )
+            )
+            .values(statistics=self.statistics)
+        )
+
+        await self._bot.query(query, QueryResultType.none)
+
+    @staticmethod
+    async def record_command(
+        bot: G0T0Bot, player_id: int, guild_id: int, command: str
+    ) -> None:
+        """
+        Counts a command in a player's statistics in one statement, without loading the player. The player row is
+        created if it doesn't exist yet, as `get_player` would.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            player_id (int): The ID of the player.
+            guild_id (int): The ID of the guild.
+            command (str): The command name.
+        """
+        table = Player.player_table
+        empty = sa.cast("{}", JSONB)
+        stats = sa.func.coalesce(
+            sa.cast(sa.func.nullif(table.c.statistics, ""), JSONB), empty, type_=JSONB
+        )
+        commands = sa.func.coalesce(stats["commands"], empty, type_=JSONB)
+        count = sa.func.coalesce(sa.cast(commands[command].astext, sa.Integer), 0) + 1
+
+        new_stats = stats.op("||", return_type=JSONB)(
+            sa.func.jsonb_build_object(
+                "commands",
+                commands.op("||", return_type=JSONB)(
+                    sa.func.jsonb_build_object(command, count)
+                ),
+            )
+        )
+
+        query = (
+            insert(table)
+            .values(
+                id=player_id,
+                guild_id=guild_id,
+                handicap_amount=0,
+                cc=0,
+                div_cc=0,
+                points=0,
+                activity_points=0,
+                activity_level=0,
+                statistics=json.dumps({"commands": {command: 1}}),
+                level_tokens=0,
+                level_ups_earned=0,
+            )
+            .on_conflict_do_update(
+                index_elements=["id", "guild_id"],
+                set_={"statistics": sa.cast(new_stats, sa.String)},
+            )
+        )
+
+        await bot.query(query, QueryResultType.none)
 
     async def update_post_stats(
         self,
@@ -477,12 +513,6 @@ class Player(object):
     async def remove_arena_board_post(
         self, ctx: discord.ApplicationContext | discord.Interaction
     ) -> None:
-        def predicate(message: discord.Message):
-            if message.author.bot:
-                return message.embeds[0].footer.text == f"{self.id}"
-
-            return message.author == self.member
-
         if self.guild.arena_board_channel:
             if not self.guild.arena_board_channel.permissions_for(
                 ctx.guild.me
@@ -492,12 +522,13 @@ class Player(object):
                 )
 
             try:
-                deleted_message = await self.guild.arena_board_channel.purge(
-                    check=predicate
-                )
-                log.info(
-                    f"{len(deleted_message)} message{'s' if len(deleted_message)>1 else ''} by {self.member.name} deleted from #{self.guild.arena_board_channel.name}"
+                deleted = await ArenaPost.delete_posts(
+                    self._bot, self.guild.arena_board_channel, self.guild_id, self.id
                 )
+                if deleted:
+                    log.info(
+                        f"{deleted} message{'s' if deleted>1 else ''} by {self.member.name} deleted from #{self.guild.arena_board_channel.name}"
+                    )
             except Exception as error:
                 if isinstance(error, discord.HTTPException):
                     await ctx.send(
@@ -670,92 +701,172 @@ class Player(object):
 
         return player
 
-    async def get_stats(self, bot: G0T0Bot) -> dict:
+    async def get_stats(self, bot: G0T0Bot) -> tuple[dict, dict[int, dict]]:
+        """
+        Aggregates the player's valid logs in the guild with a single query grouped by character.
+        Player totals are summed from the per-character rows, so logs without a character still count
+        towards them.
+        Args:
+            bot (G0T0Bot): The bot instance.
+        Returns:
+            tuple[dict, dict[int, dict]]: The player totals, and the totals for each character keyed by character ID.
+        """
         from .logs import DBLog
 
+        log_table = DBLog.log_table
         new_character_activity = bot.compendium.get_activity("NEW_CHARACTER")
+        conversion_activity = bot.compendium.get_activity("CONVERSION")
         activities = [
             x
             for x in bot.compendium.get_values(Activity)
             if x.value in ["RP", "ARENA", "ARENA_HOST", "GLOBAL", "SNAPSHOT"]
         ]
-        columns = [
-            sa.func.sum(
-                sa.case([(DBLog.log_table.c.activity == act.id, 1)], else_=0)
-            ).label(f"Activity {act.value}")
-            for act in activities
-        ]
 
+        def _sum(column, *conditions):
+            return sa.func.coalesce(sa.func.sum(column).filter(sa.and_(*conditions)), 0)
+
+        starting = log_table.c.activity == new_character_activity.id
+        not_starting = log_table.c.activity != new_character_activity.id
+
+        # Earned sums the positive entries of a column and spent the negative ones of the same column
         query = (
             sa.select(
-                DBLog.log_table.c.player_id,
-                sa.func.count(DBLog.log_table.c.id).label("#"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    DBLog.log_table.c.cc > 0,
-                                    DBLog.log_table.c.activity
-                                    != new_character_activity.id,
-                                ),
-                                DBLog.log_table.c.cc,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("debt"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    DBLog.log_table.c.cc < 0,
-                                    DBLog.log_table.c.activity
-                                    != new_character_activity.id,
-                                ),
-                                DBLog.log_table.c.cc,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("credit"),
-                sa.func.sum(
-                    sa.case(
-                        [
-                            (
-                                sa.and_(
-                                    DBLog.log_table.c.cc > 0,
-                                    DBLog.log_table.c.activity
-                                    == new_character_activity.id,
-                                ),
-                                DBLog.log_table.c.cc,
-                            )
-                        ],
-                        else_=0,
-                    )
-                ).label("starting"),
-                *columns,
+                log_table.c.character_id,
+                sa.func.count(log_table.c.id).label("#"),
+                _sum(log_table.c.cc, log_table.c.cc > 0, not_starting).label("cc debt"),
+                _sum(log_table.c.cc, log_table.c.cc < 0, not_starting).label(
+                    "cc credit"
+                ),
+                _sum(log_table.c.cc, log_table.c.cc > 0, starting).label("cc starting"),
+                _sum(log_table.c.credits, log_table.c.credits > 0, not_starting).label(
+                    "credit debt"
+                ),
+                _sum(log_table.c.credits, log_table.c.credits < 0, not_starting).label(
+                    "credit credit"
+                ),
+                _sum(log_table.c.credits, log_table.c.credits > 0, starting).label(
+                    "credit starting"
+                ),
+                _sum(
+                    log_table.c.credits,
+                    log_table.c.activity == conversion_activity.id,
+                ).label("credits converted"),
+                *[
+                    sa.func.count(log_table.c.id)
+                    .filter(log_table.c.activity == act.id)
+                    .label(f"Activity {act.value}")
+                    for act in activities
+                ],
             )
-            .group_by(DBLog.log_table.c.player_id)
             .where(
                 sa.and_(
-                    DBLog.log_table.c.player_id == self.id,
-                    DBLog.log_table.c.guild_id == self.guild_id,
-                    DBLog.log_table.c.invalid == False,
+                    log_table.c.player_id == self.id,
+                    log_table.c.guild_id == self.guild_id,
+                    log_table.c.invalid == False,
                 )
             )
+            .group_by(log_table.c.character_id)
         )
 
-        row = await bot.query(query)
+        rows = await bot.query(query, QueryResultType.multiple)
+
+        player_stats = {
+            "#": 0,
+            "debt": 0,
+            "credit": 0,
+            "starting": 0,
+            **{f"Activity {act.value}": 0 for act in activities},
+        }
+        character_stats = {}
 
-        return dict(row)
+        for row in rows:
+            stats = dict(row)
+            character_id = stats.pop("character_id")
+
+            player_stats["#"] += stats["#"]
+            player_stats["debt"] += stats["cc debt"]
+            player_stats["credit"] += stats["cc credit"]
+            player_stats["starting"] += stats["cc starting"]
+
+            for act in activities:
+                player_stats[f"Activity {act.value}"] += stats.pop(
+                    f"Activity {act.value}"
+                )
+
+            if character_id is not None:
+                character_stats[character_id] = stats
+
+        return player_stats, character_stats
+
+    @staticmethod
+    async def get_players(
+        bot: G0T0Bot, player_ids: list[int], guild_id: int, **kwargs
+    ) -> dict[int, "Player"]:
+        """
+        Loads many players in a guild at once for bulk operations such as global or arena payouts.
+        Players and their characters (with classes and renown) are fetched with a fixed number of queries.
+        Quests, adventures and arenas are not loaded.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            player_ids (list[int]): The IDs of the players to load.
+            guild_id (int): The ID of the guild.
+        Keyword Args:
+            inactive (bool): Include inactive characters. Defaults to False.
+            create (bool): Return new, unsaved players for IDs with no row. Defaults to True.
+        Returns:
+            dict[int, Player]: The players keyed by ID.
+        """
+        inactive = kwargs.get("inactive", False)
+        create = kwargs.get("create", True)
+        player_ids = list(set(player_ids))
+
+        if not player_ids:
+            return {}
+
+        query = Player.player_table.select().where(
+            sa.and_(
+                Player.player_table.c.id.in_(player_ids),
+                Player.player_table.c.guild_id == guild_id,
+            )
+        )
+
+        players: dict[int, Player] = {}
+        for row in await bot.query(query, QueryResultType.multiple):
+            player: Player = await Player.PlayerSchema(
+                bot, inactive, load_related=False
+            ).load(row)
+            players[player.id] = player
+
+        if create:
+            guild = await PlayerGuild.get_player_guild(bot, guild_id)
+            discord_guild = bot.get_guild(guild_id)
+            for player_id in player_ids:
+                if player_id not in players:
+                    players[player_id] = Player(
+                        bot,
+                        player_id,
+                        guild_id,
+                        guild=guild,
+                        member=(
+                            discord_guild.get_member(player_id)
+                            if discord_guild
+                            else None
+                        ),
+                    )
+
+        for character in await PlayerCharacter.get_characters(
+            bot, guild_id, player_ids=list(players.keys()), inactive=inactive
+        ):
+            players[character.player_id].characters.append(character)
+
+        return players
 
     @staticmethod
     async def get_player(
         bot: G0T0Bot, player_id: int, guild_id: int = None, **kwargs
     ) -> "Player":
         inactive = kwargs.get("inactive", False)
+        graph = kwargs.get("graph", True)
         lookup_only = kwargs.get("lookup_only", False)
         ctx = kwargs.get("ctx")
 
@@ -829,7 +940,9 @@ class Player(object):
         else:
             # One match found
             if len(rows) == 1:
-                player = await Player.PlayerSchema(bot, inactive).load(rows[0])
+                player = await Player.PlayerSchema(
+                    bot, inactive, load_graph=graph
+                ).load(rows[0])
 
             # Multiple matches
             else:
@@ -840,7 +953,9 @@ class Player(object):
                         row = filter(
                             lambda p: p["guild_id"] == str(guilds[0].id), guilds
                         )
-                        player = await Player.PlayerSchema(bot, inactive).load(row)
+                        player = await Player.PlayerSchema(
+                            bot, inactive, load_graph=graph
+                        ).load(row)
                         # player = await Player.get_player(bot, player_id, guilds[0].id, **kwargs)
 
                     else:
@@ -940,56 +1055,112 @@ class Player(object):
             await self.upsert()
 
     async def manage_player_tier_roles(self, bot: G0T0Bot, reason: str = None) -> None:
+        roles = Player.get_tier_roles(
+            bot.compendium,
+            self.guild,
+            self.member,
+            [c.level for c in self.characters] if hasattr(self, "characters") else [],
+        )
+
+        if roles is not None:
+            await self.member.edit(roles=roles, reason=reason)
+
+    @staticmethod
+    def get_tier_roles(
+        compendium: Compendium,
+        guild: PlayerGuild,
+        member: discord.Member,
+        levels: list[int],
+    ) -> list[discord.Role] | None:
+        """
+        Computes the role set a member should have based on their active character levels.
+        The member role is granted once a character reaches level 3 but never removed here. Tier roles
+        are granted for every tier a character is in and removed otherwise.
+        Args:
+            compendium (Compendium): The compendium used to look up level tiers.
+            guild (PlayerGuild): The guild the member belongs to.
+            member (Member): The member to compute roles for.
+            levels (list[int]): The levels of the member's active characters.
+        Returns:
+            list[Role] | None: The full list of roles for the member, or None if nothing needs to change.
+        """
+        current = {r for r in member.roles if not r.is_default()}
+        desired = set(current)
+        tiers = {compendium.get_object(LevelTier, level).tier for level in levels}
+
         # Primary Role handling
-        if self.highest_level_character and self.highest_level_character.level >= 3:
-            if (
-                self.guild.member_role
-                and self.guild.member_role not in self.member.roles
-            ):
-                await self.member.add_roles(self.guild.member_role, reason=reason)
+        if guild.member_role and levels and max(levels) >= 3:
+            desired.add(guild.member_role)
 
         # Character Tier Roles
-        if self.guild.entry_role:
-            if self.has_character_in_tier(bot.compendium, 1):
-                if self.guild.entry_role not in self.member.roles:
-                    await self.member.add_roles(self.guild.entry_role, reason=reason)
-            elif self.guild.entry_role in self.member.roles:
-                await self.member.remove_roles(self.guild.entry_role, reason=reason)
-
-        if self.guild.tier_2_role:
-            if self.has_character_in_tier(bot.compendium, 2):
-                if self.guild.tier_2_role not in self.member.roles:
-                    await self.member.add_roles(self.guild.tier_2_role, reason=reason)
-            elif self.guild.tier_2_role in self.member.roles:
-                await self.member.remove_roles(self.guild.tier_2_role, reason=reason)
-
-        if self.guild.tier_3_role:
-            if self.has_character_in_tier(bot.compendium, 3):
-                if self.guild.tier_3_role not in self.member.roles:
-                    await self.member.add_roles(self.guild.tier_3_role, reason=reason)
-            elif self.guild.tier_3_role in self.member.roles:
-                await self.member.remove_roles(self.guild.tier_3_role, reason=reason)
-
-        if self.guild.tier_4_role:
-            if self.has_character_in_tier(bot.compendium, 4):
-                if self.guild.tier_4_role not in self.member.roles:
-                    await self.member.add_roles(self.guild.tier_4_role, reason=reason)
-            elif self.guild.tier_4_role in self.member.roles:
-                await self.member.remove_roles(self.guild.tier_4_role, reason=reason)
-
-        if self.guild.tier_5_role:
-            if self.has_character_in_tier(bot.compendium, 5):
-                if self.guild.tier_5_role not in self.member.roles:
-                    await self.member.add_roles(self.guild.tier_5_role, reason=reason)
-            elif self.guild.tier_5_role in self.member.roles:
-                await self.member.remove_roles(self.guild.tier_5_role, reason=reason)
-
-        if self.guild.tier_6_role:
-            if self.has_character_in_tier(bot.compendium, 6):
-                if self.guild.tier_6_role not in self.member.roles:
-                    await self.member.add_roles(self.guild.tier_6_role, reason=reason)
-            elif self.guild.tier_6_role in self.member.roles:
-                await self.member.remove_roles(self.guild.tier_6_role, reason=reason)
+        for tier, role in guild.tier_roles.items():
+            if tier in tiers:
+                desired.add(role)
+            else:
+                desired.discard(role)
+
+        if desired == current:
+            return None
+
+        return sorted(desired, key=lambda r: r.position)
+
+    @staticmethod
+    async def resync_guild_tier_roles(
+        bot: G0T0Bot, guild: PlayerGuild, reason: str = None
+    ) -> int:
+        """
+        Reconciles tier roles for every member of a guild.
+        Character levels for the whole guild are loaded with a single query and each member's role diff is
+        computed in memory, so members without any active characters lose their tier roles. Only members whose roles differ are edited, one request at a time through a
+        rate limited bucket.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            guild (PlayerGuild): The guild to resync.
+            reason (str, optional): The audit log reason for the role changes.
+        Returns:
+            int: The number of members whose roles were updated.
+        """
+        query = sa.select(
+            PlayerCharacter.characters_table.c.player_id,
+            PlayerCharacter.characters_table.c.level,
+        ).where(
+            sa.and_(
+                PlayerCharacter.characters_table.c.guild_id == guild.id,
+                PlayerCharacter.characters_table.c.active == True,
+            )
+        )
+
+        levels: dict[int, list[int]] = {}
+        for row in await bot.query(query, QueryResultType.multiple):
+            levels.setdefault(row["player_id"], []).append(row["level"])
+
+        # Members without active characters are included so their stale tier roles are removed
+        changes: list[tuple[discord.Member, list[discord.Role]]] = []
+        for member in guild.guild.members:
+            roles = Player.get_tier_roles(
+                bot.compendium, guild, member, levels.get(member.id, [])
+            )
+            if roles is not None:
+                changes.append((member, roles))
+
+        bucket = RouteBucket(*ROLE_EDIT_LIMIT)
+        updated = 0
+
+        for member, roles in changes:
+            if delay := bucket.delay():
+                await asyncio.sleep(delay)
+
+            bucket.record()
+
+            try:
+                await member.edit(roles=roles, reason=reason)
+                updated += 1
+            except discord.HTTPException as error:
+                log.warning(
+                    f"Unable to update tier roles for {member.name} [{member.id}] in {guild.guild.name}: {error}"
+                )
+
+        return updated
 
 
 class ArenaPost(object):
@@ -1005,8 +1176,26 @@ class ArenaPost(object):
         characters (list[PlayerCharacter], optional): A list of characters associated with the player. Defaults to an empty list.
         *args: Additional positional arguments.
         **kwargs: Additional keyword arguments.
+    Methods:
+        register(bot, guild_id, player_id, message_id):
+            Records an arena board message as belonging to the player.
+        unregister(bot, message_ids):
+            Removes arena board messages from the registry.
+        get_guild_posts(bot, guild_id) -> dict[int, int]:
+            Returns every registered arena board message for the guild, keyed by message id.
+        delete_posts(bot, channel, guild_id, player_id) -> int:
+            Deletes the player's registered arena board messages by id.
     """
 
+    arena_board_table = sa.Table(
+        "ref_arena_board_posts",
+        metadata,
+        sa.Column("message_id", sa.BigInteger, primary_key=True),
+        sa.Column("guild_id", sa.BigInteger, nullable=False),
+        sa.Column("player_id", sa.BigInteger, nullable=False),
+        sa.Index("idx_arena_board_player", "guild_id", "player_id"),
+    )
+
     def __init__(
         self, player: Player, characters: list[PlayerCharacter] = [], *args, **kwargs
     ):
@@ -1016,6 +1205,82 @@ class ArenaPost(object):
 
         self.message: discord.Message = kwargs.get("message")
 
+    @staticmethod
+    async def register(
+        bot: G0T0Bot, guild_id: int, player_id: int, message_id: int
+    ) -> None:
+        query = (
+            insert(ArenaPost.arena_board_table)
+            .values(message_id=message_id, guild_id=guild_id, player_id=player_id)
+            .on_conflict_do_update(
+                index_elements=["message_id"], set_={"player_id": player_id}
+            )
+        )
+
+        await bot.query(query, QueryResultType.none)
+
+    @staticmethod
+    async def unregister(bot: G0T0Bot, message_ids: list[int]) -> None:
+        if not message_ids:
+            return
+
+        query = ArenaPost.arena_board_table.delete().where(
+            ArenaPost.arena_board_table.c.message_id.in_(list(message_ids))
+        )
+
+        await bot.query(query, QueryResultType.none)
+
+    @staticmethod
+    async def get_guild_posts(bot: G0T0Bot, guild_id: int) -> dict[int, int]:
+        query = ArenaPost.arena_board_table.select().where(
+            ArenaPost.arena_board_table.c.guild_id == guild_id
+        )
+
+        rows = await bot.query(query, QueryResultType.multiple)
+
+        return {row["message_id"]: row["player_id"] for row in rows}
+
+    @staticmethod
+    async def delete_posts(
+        bot: G0T0Bot, channel: discord.TextChannel, guild_id: int, player_id: int
+    ) -> int:
+        """
+        Deletes a player's arena board posts using the message ids recorded when they were posted.
+        Messages that are already gone are dropped from the registry as well.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            channel (TextChannel): The guild's arena board channel.
+            guild_id (int): The ID of the guild.
+            player_id (int): The ID of the player whose posts should be removed.
+        Returns:
+            int: The number of messages deleted.
+        Raises:
+            HTTPException: If deleting a message fails for any reason other than it not existing.
+        """
+        query = ArenaPost.arena_board_table.select().where(
+            sa.and_(
+                ArenaPost.arena_board_table.c.guild_id == guild_id,
+                ArenaPost.arena_board_table.c.player_id == player_id,
+            )
+        )
+
+        rows = await bot.query(query, QueryResultType.multiple)
+        deleted = []
+        count = 0
+
+        try:
+            for row in rows:
+                try:
+                    await channel.get_partial_message(row["message_id"]).delete()
+                    count += 1
+                except discord.NotFound:
+                    pass
+                deleted.append(row["message_id"])
+        finally:
+            await ArenaPost.unregister(bot, deleted)
+
+        return count
+
 
 class RPPost(object):
     """
@@ -1030,8 +1295,115 @@ class RPPost(object):
     -------
     __init__(character: PlayerCharacter, *args, **kwargs)
         Initializes the RPPost with a character and optional note.
+    register(bot, message, player_id)
+        Records an RP board message with its created timestamp.
+    register_many(bot, posts)
+        Records several RP board messages with a single insert.
+    is_backfilled(bot, guild_id) -> bool
+        Returns whether the guild's RP board history has been fully registered.
+    mark_backfilled(bot, guild_id)
+        Records that the guild's RP board history has been fully registered.
+    get_expired(bot, guild_id, cutoff) -> list[int]
+        Returns the ids of the guild's RP board messages created before the cutoff.
+    unregister(bot, message_ids)
+        Removes RP board messages from the registry.
     """
 
+    rp_board_table = sa.Table(
+        "ref_rp_board_posts",
+        metadata,
+        sa.Column("message_id", sa.BigInteger, primary_key=True),
+        sa.Column("guild_id", sa.BigInteger, nullable=False),
+        sa.Column("channel_id", sa.BigInteger, nullable=False),
+        sa.Column("player_id", sa.BigInteger, nullable=False),
+        sa.Column("created_ts", sa.TIMESTAMP(timezone=timezone.utc), nullable=False),
+        sa.Index("idx_rp_board_created", "guild_id", "created_ts"),
+    )
+
+    rp_board_backfill_table = sa.Table(
+        "ref_rp_board_backfill",
+        metadata,
+        sa.Column("guild_id", sa.BigInteger, primary_key=True),
+        sa.Column("completed_ts", sa.TIMESTAMP(timezone=timezone.utc), nullable=False),
+    )
+
     def __init__(self, character: PlayerCharacter, *args, **kwargs):
         self.character = character
         self.note = kwargs.get("note")
+
+    @staticmethod
+    async def register(bot: G0T0Bot, message: discord.Message, player_id: int) -> None:
+        await RPPost.register_many(bot, [(message, player_id)])
+
+    @staticmethod
+    async def register_many(
+        bot: G0T0Bot, posts: list[tuple[discord.Message, int]]
+    ) -> None:
+        if not posts:
+            return
+
+        # Edits keep the original timestamp so a post still expires relative to when it was made
+        query = (
+            insert(RPPost.rp_board_table)
+            .values(
+                [
+                    {
+                        "message_id": message.id,
+                        "guild_id": message.guild.id,
+                        "channel_id": message.channel.id,
+                        "player_id": player_id,
+                        "created_ts": message.created_at,
+                    }
+                    for message, player_id in posts
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["message_id"])
+        )
+
+        await bot.query(query, QueryResultType.none)
+
+    @staticmethod
+    async def is_backfilled(bot: G0T0Bot, guild_id: int) -> bool:
+        query = sa.select(
+            sa.exists().where(RPPost.rp_board_backfill_table.c.guild_id == guild_id)
+        )
+
+        return await bot.query(query, QueryResultType.scalar)
+
+    @staticmethod
+    async def mark_backfilled(bot: G0T0Bot, guild_id: int) -> None:
+        query = (
+            insert(RPPost.rp_board_backfill_table)
+            .values(guild_id=guild_id, completed_ts=datetime.now(timezone.utc))
+            .on_conflict_do_nothing(index_elements=["guild_id"])
+        )
+
+        await bot.query(query, QueryResultType.none)
+
+    @staticmethod
+    async def get_expired(bot: G0T0Bot, guild_id: int, cutoff: datetime) -> list[int]:
+        query = (
+            sa.select(RPPost.rp_board_table.c.message_id)
+            .where(
+                sa.and_(
+                    RPPost.rp_board_table.c.guild_id == guild_id,
+                    RPPost.rp_board_table.c.created_ts < cutoff,
+                )
+            )
+            .order_by(RPPost.rp_board_table.c.created_ts.asc())
+        )
+
+        rows = await bot.query(query, QueryResultType.multiple)
+
+        return [row["message_id"] for row in rows]
+
+    @staticmethod
+    async def unregister(bot: G0T0Bot, message_ids: list[int]) -> None:
+        if not message_ids:
+            return
+
+        query = RPPost.rp_board_table.delete().where(
+            RPPost.rp_board_table.c.message_id.in_(list(message_ids))
+        )
+
+        await bot.query(query, QueryResultType.none)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+import asyncio
+import logging
+
 import aiopg.sa
 import discord
 import sqlalchemy as sa
@@ -12,12 +15,20 @@ from Resolute.compendium import Compendium
 from Resolute.models import metadata
 from Resolute.models.categories.categories import Faction
 from Resolute.models.objects.characters import PlayerCharacter
-from Resolute.models.objects.enum import QueryResultType
+from Resolute.models.objects.enum import QueryResultType, SendPriority
 from Resolute.models.objects.guilds import PlayerGuild
 
 if TYPE_CHECKING:
     from Resolute.bot import G0T0Bot
 
+log = logging.getLogger(__name__)
+
+# Number of scraped messages between checkpoints
+CHECKPOINT_INTERVAL = 500
+
+# Number of channels scraped at the same time in a single job
+SCRAPE_WORKERS = 4
+
 
 class Shatterpoint(object):
     """
@@ -38,8 +49,13 @@ class Shatterpoint(object):
             Asynchronously inserts or updates the shatterpoint in the database.
         delete():
             Asynchronously deletes the shatterpoint and its associated players and renown from the database.
+        scrape_channels(bot, channels: list[TextChannel|Thread|ForumChannel], guild: PlayerGuild, user: User):
+            Asynchronously scrapes several channels concurrently with a bounded number of workers, streaming each
+            channel's history and checkpointing progress so an interrupted scrape resumes where it stopped.
         scrape_channel(bot, channel: TextChannel|Thread|ForumChannel, guild: PlayerGuild, user: User):
-            Asynchronously scrapes messages from a specified channel, updates player data, and persists changes to the database.
+            Asynchronously scrapes a single channel.
+        save_checkpoint(checkpoint: ShatterpointCheckpoint, tallies: dict[int, ScrapeTally]):
+            Asynchronously applies a channel's tallies and advances its checkpoint in a single transaction.
     """
 
     ref_gb_staging_table = sa.Table(
@@ -158,20 +174,63 @@ class Shatterpoint(object):
             ShatterpointRenown.ref_gb_renown_table.c.guild_id == self.guild_id
         )
 
+        checkpoint_query = (
+            ShatterpointCheckpoint.ref_gb_scrape_checkpoint_table.delete().where(
+                ShatterpointCheckpoint.ref_gb_scrape_checkpoint_table.c.guild_id
+                == self.guild_id
+            )
+        )
+
         async with self._db.acquire() as conn:
             await conn.execute(shatterpoint_query)
             await conn.execute(player_query)
             await conn.execute(renown_query)
+            await conn.execute(checkpoint_query)
 
-    async def scrape_channel(
+    async def scrape_channels(
         self,
         bot: G0T0Bot,
-        channel: discord.TextChannel | discord.Thread | discord.ForumChannel,
+        channels: list[discord.TextChannel | discord.Thread | discord.ForumChannel],
         guild: PlayerGuild,
         user: discord.User,
     ) -> None:
-        messages: list[discord.Message] = []
-        channels = self.channels
+        """
+        Scrapes several channels at once, with at most `SCRAPE_WORKERS` channels streaming at a time.
+        Each channel tallies into its own `ScrapeTally` set. Every `CHECKPOINT_INTERVAL` messages, and when the
+        channel finishes, the tallies are added to the player rows in the same transaction that advances that
+        channel's checkpoint. A message is therefore only counted once, even if the scrape is interrupted or a
+        channel is scraped again. Progress for every channel is reported to the user in a single DM that is
+        edited as checkpoints are written.
+        Args:
+            bot (G0T0Bot): The bot instance.
+            channels (list[TextChannel | Thread | ForumChannel]): The channels to scrape.
+            guild (PlayerGuild): The guild the shatterpoint belongs to.
+            user (User): The user who started the scrape. Notified of progress and when finished.
+        """
+        channels = list({c.id: c for c in channels}.values())
+        characters = await guild.get_all_characters(bot.compendium)
+        characters_by_name: dict[str, PlayerCharacter] = {}
+        for character in characters:
+            characters_by_name.setdefault(normalize_name(character.name), character)
+
+        semaphore = asyncio.Semaphore(SCRAPE_WORKERS)
+        progress: dict[int, str] = {c.id: "Queued" for c in channels}
+        progress_message: discord.Message = None
+
+        def progress_content() -> str:
+            return (
+                f"**{self.name}**: Scraping {len(channels)} channel(s)\n"
+                + "\n".join([f"{c.jump_url}: {progress[c.id]}" for c in channels])
+            )
+
+        async def report_progress() -> None:
+            if progress_message:
+                content = progress_content()
+                await bot.send_queue.submit(
+                    progress_message.channel,
+                    lambda: progress_message.edit(content=content),
+                    SendPriority.background,
+                )
 
         def get_char_name_from_message(message: discord.Message) -> str:
             try:
@@ -183,75 +242,142 @@ class Shatterpoint(object):
 
             return char_name
 
-        try:
-            while True:
-                last_message: discord.Message = messages[-1] if messages else None
-                batch = await channel.history(limit=600, before=last_message).flatten()
-
-                if not batch:
-                    break
-
-                messages.extend(batch)
-        except Exception as e:
-            print(e)
-
-        print(len(messages))
-        characters = await guild.get_all_characters(bot.compendium)
-
-        for message in messages:
-            player: ShatterpointPlayer = None
-            if not message.author.bot:
-                player = next(
-                    (p for p in self.players if p.player_id == message.author.id),
-                    ShatterpointPlayer(
-                        bot.db,
-                        guild_id=self.guild_id,
-                        player_id=message.author.id,
-                        cc=self.base_cc,
-                    ),
+        async def scrape(
+            channel: discord.TextChannel | discord.Thread | discord.ForumChannel,
+        ) -> bool:
+            async with semaphore:
+                checkpoint = await ShatterpointCheckpoint.get_checkpoint(
+                    bot, self.guild_id, channel.id
+                ) or ShatterpointCheckpoint(
+                    bot.db, guild_id=self.guild_id, channel_id=channel.id
                 )
-            elif (char_name := get_char_name_from_message(message)) and (
-                character := next(
-                    (c for c in characters if c.name.lower() == char_name.lower()), None
+                checkpoint.complete = False
+                await checkpoint.upsert()
+
+                tallies: dict[int, ScrapeTally] = {}
+                scraped = 0
+
+                try:
+                    async for message in channel.history(
+                        limit=None,
+                        after=(
+                            discord.Object(checkpoint.last_message_id)
+                            if checkpoint.last_message_id
+                            else None
+                        ),
+                        oldest_first=True,
+                    ):
+                        player_id, character = None, None
+
+                        if not message.author.bot:
+                            player_id = message.author.id
+                        elif (char_name := get_char_name_from_message(message)) and (
+                            character := characters_by_name.get(
+                                normalize_name(char_name)
+                            )
+                        ):
+                            player_id = character.player_id
+
+                        if player_id:
+                            tally = tallies.setdefault(player_id, ScrapeTally())
+                            tally.num_messages += 1
+
+                            if character:
+                                tally.characters.add(character.id)
+
+                        checkpoint.last_message_id = message.id
+                        checkpoint.num_messages += 1
+                        scraped += 1
+
+                        if scraped % CHECKPOINT_INTERVAL == 0:
+                            await self.save_checkpoint(checkpoint, tallies)
+                            tallies = {}
+                            progress[channel.id] = (
+                                f"{checkpoint.num_messages:,} messages"
+                            )
+                            await report_progress()
+
+                    checkpoint.complete = True
+                except Exception as error:
+                    log.error(
+                        f"Shatterpoint [{self.guild_id}]: Error scraping {channel.id} after message {checkpoint.last_message_id}: {error}"
+                    )
+
+                await self.save_checkpoint(checkpoint, tallies)
+
+                progress[channel.id] = (
+                    f"Done - {scraped:,} new messages ({checkpoint.num_messages:,} total)"
+                    if checkpoint.complete
+                    else f"Stopped after {checkpoint.num_messages:,} messages. Scrape again to resume"
                 )
-            ):
-                player = next(
-                    (p for p in self.players if p.player_id == character.player_id),
-                    ShatterpointPlayer(
-                        bot.db,
-                        guild_id=self.guild_id,
-                        player_id=character.player_id,
-                        cc=self.base_cc,
-                    ),
+                await report_progress()
+                log.info(
+                    f"Shatterpoint [{self.guild_id}]: Scraped {scraped:,} messages in {channel.id}"
                 )
-                if character.id not in player.characters:
-                    player.characters.append(character.id)
 
-            if player:
-                player.num_messages += 1
+                return checkpoint.complete
 
-                if message.channel not in player.channels:
-                    player.channels.append(message.channel)
+        try:
+            progress_message = await user.send(progress_content())
+        except discord.HTTPException:
+            pass
 
-                if player.player_id not in [p.player_id for p in self.players]:
-                    self.players.append(player)
+        results = await asyncio.gather(
+            *[scrape(c) for c in channels], return_exceptions=True
+        )
 
-        if message.channel not in channels:
-            channels.append(message.channel)
+        for channel, result in zip(channels, results):
+            if isinstance(result, Exception):
+                log.error(
+                    f"Shatterpoint [{self.guild_id}]: Failed to checkpoint {channel.id}: {result}"
+                )
 
         shatterpoint = await Shatterpoint.get_shatterpoint(bot, self.guild_id)
         shatterpoint.busy_member = None
-        for c in channels:
-            if c not in shatterpoint.channels:
-                shatterpoint.channels.append(c)
+        for channel in channels:
+            if channel not in shatterpoint.channels:
+                shatterpoint.channels.append(channel)
 
         await shatterpoint.upsert()
-        for p in self.players:
-            await p.upsert()
 
-        await user.send(
-            f"**{shatterpoint.name}**: Finished scraping {len(messages):,} messages in {channel.jump_url}"
-        )
+        self.players = shatterpoint.players
+        self.channels = shatterpoint.channels
+
+        await user.send(f"**{shatterpoint.name}**: Finished scraping")
+
+    async def scrape_channel(
+        self,
+        bot: G0T0Bot,
+        channel: discord.TextChannel | discord.Thread | discord.ForumChannel,
+        guild: PlayerGuild,
+        user: discord.User,
+    ) -> None:
+        await self.scrape_channels(bot, [channel], guild, user)
+
+    async def save_checkpoint(
+        self,
+        checkpoint: "ShatterpointCheckpoint",
+        tallies: dict[int, "ScrapeTally"],
+    ) -> None:
+        """
+        Adds a channel's tallies to the player rows and advances the channel checkpoint in a single transaction,
+        so the checkpoint never gets ahead of, or falls behind, the messages it covers.
+        Args:
+            checkpoint (ShatterpointCheckpoint): The channel checkpoint.
+            tallies (dict[int, ScrapeTally]): Tallies keyed by player id since the last checkpoint.
+        """
+        async with self._db.acquire() as conn:
+            async with conn.begin():
+                if tallies:
+                    await conn.execute(
+                        ShatterpointPlayer.add_tallies_query(
+                            self.guild_id,
+                            checkpoint.channel_id,
+                            self.base_cc,
+                            tallies,
+                        )
+                    )
+                await conn.execute(checkpoint.upsert_query())
 
     @staticmethod
     async def get_shatterpoint(bot: G0T0Bot, guild_id: int) -> "Shatterpoint":
@@ -300,7 +426,11 @@ class ShatterpointPlayer(object):
         renown_override (Optional[int]): Override value for the player's renown.
         player_characters (list[PlayerCharacter]): List of PlayerCharacter objects associated with the player. Defaults to an empty list.
     Methods:
+        upsert_query(): Builds the insert/update query for the player record.
         upsert(): Inserts or updates the player record in the database.
+        bulk_upsert_query(players): Builds a single multi-row insert/update query for many players.
+        bulk_upsert(db, players): Inserts or updates many player records in one statement.
+        add_tallies_query(guild_id, channel_id, base_cc, tallies): Builds a query that adds scraped tallies to player records.
     """
 
     ref_gb_staging_player_table = sa.Table(
@@ -383,7 +513,7 @@ class ShatterpointPlayer(object):
 
         self.member: discord.Member = kwargs.get("member")
 
-    async def upsert(self) -> None:
+    def upsert_query(self):
         update_dict = {
             "cc": self.cc,
             "renown_override": self.renown_override,
@@ -410,8 +540,128 @@ class ShatterpointPlayer(object):
             index_elements=["guild_id", "player_id"], set_=update_dict
         )
 
+        return query
+
+    async def upsert(self) -> None:
         async with self._db.acquire() as conn:
-            await conn.execute(query)
+            await conn.execute(self.upsert_query())
+
+    @staticmethod
+    def bulk_upsert_query(players: list["ShatterpointPlayer"]):
+        """
+        Builds a single multi-row insert/update query for the given players.
+        Args:
+            players (list[ShatterpointPlayer]): The players to write. Must not be empty.
+        Returns:
+            Insert: The insert query with an on conflict update of every player column.
+        """
+        table = ShatterpointPlayer.ref_gb_staging_player_table
+        query = insert(table).values(
+            [
+                {
+                    "guild_id": p.guild_id,
+                    "player_id": p.player_id,
+                    "cc": p.cc,
+                    "renown_override": p.renown_override,
+                    "num_messages": p.num_messages,
+                    "channels": [c.id for c in p.channels] if p.channels else [],
+                    "update": p.update,
+                    "active": p.active,
+                    "characters": p.characters,
+                }
+                for p in players
+            ]
+        )
+
+        return query.on_conflict_do_update(
+            index_elements=["guild_id", "player_id"],
+            set_={
+                c.name: query.excluded[c.name]
+                for c in table.columns
+                if c.name not in ["guild_id", "player_id"]
+            },
+        )
+
+    @staticmethod
+    def add_tallies_query(
+        guild_id: int, channel_id: int, base_cc: int, tallies: dict[int, "ScrapeTally"]
+    ):
+        """
+        Builds a single multi-row query that adds scraped tallies to the player rows. Message counts are
+        incremented and channels/characters are unioned in the database, so concurrent channel scrapes
+        never overwrite each other's counts.
+        Args:
+            guild_id (int): The ID of the guild.
+            channel_id (int): The ID of the channel the tallies came from.
+            base_cc (int): The CC to give players that are new to the shatterpoint.
+            tallies (dict[int, ScrapeTally]): Tallies keyed by player id. Must not be empty.
+        Returns:
+            Insert: The insert query with an on conflict update that merges the tallies.
+        """
+        table = ShatterpointPlayer.ref_gb_staging_player_table
+        query = insert(table).values(
+            [
+                {
+                    "guild_id": guild_id,
+                    "player_id": player_id,
+                    "cc": base_cc,
+                    "num_messages": tally.num_messages,
+                    "channels": [channel_id],
+                    "characters": list(tally.characters),
+                    "update": True,
+                    "active": True,
+                }
+                for player_id, tally in tallies.items()
+            ]
+        )
+
+        def array_union(column: str):
+            return sa.literal_column(
+                f"ARRAY(SELECT DISTINCT unnest(COALESCE({table.name}.{column}, '{{}}') || excluded.{column}))"
+            )
+
+        return query.on_conflict_do_update(
+            index_elements=["guild_id", "player_id"],
+            set_={
+                "num_messages": table.c.num_messages + query.excluded.num_messages,
+                "channels": array_union("channels"),
+                "characters": array_union("characters"),
+            },
+        )
+
+    @staticmethod
+    async def bulk_upsert(
+        db: aiopg.sa.Engine, players: list["ShatterpointPlayer"]
+    ) -> None:
+        if not players:
+            return
+
+        async with db.acquire() as conn:
+            await conn.execute(ShatterpointPlayer.bulk_upsert_query(players))
+
+
+class ScrapeTally(object):
+    """
+    Messages and characters tallied for one player in one channel since the last checkpoint.
+    Attributes:
+        num_messages (int): Number of messages tallied.
+        characters (set[int]): IDs of the characters the player posted as.
+    """
+
+    def __init__(self):
+        self.num_messages = 0
+        self.characters: set[int] = set()
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalizes a character name for lookups by collapsing whitespace and ignoring case.
+    Args:
+        name (str): The name to normalize.
+    Returns:
+        str: The normalized name.
+    """
+    return " ".join(name.split()).casefold()
 
 
 class ShatterpointRenown(object):
@@ -481,3 +731,124 @@ class ShatterpointRenown(object):
 
         async with self._db.acquire() as conn:
             await conn.execute(query)
+
+
+class ShatterpointCheckpoint(object):
+    """
+    Tracks how far a channel has been scraped for a guild's shatterpoint.
+    Attributes:
+        _db (aiopg.sa.Engine): The database engine.
+        guild_id (int): The ID of the guild the shatterpoint belongs to.
+        channel_id (int): The ID of the scraped channel.
+        last_message_id (int): The ID of the last message tallied for the channel.
+        num_messages (int): The number of messages scraped in the channel.
+        complete (bool): Whether the last scrape reached the end of the channel history.
+    Methods:
+        upsert_query(): Builds the insert/update query for the checkpoint.
+        upsert(): Inserts or updates the checkpoint in the database.
+        get_checkpoint(bot, guild_id, channel_id): Retrieves the checkpoint for a channel.
+        get_incomplete_checkpoints(bot, guild_id): Retrieves checkpoints for scrapes that did not finish.
+    """
+
+    ref_gb_scrape_checkpoint_table = sa.Table(
+        "ref_gb_scrape_checkpoint",
+        metadata,
+        sa.Column(
+            "guild_id", sa.BigInteger, nullable=False
+        ),  # ref: > ref_gb_staging.id
+        sa.Column("channel_id", sa.BigInteger, nullable=False),
+        sa.Column("last_message_id", sa.BigInteger, nullable=True),
+        sa.Column("num_messages", sa.Integer, nullable=False, default=0),
+        sa.Column("complete", sa.BOOLEAN, nullable=False, default=False),
+        sa.PrimaryKeyConstraint("guild_id", "channel_id"),
+    )
+
+    class CheckpointSchema(Schema):
+        db: aiopg.sa.Engine
+
+        guild_id = fields.Integer(required=True)
+        channel_id = fields.Integer(required=True)
+        last_message_id = fields.Integer(required=False, allow_none=True)
+        num_messages = fields.Integer(required=True)
+        complete = fields.Boolean(required=True)
+
+        def __init__(self, db: aiopg.sa.Engine, **kwargs):
+            super().__init__(**kwargs)
+            self.db = db
+
+        @post_load
+        def make_checkpoint(self, data, **kwargs):
+            return ShatterpointCheckpoint(self.db, **data)
+
+    def __init__(self, db: aiopg.sa.Engine, **kwargs):
+        self._db = db
+        self.guild_id = kwargs.get("guild_id")
+        self.channel_id = kwargs.get("channel_id")
+        self.last_message_id = kwargs.get("last_message_id")
+        self.num_messages = kwargs.get("num_messages", 0)
+        self.complete = kwargs.get("complete", False)
+
+    def upsert_query(self):
+        update_dict = {
+            "last_message_id": self.last_message_id,
+            "num_messages": self.num_messages,
+            "complete": self.complete,
+        }
+
+        insert_dict = {
+            **update_dict,
+            "guild_id": self.guild_id,
+            "channel_id": self.channel_id,
+        }
+
+        query = insert(ShatterpointCheckpoint.ref_gb_scrape_checkpoint_table).values(
+            **insert_dict
+        )
+
+        query = query.on_conflict_do_update(
+            index_elements=["guild_id", "channel_id"], set_=update_dict
+        )
+
+        return query
+
+    async def upsert(self) -> None:
+        async with self._db.acquire() as conn:
+            await conn.execute(self.upsert_query())
+
+    @staticmethod
+    async def get_checkpoint(
+        bot: G0T0Bot, guild_id: int, channel_id: int
+    ) -> "ShatterpointCheckpoint":
+        query = ShatterpointCheckpoint.ref_gb_scrape_checkpoint_table.select().where(
+            sa.and_(
+                ShatterpointCheckpoint.ref_gb_scrape_checkpoint_table.c.guild_id
+                == guild_id,
+                ShatterpointCheckpoint.ref_gb_scrape_checkpoint_table.c.channel_id
+                == channel_id,
+            )
+        )
+
+        row = await bot.query(query)
+
+        if row is None:
+            return None
+
+        return ShatterpointCheckpoint.CheckpointSchema(bot.db).load(row)
+
+    @staticmethod
+    async def get_incomplete_checkpoints(
+        bot: G0T0Bot, guild_id: int
+    ) -> list["ShatterpointCheckpoint"]:
+        query = ShatterpointCheckpoint.ref_gb_scrape_checkpoint_table.select().where(
+            sa.and_(
+                ShatterpointCheckpoint.ref_gb_scrape_checkpoint_table.c.guild_id
+                == guild_id,
+                ShatterpointCheckpoint.ref_gb_scrape_checkpoint_table.c.complete
+                == False,
+            )
+        )
+
+        return [
+            ShatterpointCheckpoint.CheckpointSchema(bot.db).load(row)
+            for row in await bot.query(query, QueryResultType.multiple)
+        ]
@@ -23,6 +23,10 @@ class Store(object):
     -------
     __init__(**kwargs)
         Initializes the Store object with the given keyword arguments.
+    get_items(bot, refresh=False)
+        Returns every store item, loading the bot's SKU cache if needed.
+    get_item(bot, sku)
+        Returns the store item for a SKU from the cache.
     """
 
     store_table = sa.Table(
@@ -48,10 +52,22 @@ class Store(object):
         self.user_cost: int = kwargs.get("user_cost", 0)
 
     @staticmethod
-    async def get_items(bot: G0T0Bot) -> list["Store"]:
-        store_items = []
+    async def get_items(bot: G0T0Bot, refresh: bool = False) -> list["Store"]:
+        if bot.store_items and not refresh:
+            bot.metrics.cache_hit("store")
+            return list(bot.store_items.values())
+
+        bot.metrics.cache_miss("store")
         rows = await bot.query(Store.store_table.select(), QueryResultType.multiple)
 
         store_items = [Store.StoreSchema().load(row) for row in rows]
+        bot.store_items = {s.sku: s for s in store_items}
 
         return store_items
+
+    @staticmethod
+    async def get_item(bot: G0T0Bot, sku: int) -> "Store":
+        if not bot.store_items:
+            await Store.get_items(bot)
+
+        return bot.store_items.get(sku)
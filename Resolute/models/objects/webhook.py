@@ -74,11 +74,11 @@ class G0T0Webhook(object):
 
     async def send(self) -> None:
         # Maker sure we have required attributes
-        if not self.player and hasattr(self.ctx, "player") and self.ctx.player:
+        if not self.player and getattr(self.ctx, "player", None):
             self.player = self.ctx.player
-        else:
+        elif not self.player:
             self.player = await Player.get_player(
-                self.ctx.bot, self.ctx.author.id, self.ctx.guild.id
+                self.ctx.bot, self.ctx.author.id, self.ctx.guild.id, graph=False
             )
 
         # >say
@@ -204,11 +204,11 @@ class G0T0Webhook(object):
     async def edit(self, content: str) -> None:
         self.content = content
         if self.type == WebhookType.say:
-            if hasattr(self.ctx, "player") and self.ctx.player and not self.player:
+            if not self.player and getattr(self.ctx, "player", None):
                 self.player = self.ctx.player
-            else:
+            elif not self.player:
                 self.player = await Player.get_player(
-                    self.ctx.bot, self.ctx.author.id, self.ctx.guild.id
+                    self.ctx.bot, self.ctx.author.id, self.ctx.guild.id, graph=False
                 )
 
             await _handle_character_mentions(self)
@@ -298,6 +298,13 @@ class NewCharacterRequestUI(CharacterView):
                 await webhook.edit_message(
                     self.application.application.message.id, content=message
                 )
+                await PlayerApplication.store(
+                    self.application._bot,
+                    self.player.guild_id,
+                    self.owner.id,
+                    self.application.application,
+                    self.application.application.message.id,
+                )
                 await interaction.response.send_message(
                     "Request Updated", ephemeral=True
                 )
@@ -308,6 +315,13 @@ class NewCharacterRequestUI(CharacterView):
                     content=message,
                     wait=True,
                 )
+                await PlayerApplication.store(
+                    self.application._bot,
+                    self.player.guild_id,
+                    self.owner.id,
+                    self.application.application,
+                    msg.id,
+                )
                 thread = await msg.create_thread(
                     name=f"{self.application.application.name}",
                     auto_archive_duration=10080,
@@ -959,6 +973,13 @@ class LevelUpRequestModal(discord.ui.Modal):
 
             if self.application.message:
                 await webhook.edit_message(self.application.message.id, content=message)
+                await PlayerApplication.store(
+                    self.player._bot,
+                    self.player.guild_id,
+                    interaction.user.id,
+                    self.application,
+                    self.application.message.id,
+                )
                 return await interaction.response.send_message(
                     "Request updated!", ephemeral=True
                 )
@@ -975,6 +996,13 @@ class LevelUpRequestModal(discord.ui.Modal):
                     content=message,
                     wait=True,
                 )
+                await PlayerApplication.store(
+                    self.player._bot,
+                    self.player.guild_id,
+                    interaction.user.id,
+                    self.application,
+                    msg.id,
+                )
                 thread = await msg.create_thread(
                     name=f"{self.application.character.name}",
                     auto_archive_duration=10080,
@@ -3,7 +3,6 @@ import io
 import logging
 from typing import Mapping
 
-import chat_exporter
 import discord
 
 from Resolute.bot import G0T0Bot
@@ -374,6 +373,8 @@ async def _archive_channel(
     channel: discord.TextChannel | discord.Thread | discord.ForumChannel,
     player: Player,
 ):
+    import chat_exporter
+
     transcript = await chat_exporter.export(channel, guild=player.guild.guild, bot=bot)
 
     if transcript is None:
@@ -1931,8 +1931,9 @@ class RPPostUI(RPPostView):
                         self.orig_message.id, embed=RPPostEmbed(self.player, self.posts)
                     )
                     await self.orig_message.clear_reactions()
+                    message = self.orig_message
                 else:
-                    await webhook.send(
+                    message = await webhook.send(
                         username=self.player.member.display_name,
                         avatar_url=(
                             self.player.member.display_avatar.url
@@ -1940,7 +1941,10 @@ class RPPostUI(RPPostView):
                             else None
                         ),
                         embed=RPPostEmbed(self.player, self.posts),
+                        wait=True,
                     )
+
+                await RPPost.register(self.bot, message, self.player.id)
             except:
                 return False
             return True
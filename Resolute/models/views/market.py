@@ -9,6 +9,7 @@ from Resolute.models.categories.categories import (
     TransactionType,
 )
 from Resolute.models.embeds import ErrorEmbed
+from Resolute.models.objects.enum import RequestStatus
 from Resolute.models.objects.market import MarketTransaction
 from Resolute.models.objects.players import Player
 from Resolute.models.views.base import InteractiveView
@@ -219,10 +220,13 @@ class TransactionPromptUI(MarketPrompt):
                 embed=TransactionEmbed(self.transaction)
             )
             await self.transaction.message.clear_reactions()
+            self.transaction.status = RequestStatus.pending
+            await self.transaction.upsert(self.bot)
         elif self.player.guild.market_channel:
-            await self.player.guild.market_channel.send(
+            self.transaction.message = await self.player.guild.market_channel.send(
                 embed=TransactionEmbed(self.transaction)
             )
+            await self.transaction.upsert(self.bot)
             await interaction.response.send_message(
                 "Request Submitted!", ephemeral=True
             )
@@ -11,7 +11,7 @@ from Resolute.models.embeds import ErrorEmbed, PaginatedEmbed, PlayerEmbed
 from Resolute.models.objects.characters import PlayerCharacter
 from Resolute.models.objects.enum import AdjustOperator
 from Resolute.models.objects.guilds import PlayerGuild
-from Resolute.models.objects.logs import DBLog
+from Resolute.models.objects.logs import DBLogBatch
 from Resolute.models.objects.players import Player
 from Resolute.models.objects.shatterpoint import (
     Shatterpoint,
@@ -182,10 +182,13 @@ class ShatterpointSettingsUI(ShatterpointSettings):
         modal = ShatterpointSettingsModal(self.shatterpoint)
         await self.prompt_modal(interaction, modal)
 
+        updated = []
         for player in self.shatterpoint.players:
             if player.active and player.update:
                 player.cc = self.shatterpoint.base_cc
-                await player.upsert()
+                updated.append(player)
+
+        await ShatterpointPlayer.bulk_upsert(self.bot.db, updated)
 
         await self.refresh_content(interaction)
 
@@ -231,47 +234,38 @@ class ShatterpointSettingsUI(ShatterpointSettings):
             active_players: list[ShatterpointPlayer] = list(
                 filter(lambda p: p.active, self.shatterpoint.players)
             )
+            # Calculate every reward in memory, then write them all at once
+            batch = DBLogBatch(self.bot, self.shatterpoint.guild_id, self.owner)
+            players = await batch.load_players([p.player_id for p in active_players])
+
             for p in active_players:
-                player = await Player.get_player(self.bot, p.player_id, p.guild_id)
-
-                await DBLog.create(
-                    self.bot,
-                    interaction,
-                    player,
-                    self.owner,
-                    "GLOBAL",
-                    notes=self.shatterpoint.name,
-                    cc=p.cc,
-                    silent=True,
-                )
+                player = players[p.player_id]
+
+                batch.add(player, "GLOBAL", notes=self.shatterpoint.name, cc=p.cc)
 
                 # Character Rewards
                 for c in p.characters:
                     character = next(
                         (ch for ch in player.characters if ch.id == c), None
                     )
+
+                    if not character:
+                        continue
+
                     conversion: CodeConversion = self.bot.compendium.get_object(
                         CodeConversion, character.level
                     )
-                    credits = p.cc * conversion.value
-                    await DBLog.create(
-                        self.bot,
-                        interaction,
+                    batch.add(
                         player,
-                        self.owner,
                         "GLOBAL",
                         character=character,
                         notes=self.shatterpoint.name,
-                        credits=credits,
-                        silent=True,
+                        credits=p.cc * conversion.value,
                     )
 
                     for renown in self.shatterpoint.renown:
-                        await DBLog.create(
-                            self.bot,
-                            interaction,
+                        batch.add(
                             player,
-                            self.owner,
                             "RENOWN",
                             character=character,
                             notes=self.shatterpoint.name,
@@ -281,9 +275,11 @@ class ShatterpointSettingsUI(ShatterpointSettings):
                                 if p.renown_override
                                 else renown.renown
                             ),
-                            silent=True,
                         )
 
+            await batch.commit()
+            totals = batch.totals()
+
             await self.shatterpoint.delete()
             embed = discord.Embed(
                 title=f"Shatterpoint: {self.shatterpoint.name} - has been logged",
@@ -300,6 +296,17 @@ class ShatterpointSettingsUI(ShatterpointSettings):
                 inline=False,
             )
 
+            embed.add_field(
+                name="Totals",
+                value=(
+                    f"{ZWSP3}**Logs**: {totals['logs']:,}\n"
+                    f"{ZWSP3}**CC**: {totals['cc']:,}\n"
+                    f"{ZWSP3}**Credits**: {totals['credits']:,}\n"
+                    f"{ZWSP3}**Renown**: {totals['renown']:,}"
+                ),
+                inline=False,
+            )
+
             await interaction.channel.send(embed=embed)
             await self.on_timeout()
 
@@ -347,10 +354,12 @@ class ShatterpointSettingsUI(ShatterpointSettings):
 
 
 class _ShatterpointManage(ShatterpointSettings):
-    channel: discord.TextChannel = None
+    channels: list[discord.TextChannel] = []
 
     @discord.ui.channel_select(
-        placeholder="Channel to scrape",
+        placeholder="Channels to scrape",
+        min_values=1,
+        max_values=25,
         channel_types=[
             discord.ChannelType(0),
             discord.ChannelType(11),
@@ -360,14 +369,16 @@ class _ShatterpointManage(ShatterpointSettings):
     async def channel_select(
         self, chan: discord.ui.Select, interaction: discord.Interaction
     ):
-        self.channel = chan.values[0]
+        self.channels = chan.values
         await self.refresh_content(interaction)
 
-    @discord.ui.button(label="Scrape Channel", style=discord.ButtonStyle.primary, row=2)
+    @discord.ui.button(
+        label="Scrape Channels", style=discord.ButtonStyle.primary, row=2
+    )
     async def channel_scrape(
         self, _: discord.ui.Select, interaction: discord.Interaction
     ):
-        if not self.channel:
+        if not self.channels:
             return await interaction.channel.send(
                 embed=ErrorEmbed("Select a channel to scrape first"), delete_after=5
             )
@@ -385,8 +396,8 @@ class _ShatterpointManage(ShatterpointSettings):
             self.shatterpoint.busy_member = interaction.user
             await self.shatterpoint.upsert()
             asyncio.create_task(
-                self.shatterpoint.scrape_channel(
-                    self.bot, self.channel, guild, interaction.user
+                self.shatterpoint.scrape_channels(
+                    self.bot, self.channels, guild, interaction.user
                 )
             )
             await interaction.channel.send(
@@ -832,6 +843,7 @@ class ShatterpointMassAdjustModal(discord.ui.Modal):
             await interaction.channel.send(embed=ErrorEmbed("Values must be a number!"))
 
         if threshold and (cc or renown):
+            adjusted = []
             for player in self.shatterpoint.players:
                 if not player.active:
                     continue
@@ -867,7 +879,9 @@ class ShatterpointMassAdjustModal(discord.ui.Modal):
                 ):
                     player.update = True
 
-                await player.upsert()
+                adjusted.append(player)
+
+            await ShatterpointPlayer.bulk_upsert(self.shatterpoint._db, adjusted)
 
         await interaction.response.defer()
         self.stop()
@@ -0,0 +1,275 @@
+import logging
+import re
+from collections import deque
+from timeit import default_timer as timer
+
+from Resolute.constants import SLOW_QUERY_THRESHOLD
+from Resolute.tracing import record_query
+
+log = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+LATENCY_SAMPLES = 200
+# Shapes beyond this many are grouped under OTHER_SHAPE so the stats and metric labels stay bounded
+MAX_STATEMENT_SHAPES = 250
+OTHER_SHAPE = "other"
+# Statement shapes remembered by cache key so repeated statements aren't compiled a second time
+SHAPE_CACHE_SIZE = 1000
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAMETER = re.compile(r"%\(\w+\)s|__\[POSTCOMPILE_\w+\]")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+_PARAMETER_GROUPS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+
+
+def statement_shape(sql: str) -> str:
+    """
+    Normalizes a compiled SQL statement so queries that only differ by their values share a shape.
+    Bound parameters and literals are replaced with `?`, `IN` lists are collapsed to a single placeholder and
+    multi-row `VALUES` lists to a single row, so batch sizes don't produce new shapes.
+    Args:
+        sql (str): The compiled SQL statement.
+    Returns:
+        str: The statement shape.
+    """
+    shape = _PARAMETER.sub("?", sql)
+    shape = _LITERAL.sub("?", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip()
+    shape = _PARAMETER_LIST.sub("(?)", shape)
+    return _PARAMETER_GROUPS.sub("(?)", shape)
+
+
+def parameter_shape(params: dict) -> dict:
+    return {
+        key: (
+            f"{type(value).__name__}[{len(value)}]"
+            if isinstance(value, (list, tuple, set))
+            else type(value).__name__
+        )
+        for key, value in (params or {}).items()
+    }
+
+
+class StatementStats(object):
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.rows = 0
+        self.pool_wait = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self._latency: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, duration: float, rows: int, pool_wait: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.rows += rows
+        self.pool_wait += pool_wait
+        self._latency.append(duration)
+
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if duration <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def metrics(self) -> dict:
+        ordered = sorted(self._latency)
+
+        return {
+            "count": self.count,
+            "total": self.total,
+            "rows": self.rows,
+            "pool_wait": self.pool_wait,
+            "p50": ordered[int(len(ordered) * 0.5)] if ordered else 0,
+            "p95": ordered[int(len(ordered) * 0.95)] if ordered else 0,
+            "max": ordered[-1] if ordered else 0,
+            "buckets": dict(
+                zip([*(str(b) for b in LATENCY_BUCKETS), "+Inf"], self.buckets)
+            ),
+        }
+
+
+class QueryStats(object):
+    """
+    Collects latency, row count and pool wait statistics for database statements, grouped by statement shape.
+    Once `max_shapes` shapes are tracked, statements with a new shape are recorded under `OTHER_SHAPE`.
+    Attributes:
+        slow_threshold (float): Statements slower than this many seconds are logged.
+        slow (int): Number of slow statements seen.
+        max_shapes (int): Number of statement shapes tracked before new ones are grouped under `OTHER_SHAPE`.
+    Methods:
+        record(sql, duration, rows=0, pool_wait=0.0, params=None):
+            Records an executed statement.
+        record_shape(shape, duration, rows=0, pool_wait=0.0, params=None):
+            Records an executed statement whose shape is already known.
+        top(limit=10, key="total") -> list[tuple[str, dict]]:
+            Returns the statement shapes with the highest value for the given metric.
+        metrics() -> dict:
+            Returns the metrics for every statement shape.
+        reset():
+            Clears all collected statistics.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: float = SLOW_QUERY_THRESHOLD,
+        max_shapes: int = MAX_STATEMENT_SHAPES,
+    ):
+        self.slow_threshold = slow_threshold
+        self.max_shapes = max_shapes
+        self.slow = 0
+        self._statements: dict[str, StatementStats] = {}
+
+    def record(
+        self,
+        sql: str,
+        duration: float,
+        rows: int = 0,
+        pool_wait: float = 0.0,
+        params: dict = None,
+    ) -> str:
+        return self.record_shape(
+            statement_shape(sql), duration, rows, pool_wait, params
+        )
+
+    def record_shape(
+        self,
+        shape: str,
+        duration: float,
+        rows: int = 0,
+        pool_wait: float = 0.0,
+        params: dict = None,
+    ) -> str:
+        key = (
+            shape
+            if shape in self._statements or len(self._statements) < self.max_shapes
+            else OTHER_SHAPE
+        )
+        self._statements.setdefault(key, StatementStats()).record(
+            duration, rows, pool_wait
+        )
+
+        if self.slow_threshold and duration >= self.slow_threshold:
+            self.slow += 1
+            log.warning(
+                f"Slow query ({duration * 1000:.1f}ms, pool wait {pool_wait * 1000:.1f}ms, {rows} rows): "
+                f"{shape} params={parameter_shape(params)}"
+            )
+
+        return shape
+
+    def top(self, limit: int = 10, key: str = "total") -> list[tuple[str, dict]]:
+        statements = [(shape, s.metrics()) for shape, s in self._statements.items()]
+        return sorted(statements, key=lambda s: s[1][key], reverse=True)[:limit]
+
+    def metrics(self) -> dict:
+        return {
+            "slow": self.slow,
+            "statements": {
+                shape: stats.metrics() for shape, stats in self._statements.items()
+            },
+        }
+
+    def reset(self) -> None:
+        self.slow = 0
+        self._statements.clear()
+
+
+class MeasuredEngine(object):
+    """
+    Wraps an aiopg engine and records every statement executed on connections acquired from it in `stats` and in
+    the active command trace, so code that acquires connections directly is measured as well as `G0T0Bot.query`.
+    aiopg compiles each statement itself, so shapes are remembered by the statement's SQLAlchemy cache key and a
+    statement is only compiled here the first time its cache key is seen.
+    Attributes:
+        stats (QueryStats): Where executed statements are recorded.
+    Methods:
+        acquire():
+            Acquires a connection from the pool, timing the wait for it.
+        shape(query) -> tuple[str, dict]:
+            Returns the statement shape of a query and its bound parameters.
+    """
+
+    def __init__(self, engine, stats: QueryStats, cache_size: int = SHAPE_CACHE_SIZE):
+        self._engine = engine
+        self.stats = stats
+        self._cache_size = cache_size
+        self._shapes: dict[tuple, str] = {}
+
+    def __getattr__(self, name):
+        return getattr(self._engine, name)
+
+    def acquire(self) -> "_MeasuredAcquire":
+        return _MeasuredAcquire(self, self._engine.acquire())
+
+    def shape(self, query) -> tuple[str, dict]:
+        if isinstance(query, str):
+            return statement_shape(query), None
+
+        cache_key = query._generate_cache_key()
+
+        if cache_key is None:
+            compiled = query.compile(dialect=self.dialect)
+            return statement_shape(str(compiled)), compiled.params
+
+        params = {b.key: b.effective_value for b in cache_key.bindparams}
+
+        if (shape := self._shapes.get(cache_key.key)) is None:
+            shape = statement_shape(str(query.compile(dialect=self.dialect)))
+
+            if len(self._shapes) >= self._cache_size:
+                self._shapes.pop(next(iter(self._shapes)))
+            self._shapes[cache_key.key] = shape
+
+        return shape, params
+
+
+class _MeasuredAcquire(object):
+    def __init__(self, engine: MeasuredEngine, context):
+        self._engine = engine
+        self._context = context
+
+    async def __aenter__(self) -> "_MeasuredConnection":
+        start = timer()
+        conn = await self._context.__aenter__()
+        return _MeasuredConnection(self._engine, conn, timer() - start)
+
+    async def __aexit__(self, *exc):
+        return await self._context.__aexit__(*exc)
+
+
+class _MeasuredConnection(object):
+    def __init__(self, engine: MeasuredEngine, conn, pool_wait: float):
+        self._engine = engine
+        self._conn = conn
+        self._pool_wait = pool_wait
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    async def execute(self, query, *multiparams, **params):
+        results = None
+        start = timer()
+
+        # Statements that fail, time out or are cancelled are recorded too, with no rows
+        try:
+            results = await self._conn.execute(query, *multiparams, **params)
+            return results
+        finally:
+            duration = timer() - start
+
+            # The wait for the connection is charged to the first statement run on it
+            pool_wait, self._pool_wait = self._pool_wait, 0.0
+            shape, bound = self._engine.shape(query)
+
+            record_query(duration)
+            self._engine.stats.record_shape(
+                shape,
+                duration,
+                max(results.rowcount, 0) if results is not None else 0,
+                pool_wait,
+                bound or params,
+            )
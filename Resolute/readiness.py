@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from collections import deque
+from timeit import default_timer as timer
+
+import discord
+from discord.ext import commands
+
+from Resolute.constants import READY_TIMEOUT
+from Resolute.helpers.general_helpers import get_initial_response
+
+log = logging.getLogger(__name__)
+
+# Interactions have to be acknowledged within 3 seconds, so defer comfortably before that
+DEFER_AFTER = 2.0
+
+
+async def _already_deferred(*args, **kwargs) -> None:
+    pass
+
+
+class ReadinessGate(object):
+    """
+    Holds commands that arrive while the bot is still starting instead of rejecting them.
+    Commands wait in arrival order until every component has been marked ready and are then released in that same
+    order. Slash commands still waiting after `DEFER_AFTER` seconds are deferred so their interaction doesn't expire,
+    with the visibility declared by `initial_response`, and their own later `defer` calls become no-ops. Commands
+    that may open a modal can't be deferred, so they are rejected at that point instead. Otherwise a command is only
+    rejected when the bot isn't ready within `timeout` seconds of it arriving.
+    Attributes:
+        pending (set[str]): Components that are not ready yet.
+        timeout (float): Seconds a command may wait before it is rejected.
+        waited (int): Commands that had to wait, including ones that timed out.
+        wait_total (float): Seconds those commands spent waiting.
+        wait_max (float): Longest single wait.
+        timeouts (int): Commands rejected because the gate didn't open in time.
+        rejected (int): Commands that may open a modal, rejected because they couldn't be deferred.
+    Methods:
+        ready -> bool:
+            Whether every component is ready.
+        mark_ready(component):
+            Marks a component ready, opening the gate once none are pending.
+        wait(ctx) -> bool:
+            Waits for the gate to open, deferring the interaction if needed. Returns False on timeout.
+        metrics() -> dict:
+            Returns the queue depth, the oldest queued command's age, wait totals, timeouts and rejections.
+    """
+
+    def __init__(
+        self,
+        components: tuple[str, ...],
+        timeout: float = READY_TIMEOUT,
+        defer_after: float = DEFER_AFTER,
+    ):
+        self.pending = set(components)
+        self.timeout = timeout
+        self.defer_after = defer_after
+        self.waited = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+        self.rejected = 0
+        self._waiters: deque[tuple[float, asyncio.Future]] = deque()
+
+    @property
+    def ready(self) -> bool:
+        return not self.pending
+
+    def mark_ready(self, component: str) -> None:
+        if component not in self.pending:
+            return
+
+        self.pending.discard(component)
+
+        if not self.ready:
+            log.info(
+                f"READY: {component} ready, waiting on {', '.join(sorted(self.pending))}"
+            )
+            return
+
+        log.info(
+            f"READY: {component} ready, releasing {len(self._waiters)} queued command(s)"
+        )
+
+        # Futures resolve in the order their callbacks were scheduled, so commands resume in arrival order
+        while self._waiters:
+            _, waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(True)
+
+    async def wait(self, ctx: discord.ApplicationContext | commands.Context) -> bool:
+        if self.ready:
+            return True
+
+        start = timer()
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (start, waiter)
+        self._waiters.append(entry)
+
+        try:
+            if (
+                isinstance(ctx, discord.ApplicationContext)
+                and self.defer_after < self.timeout
+            ):
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter), self.defer_after)
+                except asyncio.TimeoutError:
+                    ephemeral, modal = get_initial_response(ctx.command)
+
+                    if modal:
+                        self.rejected += 1
+                        log.warning(
+                            f"READY: {ctx.command} rejected, it may open a modal and can't wait past {self.defer_after:.0f}s"
+                        )
+                        return False
+
+                    if not ctx.response.is_done():
+                        await ctx.defer(ephemeral=ephemeral)
+                        # The interaction is acknowledged now, so the command's own defer must not try again
+                        ctx.interaction.response.defer = _already_deferred
+
+            await asyncio.wait_for(waiter, max(0, self.timeout - (timer() - start)))
+            return True
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            log.warning(
+                f"READY: {ctx.command} timed out after {self.timeout:.0f}s waiting on {', '.join(sorted(self.pending))}"
+            )
+            return False
+        finally:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+
+            elapsed = timer() - start
+            self.waited += 1
+            self.wait_total += elapsed
+            self.wait_max = max(self.wait_max, elapsed)
+
+    def metrics(self) -> dict:
+        return {
+            "ready": self.ready,
+            "depth": len(self._waiters),
+            "oldest": timer() - self._waiters[0][0] if self._waiters else 0,
+            "waited": self.waited,
+            "wait_total": self.wait_total,
+            "wait_max": self.wait_max,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+        }
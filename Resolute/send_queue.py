@@ -0,0 +1,265 @@
+import asyncio
+import contextvars
+import itertools
+import logging
+from collections import deque
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+import discord
+
+from Resolute.constants import SEND_QUEUE_MAX_DEPTH
+from Resolute.models.objects.enum import SendPriority
+from Resolute.tracing import current_trace
+
+log = logging.getLogger(__name__)
+
+# Discord route limits. Webhook executions are shared per webhook, message edits are shared per channel
+WEBHOOK_BUCKET_LIMIT = (5, 2.0)
+CHANNEL_BUCKET_LIMIT = (5, 5.0)
+
+MAX_RETRIES = 3
+IDLE_TIMEOUT = 30
+LATENCY_SAMPLES = 500
+
+
+class RouteBucket(object):
+    """
+    Tracks the request budget for a single Discord rate limit route.
+    Attributes:
+        limit (int): Number of requests allowed per window.
+        per (float): Length of the window in seconds.
+        reset_at (float): Monotonic time before which no requests should be made (set on a 429).
+    Methods:
+        delay() -> float:
+            Returns how long to wait before the next request can be made.
+        record():
+            Records a request against the bucket.
+        block(retry_after: float):
+            Blocks the bucket for the given number of seconds.
+    """
+
+    def __init__(self, limit: int, per: float):
+        self.limit = limit
+        self.per = per
+        self.reset_at = 0.0
+        self._sent: deque[float] = deque()
+
+    def delay(self) -> float:
+        now = monotonic()
+
+        while self._sent and self._sent[0] + self.per <= now:
+            self._sent.popleft()
+
+        if self.reset_at > now:
+            return self.reset_at - now
+
+        if len(self._sent) >= self.limit:
+            return self._sent[0] + self.per - now
+
+        return 0
+
+    def record(self) -> None:
+        self._sent.append(monotonic())
+
+    def block(self, retry_after: float) -> None:
+        self.reset_at = max(self.reset_at, monotonic() + retry_after)
+
+
+class SendJob(object):
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        priority: SendPriority,
+        bucket: str,
+    ):
+        self.factory = factory
+        self.priority = priority
+        self.bucket = bucket
+        self.enqueued = monotonic()
+        # Requests run on the channel's worker, so the submitting command's trace is carried on the job
+        self.trace = current_trace.get()
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class SendQueue(object):
+    """
+    Schedules outbound Discord requests per channel.
+    Requests for a channel are sent one at a time in FIFO order within their priority, so user-facing
+    posts jump ahead of background edits queued for the same channel. Each request is checked against
+    its route bucket before it is sent and waits out the remaining window instead of running into a 429.
+    Every attempt is counted as a REST call on the trace of the command that submitted the request. Workers run
+    without a trace of their own, so nothing they do is charged to whichever command happened to start them.
+    Attributes:
+        max_depth (int): Maximum number of pending jobs per channel.
+        dropped (int): Number of background jobs dropped because a channel queue was full.
+        rate_limited (int): Number of 429 responses received.
+    Methods:
+        submit(channel, factory, priority=SendPriority.user, bucket=None):
+            Queues a request for the channel and waits for its result.
+        webhook_bucket(channel) -> str:
+            Returns the bucket key used for webhook executions in the channel.
+        depth(channel_id=None) -> int:
+            Returns the number of pending jobs for a channel, or all channels.
+        metrics() -> dict:
+            Returns queue depth and send latency metrics.
+    """
+
+    def __init__(self, max_depth: int = SEND_QUEUE_MAX_DEPTH):
+        self.max_depth = max_depth
+        self.dropped = 0
+        self.rate_limited = 0
+
+        self._queues: dict[int, asyncio.PriorityQueue] = {}
+        self._workers: dict[int, asyncio.Task] = {}
+        self._buckets: dict[str, RouteBucket] = {}
+        self._counter = itertools.count()
+        self._sent = {p: 0 for p in SendPriority}
+        self._latency = {p: deque(maxlen=LATENCY_SAMPLES) for p in SendPriority}
+
+    @staticmethod
+    def webhook_bucket(channel: discord.abc.Messageable) -> str:
+        if isinstance(channel, (discord.Thread, discord.ForumChannel)):
+            channel = channel.parent
+
+        return f"webhook:{channel.id}"
+
+    async def submit(
+        self,
+        channel: discord.abc.Messageable,
+        factory: Callable[[], Awaitable[Any]],
+        priority: SendPriority = SendPriority.user,
+        bucket: str = None,
+    ) -> Any:
+        """
+        Queues a request for the given channel and waits for it to be sent.
+        User-facing requests wait for room when the channel queue is full. Background requests are
+        dropped instead so they never hold up user-facing posts.
+        Args:
+            channel (Messageable): The channel the request is for.
+            factory (Callable): A callable returning the coroutine to run. Called once per attempt.
+            priority (SendPriority, optional): Priority of the request. Defaults to SendPriority.user.
+            bucket (str, optional): Rate limit bucket key. Defaults to the channel's message bucket.
+        Returns:
+            Any: The result of the request, or None if a background request was dropped.
+        Raises:
+            Exception: Any exception raised by the request itself.
+        """
+        job = SendJob(factory, priority, bucket or f"channel:{channel.id}")
+        queue = self._queues.setdefault(
+            channel.id, asyncio.PriorityQueue(maxsize=self.max_depth)
+        )
+        entry = (priority.value, next(self._counter), job)
+
+        if priority == SendPriority.background:
+            try:
+                queue.put_nowait(entry)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                log.warning(
+                    f"Send queue for channel {channel.id} is full. Dropping background request"
+                )
+                return None
+        else:
+            await queue.put(entry)
+
+        worker = self._workers.get(channel.id)
+        if worker is None or worker.done():
+            self._workers[channel.id] = contextvars.Context().run(
+                asyncio.create_task, self._drain(channel.id, queue)
+            )
+
+        return await job.future
+
+    def depth(self, channel_id: int = None) -> int:
+        if channel_id:
+            queue = self._queues.get(channel_id)
+            return queue.qsize() if queue else 0
+
+        return sum(q.qsize() for q in self._queues.values())
+
+    def metrics(self) -> dict:
+        latency = {}
+
+        for priority, samples in self._latency.items():
+            ordered = sorted(samples)
+            latency[priority.name] = {
+                "count": self._sent[priority],
+                "p50": ordered[int(len(ordered) * 0.5)] if ordered else 0,
+                "p95": ordered[int(len(ordered) * 0.95)] if ordered else 0,
+                "max": ordered[-1] if ordered else 0,
+            }
+
+        return {
+            "depth": self.depth(),
+            "channels": {
+                channel_id: q.qsize()
+                for channel_id, q in self._queues.items()
+                if q.qsize()
+            },
+            "dropped": self.dropped,
+            "rate_limited": self.rate_limited,
+            "latency": latency,
+        }
+
+    def _get_bucket(self, key: str) -> RouteBucket:
+        if key not in self._buckets:
+            limit, per = (
+                WEBHOOK_BUCKET_LIMIT
+                if key.startswith("webhook:")
+                else CHANNEL_BUCKET_LIMIT
+            )
+            self._buckets[key] = RouteBucket(limit, per)
+
+        return self._buckets[key]
+
+    async def _drain(self, channel_id: int, queue: asyncio.PriorityQueue) -> None:
+        while True:
+            try:
+                _, _, job = await asyncio.wait_for(queue.get(), timeout=IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
+                if queue.empty():
+                    self._workers.pop(channel_id, None)
+                    self._queues.pop(channel_id, None)
+                    return
+                continue
+
+            try:
+                if not job.future.done():
+                    job.future.set_result(await self._run(job))
+            except Exception as error:
+                if not job.future.done():
+                    job.future.set_exception(error)
+            finally:
+                self._sent[job.priority] += 1
+                self._latency[job.priority].append(monotonic() - job.enqueued)
+                queue.task_done()
+
+    async def _run(self, job: SendJob) -> Any:
+        bucket = self._get_bucket(job.bucket)
+
+        for attempt in range(MAX_RETRIES):
+            if delay := bucket.delay():
+                await asyncio.sleep(delay)
+
+            bucket.record()
+
+            if job.trace:
+                job.trace.rest_calls += 1
+
+            try:
+                return await job.factory()
+            except discord.HTTPException as error:
+                if error.status != 429 or attempt == MAX_RETRIES - 1:
+                    raise
+
+                self.rate_limited += 1
+                retry_after = float(
+                    error.response.headers.get("Retry-After", bucket.per)
+                    if error.response is not None
+                    else bucket.per
+                )
+                log.warning(
+                    f"Rate limited on {job.bucket}. Retrying in {retry_after:.2f}s"
+                )
+                bucket.block(retry_after)
@@ -0,0 +1,94 @@
+import logging
+from contextlib import contextmanager
+from timeit import default_timer as timer
+
+log = logging.getLogger(__name__)
+
+# Import this module before anything heavy so the clock includes the imports
+PROCESS_START = timer()
+
+
+class StartupReport(object):
+    """
+    Times the phases of startup and logs a report once every expected phase has finished.
+    Phases may overlap. Each one is listed with its offset from process start and its duration, so phases that ran
+    concurrently are easy to spot.
+    Attributes:
+        phases (dict[str, tuple[float, float]]): Offset from process start and duration of each finished phase.
+        pending (set[str]): Expected phases that have not finished yet.
+        complete (bool): Whether the report has been logged. Later phases are ignored.
+    Methods:
+        expect(*names):
+            Adds phases that must finish before the report is logged.
+        phase(name):
+            Context manager timing a phase.
+        begin(name) / finish(name):
+            Times a phase that starts and ends in different places.
+        record(name, seconds):
+            Records a phase timed elsewhere that just finished. Only the first recording of a phase counts.
+        report() -> str:
+            Returns the phases and the total startup time.
+    """
+
+    def __init__(self, started: float = PROCESS_START):
+        self.started = started
+        self.phases: dict[str, tuple[float, float]] = {}
+        self.pending: set[str] = set()
+        self.complete = False
+        self._running: dict[str, float] = {}
+        self._finished: float = None
+
+    def expect(self, *names: str) -> None:
+        self.pending.update(n for n in names if n not in self.phases)
+        self._check_complete()
+
+    @contextmanager
+    def phase(self, name: str):
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.finish(name)
+
+    def begin(self, name: str) -> None:
+        self._running[name] = timer()
+
+    def finish(self, name: str) -> None:
+        if (start := self._running.pop(name, None)) is not None:
+            self.record(name, timer() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        if self.complete or name in self.phases:
+            return
+
+        self.phases[name] = (timer() - seconds - self.started, seconds)
+
+        if name in self.pending:
+            self.pending.discard(name)
+            self._check_complete()
+
+    def report(self) -> str:
+        total = (self._finished or timer()) - self.started
+        width = max((len(name) for name in self.phases), default=5) + 2
+        lines = [
+            f"Startup {'finished' if self.complete else 'running'} in {total:.2f}s",
+            f"  {'phase':<{width}}{'start':>8}{'duration':>10}",
+        ]
+
+        for name, (offset, seconds) in sorted(
+            self.phases.items(), key=lambda p: p[1][0]
+        ):
+            lines.append(f"  {name:<{width}}{offset:>7.2f}s{seconds:>9.2f}s")
+
+        if self.pending:
+            lines.append(f"  waiting on: {', '.join(sorted(self.pending))}")
+
+        return "\n".join(lines)
+
+    def _check_complete(self) -> None:
+        if self.complete or self.pending or not self.phases:
+            return
+
+        self._finished = timer()
+        self.complete = True
+        log.info(self.report())
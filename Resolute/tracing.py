@@ -0,0 +1,78 @@
+import logging
+from contextvars import ContextVar
+from timeit import default_timer as timer
+
+from discord.http import HTTPClient
+
+log = logging.getLogger(__name__)
+
+
+class CommandTrace(object):
+    """
+    Resource usage of a single command invocation.
+    Attributes:
+        command (str): The qualified name of the command.
+        start (float): Timer value when the trace started.
+        db_queries (int): Number of database queries run.
+        db_time (float): Seconds spent running database queries.
+        rest_calls (int): Number of Discord REST requests made.
+    Methods:
+        elapsed() -> float:
+            Returns the seconds since the trace started.
+        summary() -> str:
+            Returns a one line summary of the trace.
+    """
+
+    def __init__(self, command: str):
+        self.command = command
+        self.start = timer()
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.rest_calls = 0
+
+    def elapsed(self) -> float:
+        return timer() - self.start
+
+    def summary(self) -> str:
+        return (
+            f"{self.command}: {self.elapsed():.2f}s, {self.db_queries} queries ({self.db_time:.2f}s), "
+            f"{self.rest_calls} REST calls"
+        )
+
+
+current_trace: ContextVar[CommandTrace] = ContextVar("current_trace", default=None)
+
+
+def start_trace(command: str) -> CommandTrace:
+    trace = CommandTrace(command)
+    current_trace.set(trace)
+    return trace
+
+
+def end_trace() -> CommandTrace:
+    trace = current_trace.get()
+    current_trace.set(None)
+    return trace
+
+
+def record_query(duration: float) -> None:
+    if trace := current_trace.get():
+        trace.db_queries += 1
+        trace.db_time += duration
+
+
+def trace_http(http: HTTPClient) -> None:
+    """
+    Wraps the client's request method so Discord REST calls made while a trace is active are counted.
+    Webhook requests don't go through the client, so `SendQueue` counts the requests it sends itself.
+    Args:
+        http (HTTPClient): The bot's HTTP client.
+    """
+    request = http.request
+
+    async def _request(*args, **kwargs):
+        if trace := current_trace.get():
+            trace.rest_calls += 1
+        return await request(*args, **kwargs)
+
+    http.request = _request
@@ -0,0 +1,342 @@
+"""
+Minimal stand-ins for the Discord objects the bot reads from the gateway cache.
+
+They only implement what the benchmarked code paths touch. Anything that would hit Discord (sends, edits,
+role changes) completes immediately and is counted so runs stay offline and repeatable.
+"""
+
+import asyncio
+import itertools
+from datetime import datetime, timezone
+
+import discord
+
+from Resolute.bot import G0T0Bot
+
+_ids = itertools.count(1)
+
+
+class Calls(object):
+    """Counts the Discord API calls the fakes absorbed."""
+
+    sends = 0
+    webhook_sends = 0
+    edits = 0
+    deletes = 0
+    role_edits = 0
+
+    @classmethod
+    def reset(cls):
+        cls.sends = cls.webhook_sends = cls.edits = cls.deletes = cls.role_edits = 0
+
+    @classmethod
+    def as_dict(cls) -> dict:
+        return {
+            "sends": cls.sends,
+            "webhook_sends": cls.webhook_sends,
+            "edits": cls.edits,
+            "deletes": cls.deletes,
+            "role_edits": cls.role_edits,
+        }
+
+
+class FakeAsset(object):
+    def __init__(self, url: str):
+        self.url = url
+
+
+class FakeRole(object):
+    def __init__(self, guild: "FakeGuild", id: int, name: str):
+        self.guild = guild
+        self.id = id
+        self.name = name
+        self.mention = f"<@&{id}>"
+        self.members: list[FakeMember] = []
+
+    def __eq__(self, other):
+        return isinstance(other, FakeRole) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __lt__(self, other):
+        return self.id < other.id
+
+
+class FakeMember(object):
+    def __init__(self, guild: "FakeGuild", id: int, name: str, bot: bool = False):
+        self.guild = guild
+        self.id = id
+        self.name = name
+        self.display_name = name
+        self.nick = None
+        self.bot = bot
+        self.mention = f"<@{id}>"
+        self.roles: list[FakeRole] = []
+        self.display_avatar = FakeAsset(f"https://example.invalid/avatars/{id}.png")
+        self.avatar = self.display_avatar
+        self.joined_at = datetime.now(timezone.utc)
+
+    def __str__(self):
+        return self.name
+
+    async def send(self, *args, **kwargs):
+        Calls.sends += 1
+        return FakeMessage(None, self, kwargs.get("content") or "")
+
+    async def edit(self, **kwargs):
+        Calls.role_edits += 1
+        if "roles" in kwargs:
+            self.roles = list(kwargs["roles"])
+
+    async def add_roles(self, *roles, **kwargs):
+        Calls.role_edits += 1
+        self.roles += [r for r in roles if r not in self.roles]
+
+    async def remove_roles(self, *roles, **kwargs):
+        Calls.role_edits += 1
+        self.roles = [r for r in self.roles if r not in roles]
+
+
+class FakeMessage(object):
+    def __init__(
+        self,
+        channel: "FakeChannel",
+        author: FakeMember,
+        content: str = "",
+        id: int = None,
+    ):
+        self.id = id or next(_ids)
+        self.channel = channel
+        self.guild = channel.guild if channel else None
+        self.author = author
+        self.content = content
+        self.pinned = True
+        self.embeds: list[discord.Embed] = []
+        self.attachments = []
+        self.reference = None
+        self.created_at = datetime.now(timezone.utc)
+        self.jump_url = (
+            f"https://discord.com/channels/{self.guild.id if self.guild else '@me'}/"
+            f"{channel.id if channel else 0}/{self.id}"
+        )
+
+    async def edit(self, **kwargs):
+        Calls.edits += 1
+        self.content = kwargs.get("content", self.content)
+        if embed := kwargs.get("embed"):
+            self.embeds = [embed]
+        return self
+
+    async def delete(self, **kwargs):
+        Calls.deletes += 1
+
+    async def add_reaction(self, emoji):
+        pass
+
+
+class FakeWebhook(object):
+    """
+    Stand-in webhook transport. Every execution waits `latency` seconds to stand in for the Discord round trip.
+    """
+
+    latency = 0.0
+
+    def __init__(self, channel: "FakeChannel"):
+        self.id = next(_ids)
+        self.channel = channel
+        self.token = "fake"
+
+    async def send(self, content: str = "", **kwargs):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        Calls.webhook_sends += 1
+        message = FakeMessage(self.channel, self.channel.guild.me, content or "")
+        self.channel.last_message = message
+        return message
+
+    async def edit_message(self, message_id: int, **kwargs):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        Calls.edits += 1
+
+
+class FakeChannel(object):
+    type = discord.ChannelType.text
+
+    def __init__(
+        self,
+        guild: "FakeGuild",
+        id: int,
+        name: str,
+        category: "FakeCategory" = None,
+    ):
+        self.guild = guild
+        self.id = id
+        self.name = name
+        self.mention = f"<#{id}>"
+        self.jump_url = f"https://discord.com/channels/{guild.id}/{id}"
+        self.category = category
+        self.position = len(category.text_channels) if category else 0
+        self.messages: dict[int, FakeMessage] = {}
+        self.last_message: FakeMessage = None
+        self.last_message_id: int = None
+        self._webhook: FakeWebhook = None
+
+        if category:
+            category.text_channels.append(self)
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def category_id(self) -> int:
+        return self.category.id if self.category else None
+
+    async def send(self, content: str = "", **kwargs):
+        Calls.sends += 1
+        message = FakeMessage(self, self.guild.me, content or "")
+        self.messages[message.id] = message
+        self.last_message = message
+        return message
+
+    async def fetch_message(self, id: int):
+        if id not in self.messages:
+            self.messages[id] = FakeMessage(self, self.guild.me, id=id)
+        return self.messages[id]
+
+    async def delete_messages(self, messages, **kwargs):
+        Calls.deletes += len(messages)
+
+    async def webhooks(self) -> list[FakeWebhook]:
+        return [self._webhook] if self._webhook else []
+
+    async def create_webhook(self, **kwargs) -> FakeWebhook:
+        self._webhook = FakeWebhook(self)
+        return self._webhook
+
+
+class FakeCategory(object):
+    def __init__(self, guild: "FakeGuild", id: int, name: str):
+        self.guild = guild
+        self.id = id
+        self.name = name
+        self.mention = f"<#{id}>"
+        self.text_channels: list[FakeChannel] = []
+
+    def __str__(self):
+        return self.name
+
+
+class FakeGuild(object):
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
+        self.members_by_id: dict[int, FakeMember] = {}
+        self.roles_by_id: dict[int, FakeRole] = {}
+        self.channels_by_id: dict[int, FakeChannel | FakeCategory] = {}
+        self.me = self.add_member(next(_ids), "G0-T0", bot=True)
+
+    @property
+    def members(self) -> list[FakeMember]:
+        return list(self.members_by_id.values())
+
+    @property
+    def roles(self) -> list[FakeRole]:
+        return list(self.roles_by_id.values())
+
+    def add_member(self, id: int, name: str, bot: bool = False) -> FakeMember:
+        member = FakeMember(self, id, name, bot)
+        self.members_by_id[id] = member
+        return member
+
+    def add_role(self, id: int, name: str, members: list[FakeMember] = []) -> FakeRole:
+        role = FakeRole(self, id, name)
+        role.members = list(members)
+        for member in members:
+            member.roles.append(role)
+        self.roles_by_id[id] = role
+        return role
+
+    def add_channel(
+        self, id: int, name: str, category: FakeCategory = None
+    ) -> FakeChannel:
+        channel = FakeChannel(self, id, name, category)
+        self.channels_by_id[id] = channel
+        return channel
+
+    def add_category(self, id: int, name: str) -> FakeCategory:
+        category = FakeCategory(self, id, name)
+        self.channels_by_id[id] = category
+        return category
+
+    def get_member(self, id: int) -> FakeMember:
+        return self.members_by_id.get(id)
+
+    def get_role(self, id: int) -> FakeRole:
+        return self.roles_by_id.get(id)
+
+    def get_channel(self, id: int) -> FakeChannel | FakeCategory:
+        return self.channels_by_id.get(id)
+
+
+class FakeContext(object):
+    """Just enough of `commands.Context` for the webhook helpers and the invoke hooks."""
+
+    def __init__(
+        self,
+        bot: G0T0Bot,
+        channel: FakeChannel,
+        author: FakeMember,
+        message: FakeMessage = None,
+        invoked_with: str = None,
+        command=None,
+    ):
+        self.bot = bot
+        self.guild = channel.guild
+        self.channel = channel
+        self.author = author
+        self.message = message or FakeMessage(channel, author)
+        self.invoked_with = invoked_with
+        self.command = command or invoked_with
+        self.player = None
+        self.playerGuild = None
+
+    async def send(self, *args, **kwargs):
+        return await self.channel.send(*args, **kwargs)
+
+    async def respond(self, *args, **kwargs):
+        return await self.channel.send(*args, **kwargs)
+
+    async def defer(self, *args, **kwargs):
+        pass
+
+    async def delete(self, *args, **kwargs):
+        pass
+
+
+class BenchBot(G0T0Bot):
+    """
+    G0T0Bot with the gateway cache replaced by a single fake guild. Nothing connects to Discord.
+    """
+
+    def __init__(self, guild: FakeGuild, **options):
+        super().__init__(command_prefix=">", intents=discord.Intents.none(), **options)
+        self._bench_guild = guild
+
+    @property
+    def user(self) -> FakeMember:
+        return self._bench_guild.me
+
+    @property
+    def guilds(self) -> list[FakeGuild]:
+        return [self._bench_guild]
+
+    def get_guild(self, id: int) -> FakeGuild:
+        return self._bench_guild if id == self._bench_guild.id else None
+
+    def get_channel(self, id: int) -> FakeChannel | FakeCategory:
+        return self._bench_guild.get_channel(id)
+
+    def get_user(self, id: int) -> FakeMember:
+        return self._bench_guild.get_member(id)
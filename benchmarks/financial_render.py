@@ -0,0 +1,63 @@
+"""
+Times the FINANCIAL dashboard image render.
+
+Uses a generated background so no network access is needed:
+
+    python -m benchmarks.financial_render [iterations]
+"""
+
+import statistics
+import sys
+from io import BytesIO
+from timeit import default_timer as timer
+
+from PIL import Image
+
+from Resolute.helpers.financial_render import (
+    BAR_WIDTH,
+    build_base_layer,
+    render_progress,
+)
+
+
+def _background() -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (1024, 576), (40, 60, 90)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def _summary(name: str, samples: list[float]) -> str:
+    ordered = sorted(samples)
+    return (
+        f"{name:<12} n={len(ordered):<5} mean={statistics.mean(ordered) * 1000:8.2f}ms "
+        f"p95={ordered[int(len(ordered) * 0.95)] * 1000:8.2f}ms "
+        f"max={ordered[-1] * 1000:8.2f}ms"
+    )
+
+
+def run(iterations: int = 50) -> dict[str, list[float]]:
+    background = _background()
+    results = {"base_layer": [], "progress": []}
+
+    for _ in range(iterations):
+        start = timer()
+        base_layer = build_base_layer(background)
+        results["base_layer"].append(timer() - start)
+
+    for i in range(iterations):
+        start = timer()
+        render_progress(base_layer, int(BAR_WIDTH * (i % 100) / 100))
+        results["progress"].append(timer() - start)
+
+    return results
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    for name, samples in run(iterations).items():
+        print(_summary(name, samples))
+
+
+if __name__ == "__main__":
+    main()
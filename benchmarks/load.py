@@ -0,0 +1,529 @@
+"""
+Load generator for the RP message pipeline.
+
+Replays a stream of message events at a fixed rate through the `on_message` listeners, `>say`, guild and adventure
+NPC commands and the RP dashboard refresh they trigger, using fake Discord objects and a stubbed webhook transport.
+Each step reports throughput, p50/p95/p99 handling latency and DB pool saturation, and the highest rate that kept up
+is printed at the end:
+
+    BENCH_DATABASE_URL=postgresql://localhost/resolute_bench python -m benchmarks.suite --seed --only get_player
+    python -m benchmarks.load --rate 10 25 50 100 --duration 30 -o load.json
+
+Run it against a database seeded by `benchmarks.suite`. `--record` writes the synthetic stream to a JSON lines file
+(`author_id`, `channel_id` and `content` per event) and `--replay` plays such a file back instead, so a stream can
+be kept fixed between runs.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+from datetime import datetime, timezone
+from time import monotonic
+
+from aiopg.sa import Engine, SAConnection, create_engine
+
+from benchmarks.fakes import BenchBot, Calls, FakeContext, FakeMessage, FakeWebhook
+from benchmarks.seed import (
+    CHANNEL_ID_BASE,
+    DASHBOARD_POST_BASE,
+    GUILD_ID,
+    PLAYER_ID_BASE,
+    Scale,
+)
+from benchmarks.suite import _revision, build_guild
+from Resolute.cogs.characters import Character
+from Resolute.cogs.dashboards import Dashboards
+from Resolute.models.categories.categories import DashboardType
+from Resolute.models.objects.adventures import Adventure
+from Resolute.models.objects.dashboards import RefDashboard
+from Resolute.models.objects.enum import WebhookType
+from Resolute.models.objects.guilds import PlayerGuild
+from Resolute.models.objects.npc import NonPlayableCharacter
+from Resolute.models.objects.webhook import G0T0Webhook
+from Resolute.query_stats import MeasuredEngine
+
+log = logging.getLogger(__name__)
+
+RP_CATEGORY_ID = CHANNEL_ID_BASE + 2000000
+RP_BOARD_CHANNEL_ID = CHANNEL_ID_BASE + 2500000
+ADVENTURE_CATEGORY_ID = CHANNEL_ID_BASE + 3000000
+ADVENTURE_CHANNEL_ID = ADVENTURE_CATEGORY_ID + 1
+RP_DASHBOARD_POST_ID = DASHBOARD_POST_BASE + 1000
+NPC_ROLE_ID = 400000000000000001
+ADVENTURE_ROLE_ID = 400000000000000002
+
+GUILD_NPC = "guide"
+ADVENTURE_NPC = "villain"
+
+# Share of synthetic events per kind. Chatter is a plain message that only reaches the on_message listeners.
+MIX = {"say": 0.7, "npc": 0.1, "adventure_npc": 0.05, "chatter": 0.15}
+
+WORDS = (
+    "the blaster hums as she steps into the cantina and scans the crowd for any sign of the courier "
+    "while the band plays on and a droid rattles past with a tray of drinks"
+).split()
+
+
+async def prepare(conn: SAConnection, dms: list[int]) -> None:
+    """
+    Adds the RP dashboard, a guild NPC and an adventure with its own NPC to a seeded benchmark database. Rows
+    from earlier runs are replaced.
+    """
+    await conn.execute(
+        RefDashboard.ref_dashboard_table.delete().where(
+            RefDashboard.ref_dashboard_table.c.post_id == RP_DASHBOARD_POST_ID
+        )
+    )
+    await conn.execute(
+        NonPlayableCharacter.npc_table.delete().where(
+            NonPlayableCharacter.npc_table.c.guild_id == GUILD_ID
+        )
+    )
+    await conn.execute(
+        Adventure.adventures_table.delete().where(
+            Adventure.adventures_table.c.role_id == ADVENTURE_ROLE_ID
+        )
+    )
+
+    rp_type = await (
+        await conn.execute(
+            DashboardType.__table__.select().where(
+                DashboardType.__table__.c.value == "RP"
+            )
+        )
+    ).first()
+
+    await conn.execute(
+        RefDashboard.ref_dashboard_table.insert().values(
+            post_id=RP_DASHBOARD_POST_ID,
+            category_channel_id=RP_CATEGORY_ID,
+            channel_id=RP_BOARD_CHANNEL_ID,
+            excluded_channel_ids=[],
+            dashboard_type=rp_type["id"],
+        )
+    )
+
+    adventure = await (
+        await conn.execute(
+            Adventure.adventures_table.insert()
+            .values(
+                guild_id=GUILD_ID,
+                name="Load Adventure",
+                role_id=ADVENTURE_ROLE_ID,
+                dms=dms,
+                category_channel_id=ADVENTURE_CATEGORY_ID,
+                cc=0,
+                created_ts=datetime.now(timezone.utc),
+                characters=[],
+                factions=[],
+            )
+            .returning(Adventure.adventures_table.c.id)
+        )
+    ).first()
+
+    await conn.execute(
+        NonPlayableCharacter.npc_table.insert().values(
+            [
+                dict(
+                    guild_id=GUILD_ID,
+                    key=GUILD_NPC,
+                    name="Guide",
+                    roles=[NPC_ROLE_ID],
+                    adventure_id=None,
+                ),
+                dict(
+                    guild_id=GUILD_ID,
+                    key=ADVENTURE_NPC,
+                    name="Villain",
+                    roles=[],
+                    adventure_id=adventure["id"],
+                ),
+            ]
+        )
+    )
+
+
+def synthetic_events(
+    count: int, players: int, channels: int, dms: list[int], seed: int = 42
+) -> list[dict]:
+    rng = random.Random(seed)
+    kinds = list(MIX.keys())
+    weights = list(MIX.values())
+    events = []
+
+    for _ in range(count):
+        kind = rng.choices(kinds, weights)[0]
+        text = " ".join(rng.choices(WORDS, k=rng.randint(3, 60)))
+        author_id = PLAYER_ID_BASE + rng.randint(1, players)
+        channel_id = RP_CATEGORY_ID + rng.randint(1, channels)
+
+        if kind == "say":
+            content = f">say {text}"
+        elif kind == "npc":
+            content = f">{GUILD_NPC} {text}"
+        elif kind == "adventure_npc":
+            content = f">{ADVENTURE_NPC} {text}"
+            author_id = rng.choice(dms)
+            channel_id = ADVENTURE_CHANNEL_ID
+        else:
+            content = text
+
+        events.append(
+            {"author_id": author_id, "channel_id": channel_id, "content": content}
+        )
+
+    return events
+
+
+def _percentiles(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return ordered[min(int(len(ordered) * p), len(ordered) - 1)] if ordered else 0
+
+    return {
+        "p50": pct(0.5),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+        "max": ordered[-1] if ordered else 0,
+    }
+
+
+class PoolSampler(object):
+    """
+    Samples the engine's connection pool while a step runs.
+    Attributes:
+        samples (list[int]): Connections in use at each sample.
+        saturated (int): Samples where every connection was in use and the pool was at its maximum size.
+    """
+
+    def __init__(self, engine: Engine, interval: float = 0.05):
+        self.engine = engine
+        self.interval = interval
+        self.samples: list[int] = []
+        self.saturated = 0
+        self._task: asyncio.Task = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._sample())
+
+    def stop(self) -> dict:
+        self._task.cancel()
+
+        return {
+            "max_size": self.engine.maxsize,
+            "in_use_mean": (
+                sum(self.samples) / len(self.samples) if self.samples else 0
+            ),
+            "in_use_max": max(self.samples, default=0),
+            "saturated": self.saturated / len(self.samples) if self.samples else 0,
+        }
+
+    async def _sample(self) -> None:
+        while True:
+            self.samples.append(self.engine.size - self.engine.freesize)
+            if self.engine.freesize == 0 and self.engine.size >= self.engine.maxsize:
+                self.saturated += 1
+            await asyncio.sleep(self.interval)
+
+
+class LoadGenerator(object):
+    """
+    Drives message events through the same steps the gateway dispatch would: every `on_message` listener, then for
+    `>` prefixed messages the invoke hooks around the `>say` or NPC handler.
+    """
+
+    def __init__(self, bot: BenchBot):
+        self.bot = bot
+        self.listeners = [
+            method
+            for cog in bot.cogs.values()
+            for name, method in cog.get_listeners()
+            if name == "on_message"
+        ]
+
+    async def handle(self, event: dict) -> None:
+        guild = self.bot.get_guild(GUILD_ID)
+        channel = guild.get_channel(event["channel_id"])
+        author = guild.get_member(event["author_id"])
+        message = FakeMessage(channel, author, event["content"])
+
+        for listener in self.listeners:
+            await listener(message)
+
+        if not message.content.startswith(">"):
+            return
+
+        invoked_with = message.content[1:].split(" ", 1)[0]
+        ctx = FakeContext(
+            self.bot,
+            channel,
+            author,
+            message,
+            invoked_with,
+            self.bot.get_command(invoked_with),
+        )
+
+        if invoked_with == "say":
+            webhook = G0T0Webhook(ctx)
+        else:
+            webhook = G0T0Webhook(
+                ctx,
+                type=(
+                    WebhookType.adventure
+                    if channel.category and channel.category.id == ADVENTURE_CATEGORY_ID
+                    else WebhookType.npc
+                ),
+            )
+
+        await self.bot.before_invoke_setup(ctx)
+        try:
+            await webhook.send()
+        finally:
+            await self.bot.after_invoke_teardown(ctx)
+
+    async def run_step(
+        self, events: list[dict], rate: float, duration: float, drain: float
+    ) -> dict:
+        """
+        Offers `rate` events per second for `duration` seconds. Latency is measured from when each event was due,
+        so time spent waiting behind a backed up loop counts against it.
+        """
+        count = max(1, int(rate * duration))
+        latencies: list[float] = []
+        errors: dict[str, int] = {}
+
+        async def timed(event: dict, due: float):
+            try:
+                await self.handle(event)
+            except Exception as error:
+                name = type(error).__name__
+                if name not in errors:
+                    log.warning(f"LOAD: {name} handling {event}", exc_info=error)
+                errors[name] = errors.get(name, 0) + 1
+            finally:
+                latencies.append(monotonic() - due)
+
+        self.bot.query_stats.reset()
+        Calls.reset()
+        pool = PoolSampler(self.bot.db)
+        pool.start()
+
+        start = monotonic()
+        tasks = []
+
+        for i in range(count):
+            due = start + i / rate
+            if (delay := due - monotonic()) > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(timed(events[i % len(events)], due)))
+
+        offered = monotonic() - start
+        _, pending = await asyncio.wait(tasks, timeout=drain)
+        elapsed = monotonic() - start
+
+        for task in pending:
+            task.cancel()
+
+        statements = self.bot.query_stats.metrics()["statements"].values()
+        queries = sum(s["count"] for s in statements)
+        pool_wait = sum(s["pool_wait"] for s in statements)
+        queue = self.bot.send_queue.metrics()
+
+        return {
+            "rate": rate,
+            "events": count,
+            "completed": len(latencies),
+            "unfinished": len(pending),
+            "errors": errors,
+            "offered_rate": count / offered if offered else rate,
+            "throughput": len(latencies) / elapsed,
+            "latency": _percentiles(latencies),
+            "queries_per_event": queries / count,
+            "pool": {
+                **pool.stop(),
+                "mean_wait": pool_wait / queries if queries else 0,
+            },
+            "send_queue": {
+                "depth": queue["depth"],
+                "rate_limited": queue["rate_limited"],
+                "dropped": queue["dropped"],
+            },
+            "discord": Calls.as_dict(),
+        }
+
+
+def sustained(step: dict, slo: float) -> bool:
+    return (
+        not step["unfinished"]
+        and not step["errors"]
+        and step["throughput"] >= step["rate"] * 0.95
+        and step["latency"]["p95"] <= slo
+    )
+
+
+def report(steps: list[dict], slo: float) -> str:
+    lines = [
+        f"{'Rate':>8}{'Done/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'Pool use':>10}{'Saturated':>11}{'Errors':>8}"
+    ]
+
+    for step in steps:
+        latency = step["latency"]
+        lines.append(
+            f"{step['rate']:>8.1f}{step['throughput']:>9.1f}"
+            f"{latency['p50'] * 1000:>7.0f}ms{latency['p95'] * 1000:>7.0f}ms{latency['p99'] * 1000:>7.0f}ms"
+            f"{step['pool']['in_use_max']:>6}/{step['pool']['max_size']:<3}"
+            f"{step['pool']['saturated'] * 100:>10.1f}%{sum(step['errors'].values()):>8}"
+        )
+
+    best = max((s["rate"] for s in steps if sustained(s, slo)), default=None)
+    lines.append(
+        f"Highest sustained rate (p95 <= {slo:.2f}s): {best:.1f} events/s"
+        if best
+        else f"No step was sustained with p95 <= {slo:.2f}s"
+    )
+
+    return "\n".join(lines)
+
+
+async def main(args: argparse.Namespace) -> dict:
+    scale = Scale(players=args.players)
+    dms = [PLAYER_ID_BASE + i for i in range(1, 6)]
+
+    if args.replay:
+        with open(args.replay) as f:
+            events = [json.loads(line) for line in f if line.strip()]
+    else:
+        events = synthetic_events(
+            int(max(args.rate) * args.duration), args.players, args.channels, dms
+        )
+
+    if args.record:
+        with open(args.record, "w") as f:
+            f.writelines(json.dumps(event) + "\n" for event in events)
+
+    FakeWebhook.latency = args.transport_latency
+    engine = await create_engine(args.dsn, maxsize=args.pool_size)
+
+    async with engine.acquire() as conn:
+        await prepare(conn, dms)
+
+    guild = build_guild(scale)
+    guild.add_role(NPC_ROLE_ID, "NPC", guild.members)
+    guild.add_role(ADVENTURE_ROLE_ID, "Load Adventure")
+    rp_category = guild.add_category(RP_CATEGORY_ID, "Roleplay")
+    for i in range(1, args.channels + 1):
+        guild.add_channel(RP_CATEGORY_ID + i, f"rp-{i}", rp_category)
+    guild.add_channel(RP_BOARD_CHANNEL_ID, "rp-board")
+    guild.add_channel(
+        ADVENTURE_CHANNEL_ID,
+        "adventure",
+        guild.add_category(ADVENTURE_CATEGORY_ID, "Load Adventure"),
+    )
+
+    bot = BenchBot(guild)
+    bot.db = MeasuredEngine(engine, bot.query_stats)
+    bot.add_cog(Dashboards(bot))
+    bot.add_cog(Character(bot))
+    generator = LoadGenerator(bot)
+    steps = []
+
+    try:
+        await bot.compendium.reload_categories(bot)
+        await PlayerGuild.get_player_guild(bot, GUILD_ID)
+        for npc in await NonPlayableCharacter.get_all(bot):
+            await npc.register_command(bot)
+        dashboard = await RefDashboard.get_dashboard(
+            bot, message_id=RP_DASHBOARD_POST_ID
+        )
+        await dashboard.refresh(bot)
+        bot.loop_monitor.threshold = 0
+        bot.loop_monitor.start()
+
+        for rate in args.rate:
+            step = await generator.run_step(events, rate, args.duration, args.drain)
+            step["loop_lag"] = bot.loop_monitor.metrics()
+            steps.append(step)
+            log.info(f"LOAD: {rate}/s -> {step['throughput']:.1f}/s")
+    finally:
+        bot.loop_monitor.stop()
+        engine.close()
+        await engine.wait_closed()
+
+    return {
+        "meta": {
+            "revision": _revision(),
+            "players": args.players,
+            "channels": args.channels,
+            "duration": args.duration,
+            "transport_latency": args.transport_latency,
+            "pool_size": args.pool_size,
+            "replay": args.replay,
+            "events": len(events),
+        },
+        "steps": steps,
+    }
+
+
+def parse_args(argv: list[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dsn", default=os.environ.get("BENCH_DATABASE_URL"))
+    parser.add_argument(
+        "--rate",
+        type=float,
+        nargs="+",
+        default=[10.0],
+        help="Events per second, one step per rate",
+    )
+    parser.add_argument("--duration", type=float, default=30, help="Seconds per step")
+    parser.add_argument(
+        "--drain",
+        type=float,
+        default=30,
+        help="Seconds to wait for in-flight events after a step",
+    )
+    parser.add_argument(
+        "--players",
+        type=int,
+        default=Scale.players,
+        help="Players in the seeded database",
+    )
+    parser.add_argument(
+        "--channels", type=int, default=50, help="RP channels to spread posts over"
+    )
+    parser.add_argument(
+        "--transport-latency",
+        type=float,
+        default=0.05,
+        help="Seconds each stubbed webhook call takes",
+    )
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument(
+        "--slo", type=float, default=1.0, help="p95 latency a sustained step must meet"
+    )
+    parser.add_argument("--record", help="Write the event stream to this file")
+    parser.add_argument("--replay", help="Replay events from this file")
+    parser.add_argument("-o", "--output", help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    if not args.dsn:
+        parser.error("--dsn or BENCH_DATABASE_URL is required")
+
+    return args
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.WARNING, format="%(asctime)s %(name)s: %(message)s"
+    )
+    args = parse_args()
+    output = asyncio.run(main(args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+
+    print(report(output["steps"], args.slo))
@@ -0,0 +1,423 @@
+"""
+Query-count regression checks for the bot's hot entry points.
+
+Seeds a dedicated PostgreSQL database (everything in it is dropped) with a small fixture player (one character,
+adventure and arena) and a large one (many of each), then counts every statement sent through the engine while
+each entry point runs once for each of them. A check fails when a call runs more statements than its bound, or
+when the large player needs more statements than the small one, which is what an N+1 query looks like:
+
+    BENCH_DATABASE_URL=postgresql://localhost/resolute_bench python -m benchmarks.query_counts
+
+The exit status is non-zero when any check fails, so it can gate CI.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+from aiopg.sa import Engine, SAConnection, create_engine
+from discord.ext import commands
+
+from benchmarks.fakes import BenchBot, FakeContext, FakeGuild
+from benchmarks.seed import (
+    CHANNEL_ID_BASE,
+    GUILD_ID,
+    PLAYER_ID_BASE,
+    STIPEND_ROLE_ID,
+    Scale,
+    reset_schema,
+    seed_compendium,
+    seed_guild,
+)
+from Resolute.models.objects.adventures import Adventure
+from Resolute.models.objects.arenas import Arena
+from Resolute.helpers import needs_context
+from Resolute.models.objects.characters import (
+    CharacterRenown,
+    PlayerCharacter,
+    PlayerCharacterClass,
+)
+from Resolute.models.objects.enum import ContextLevel
+from Resolute.models.objects.guilds import PlayerGuild
+from Resolute.models.objects.logs import DBLog
+from Resolute.models.objects.players import Player
+from Resolute.query_stats import MeasuredEngine, statement_shape
+
+log = logging.getLogger(__name__)
+
+SMALL_PLAYER_ID = PLAYER_ID_BASE + 1
+LARGE_PLAYER_ID = PLAYER_ID_BASE + 2
+ROLE_ID_BASE = 500000000000000000
+ARENA_CHANNEL_BASE = CHANNEL_ID_BASE + 1000000
+
+# Most statements a single call may run. Raise a bound only alongside the change that needs it.
+BOUNDS = {
+    "Player.get_player": 16,
+    "Player.upsert": 16,
+    "DBLog.create": 55,
+    "Adventure.fetch_from_ctx": 5,
+    "Arena.get_arena": 4,
+    "PlayerGuild.fetch": 4,
+    "before_invoke (guild)": 1,
+    "before_invoke (player)": 5,
+    "before_invoke (full)": 17,
+}
+
+
+class CountingEngine(object):
+    """
+    Wraps an aiopg engine and records every statement executed on connections acquired from it. Code that
+    acquires connections directly is counted as well as everything going through `G0T0Bot.query`.
+    Attributes:
+        statements (list[str]): Compiled SQL of every statement executed so far.
+    Methods:
+        count(call) -> list[str]:
+            Awaits the call and returns the statements it executed.
+    """
+
+    def __init__(self, engine: Engine):
+        self._engine = engine
+        self.statements: list[str] = []
+
+    def __getattr__(self, name):
+        return getattr(self._engine, name)
+
+    def acquire(self) -> "_CountingAcquire":
+        return _CountingAcquire(self, self._engine.acquire())
+
+    async def count(self, call: Awaitable) -> list[str]:
+        start = len(self.statements)
+        await call
+        return self.statements[start:]
+
+
+class _CountingAcquire(object):
+    def __init__(self, engine: CountingEngine, context):
+        self._engine = engine
+        self._context = context
+
+    async def __aenter__(self) -> "_CountingConnection":
+        return _CountingConnection(self._engine, await self._context.__aenter__())
+
+    async def __aexit__(self, *exc):
+        return await self._context.__aexit__(*exc)
+
+
+class _CountingConnection(object):
+    def __init__(self, engine: CountingEngine, conn: SAConnection):
+        self._engine = engine
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def execute(self, query, *multiparams, **params):
+        self._engine.statements.append(
+            query
+            if isinstance(query, str)
+            else str(query.compile(dialect=self._engine.dialect))
+        )
+        return self._conn.execute(query, *multiparams, **params)
+
+
+@dataclass
+class Fixture(object):
+    player_id: int
+    size: int
+    offset: int
+    adventure_id: int = None
+
+    @property
+    def arena_channel_id(self) -> int:
+        return ARENA_CHANNEL_BASE + self.offset
+
+
+async def seed_fixture(conn: SAConnection, fixture: Fixture) -> None:
+    """
+    Seeds a player with `fixture.size` level 1 characters, adventures and arenas. The first adventure and arena
+    hold every character, the rest one each, and the player DMs or hosts every other one.
+    """
+    now = datetime.now(timezone.utc)
+
+    await conn.execute(
+        Player.player_table.insert().values(
+            id=fixture.player_id,
+            guild_id=GUILD_ID,
+            handicap_amount=0,
+            cc=10000,
+            div_cc=0,
+            points=0,
+            activity_points=0,
+            activity_level=0,
+            statistics="{}",
+            level_tokens=0,
+            level_ups_earned=0,
+        )
+    )
+
+    results = await conn.execute(
+        PlayerCharacter.characters_table.insert()
+        .values(
+            [
+                dict(
+                    name=f"Fixture {fixture.player_id}-{i}",
+                    species=1,
+                    credits=0,
+                    level=1,
+                    player_id=fixture.player_id,
+                    guild_id=GUILD_ID,
+                    active=True,
+                    primary_character=i == 0,
+                    channels=[],
+                    faction=1,
+                )
+                for i in range(fixture.size)
+            ]
+        )
+        .returning(PlayerCharacter.characters_table.c.id)
+    )
+    characters = [row["id"] for row in await results.fetchall()]
+
+    await conn.execute(
+        PlayerCharacterClass.character_class_table.insert().values(
+            [dict(character_id=c, primary_class=1, active=True) for c in characters]
+        )
+    )
+    await conn.execute(
+        CharacterRenown.renown_table.insert().values(
+            [dict(character_id=c, faction=1, renown=10) for c in characters]
+        )
+    )
+
+    results = await conn.execute(
+        Adventure.adventures_table.insert()
+        .values(
+            [
+                dict(
+                    guild_id=GUILD_ID,
+                    name=f"Adventure {fixture.player_id}-{i}",
+                    role_id=ROLE_ID_BASE + fixture.offset + i,
+                    dms=[fixture.player_id] if i % 2 else [],
+                    category_channel_id=CHANNEL_ID_BASE + fixture.offset + i,
+                    cc=0,
+                    created_ts=now,
+                    characters=characters if i == 0 else [characters[i]],
+                    factions=[],
+                )
+                for i in range(fixture.size)
+            ]
+        )
+        .returning(Adventure.adventures_table.c.id)
+    )
+    fixture.adventure_id = (await results.fetchall())[0]["id"]
+
+    await conn.execute(
+        Arena.arenas_table.insert().values(
+            [
+                dict(
+                    channel_id=fixture.arena_channel_id + i,
+                    pin_message_id=fixture.arena_channel_id + i,
+                    host_id=fixture.player_id if i % 2 else 0,
+                    tier=1,
+                    type=1,
+                    completed_phases=0,
+                    created_ts=now,
+                    characters=characters if i == 0 else [characters[i]],
+                )
+                for i in range(fixture.size)
+            ]
+        )
+    )
+
+
+def build_guild(fixtures: list[Fixture]) -> FakeGuild:
+    guild = FakeGuild(GUILD_ID, "Query Count Guild")
+    guild.add_role(STIPEND_ROLE_ID, "Stipend")
+
+    for fixture in fixtures:
+        guild.add_member(fixture.player_id, f"player{fixture.player_id}")
+
+        for i in range(fixture.size):
+            guild.add_role(ROLE_ID_BASE + fixture.offset + i, f"adventure-{i}")
+            guild.add_channel(CHANNEL_ID_BASE + fixture.offset + i, f"adventure-{i}")
+            guild.add_channel(fixture.arena_channel_id + i, f"arena-{i}")
+
+    return guild
+
+
+async def get_player(bot: BenchBot, engine: CountingEngine, fixture: Fixture):
+    return await engine.count(Player.get_player(bot, fixture.player_id, GUILD_ID))
+
+
+async def player_upsert(bot: BenchBot, engine: CountingEngine, fixture: Fixture):
+    player = await Player.get_player(bot, fixture.player_id, GUILD_ID)
+    return await engine.count(player.upsert())
+
+
+async def dblog_create(bot: BenchBot, engine: CountingEngine, fixture: Fixture):
+    player = await Player.get_player(bot, fixture.player_id, GUILD_ID)
+    return await engine.count(
+        DBLog.create(
+            bot,
+            None,
+            player,
+            player,
+            "RP",
+            character=player.characters[0],
+            silent=True,
+        )
+    )
+
+
+async def adventure_fetch(bot: BenchBot, engine: CountingEngine, fixture: Fixture):
+    ctx = FakeContext(
+        bot,
+        bot.get_channel(fixture.arena_channel_id),
+        bot.get_user(fixture.player_id),
+    )
+    return await engine.count(
+        Adventure.fetch_from_ctx(ctx, adventure_id=fixture.adventure_id)
+    )
+
+
+async def arena_get(bot: BenchBot, engine: CountingEngine, fixture: Fixture):
+    return await engine.count(Arena.get_arena(bot, fixture.arena_channel_id))
+
+
+async def guild_fetch(bot: BenchBot, engine: CountingEngine, fixture: Fixture):
+    return await engine.count(
+        PlayerGuild(bot.db, guild=bot.get_guild(GUILD_ID)).fetch()
+    )
+
+
+def _declared_command(level: ContextLevel) -> commands.Command:
+    async def command(ctx):
+        pass
+
+    return commands.Command(needs_context(level)(command), name=f"{level.name}_context")
+
+
+async def _invoke(
+    bot: BenchBot, engine: CountingEngine, fixture: Fixture, level: ContextLevel
+):
+    ctx = FakeContext(
+        bot,
+        bot.get_channel(fixture.arena_channel_id),
+        bot.get_user(fixture.player_id),
+        command=_declared_command(level),
+    )
+    try:
+        return await engine.count(bot.before_invoke_setup(ctx))
+    finally:
+        await bot.after_invoke_teardown(ctx)
+
+
+async def invoke_guild(bot: BenchBot, engine: CountingEngine, fixture: Fixture):
+    return await _invoke(bot, engine, fixture, ContextLevel.guild)
+
+
+async def invoke_player(bot: BenchBot, engine: CountingEngine, fixture: Fixture):
+    return await _invoke(bot, engine, fixture, ContextLevel.player)
+
+
+async def invoke_full(bot: BenchBot, engine: CountingEngine, fixture: Fixture):
+    return await _invoke(bot, engine, fixture, ContextLevel.full)
+
+
+CHECKS: dict[
+    str, Callable[[BenchBot, CountingEngine, Fixture], Awaitable[list[str]]]
+] = {
+    "Player.get_player": get_player,
+    "Player.upsert": player_upsert,
+    "DBLog.create": dblog_create,
+    "Adventure.fetch_from_ctx": adventure_fetch,
+    "Arena.get_arena": arena_get,
+    "PlayerGuild.fetch": guild_fetch,
+    "before_invoke (guild)": invoke_guild,
+    "before_invoke (player)": invoke_player,
+    "before_invoke (full)": invoke_full,
+}
+
+
+def _shapes(statements: list[str]) -> str:
+    counts: dict[str, int] = {}
+    for statement in statements:
+        shape = statement_shape(statement)
+        counts[shape] = counts.get(shape, 0) + 1
+
+    return "\n".join(f"    {count:>4}x {shape}" for shape, count in counts.items())
+
+
+async def main(args: argparse.Namespace) -> bool:
+    fixtures = [
+        Fixture(SMALL_PLAYER_ID, 1, 0),
+        Fixture(LARGE_PLAYER_ID, args.large, 1),
+    ]
+    engine = CountingEngine(await create_engine(args.dsn))
+
+    try:
+        async with engine.acquire() as conn:
+            await reset_schema(conn)
+            await seed_compendium(conn)
+            await seed_guild(conn, Scale(players=len(fixtures)))
+            for fixture in fixtures:
+                await seed_fixture(conn, fixture)
+
+        bot = BenchBot(build_guild(fixtures))
+        bot.db = MeasuredEngine(engine, bot.query_stats)
+        await bot.compendium.reload_categories(bot)
+        await PlayerGuild.get_player_guild(bot, GUILD_ID)
+
+        passed = True
+        print(f"{'Entry point':<28}{'Small':>7}{'Large':>7}{'Bound':>7}")
+
+        for name, check in CHECKS.items():
+            small, large = [await check(bot, engine, fixture) for fixture in fixtures]
+            bound = BOUNDS[name]
+            ok = (
+                len(small) <= bound and len(large) <= bound and len(large) == len(small)
+            )
+            passed &= ok
+
+            print(
+                f"{name:<28}{len(small):>7}{len(large):>7}{bound:>7}  {'ok' if ok else 'FAIL'}"
+            )
+            if not ok or args.verbose:
+                print(_shapes(large))
+    finally:
+        engine.close()
+        await engine.wait_closed()
+
+    return passed
+
+
+def parse_args(argv: list[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dsn", default=os.environ.get("BENCH_DATABASE_URL"))
+    parser.add_argument(
+        "--large",
+        type=int,
+        default=25,
+        help="Characters, adventures and arenas for the large fixture player",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="List statements for every check"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.dsn:
+        parser.error("--dsn or BENCH_DATABASE_URL is required")
+    if args.large < 2:
+        parser.error("--large must be at least 2")
+
+    return args
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    sys.exit(0 if asyncio.run(main(parse_args())) else 1)
@@ -0,0 +1,322 @@
+"""
+Seeds a dedicated PostgreSQL database with a synthetic guild for the benchmark suite.
+
+Everything in the target database is dropped and recreated, so never point this at a real one.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from timeit import default_timer as timer
+
+import sqlalchemy as sa
+from aiopg.sa import SAConnection
+
+from Resolute.bot import create_tables
+from Resolute.models import metadata
+from Resolute.models.categories.categories import (
+    Activity,
+    ActivityPoints,
+    ArenaTier,
+    ArenaType,
+    CharacterArchetype,
+    CharacterClass,
+    CharacterSpecies,
+    CodeConversion,
+    DashboardType,
+    Faction,
+    LevelCost,
+    LevelTier,
+    Rarity,
+    TransactionSubType,
+    TransactionType,
+)
+from Resolute.models.objects.dashboards import RefDashboard
+from Resolute.models.objects.guilds import PlayerGuild
+from Resolute.models.objects.ref_objects import RefWeeklyStipend
+
+log = logging.getLogger(__name__)
+
+GUILD_ID = 900000000000000001
+PLAYER_ID_BASE = 100000000000000000
+STIPEND_ROLE_ID = 800000000000000001
+CHANNEL_ID_BASE = 700000000000000000
+DASHBOARD_POST_BASE = 600000000000000000
+
+CLASSES = [
+    "Berserker",
+    "Consular",
+    "Engineer",
+    "Fighter",
+    "Guardian",
+    "Monk",
+    "Operative",
+    "Scholar",
+    "Scout",
+    "Sentinel",
+]
+
+# (value, cc, diversion, points, credit_ratio, level_up_token)
+ACTIVITIES = [
+    ("RP", 100, True, 1, 1.0, False),
+    ("ARENA", 100, False, 1, 1.0, False),
+    ("ARENA_HOST", 100, False, 1, 1.0, False),
+    ("GLOBAL", 100, False, 1, 1.0, False),
+    ("SNAPSHOT", 100, True, 1, 1.0, False),
+    ("BONUS", 0, False, 0, None, False),
+    ("NEW_CHARACTER", 0, False, 0, None, False),
+    ("CONVERSION", 0, False, 0, None, False),
+    ("STIPEND", 0, False, 0, None, False),
+    ("LOG_REWARD", 100, False, 0, None, False),
+    ("BUY", 0, False, 0, None, False),
+    ("SELL", 0, False, 0, None, False),
+    ("LEVEL", 0, False, 0, None, True),
+]
+
+
+@dataclass
+class Scale(object):
+    players: int = 20000
+    characters_per_player: int = 3
+    logs_per_character: int = 40
+    stipend_members: int = 500
+    channels: int = 50
+
+    @property
+    def characters(self) -> int:
+        return self.players * self.characters_per_player
+
+    @property
+    def logs(self) -> int:
+        return self.characters * self.logs_per_character
+
+
+def _rows(table: sa.Table, rows: list[dict]) -> sa.sql.Insert:
+    return table.insert().values(rows)
+
+
+async def reset_schema(conn: SAConnection) -> None:
+    for table in reversed(metadata.sorted_tables):
+        await conn.execute(f'DROP TABLE IF EXISTS "{table.name}" CASCADE')
+        await conn.execute(f'DROP VIEW IF EXISTS "{table.name}" CASCADE')
+
+    await create_tables(conn)
+
+
+async def seed_compendium(conn: SAConnection) -> None:
+    await conn.execute(
+        _rows(Rarity.__table__, [{"value": v} for v in ["Standard", "Premium", "Rare"]])
+    )
+    await conn.execute(_rows(CharacterClass.__table__, [{"value": v} for v in CLASSES]))
+    await conn.execute(
+        _rows(
+            CharacterArchetype.__table__,
+            [
+                {"parent": p + 1, "value": f"{c} Archetype {i}"}
+                for p, c in enumerate(CLASSES)
+                for i in range(1, 4)
+            ],
+        )
+    )
+    await conn.execute(
+        _rows(
+            CharacterSpecies.__table__,
+            [{"value": f"Species {i}"} for i in range(1, 31)],
+        )
+    )
+    await conn.execute(
+        _rows(
+            ArenaTier.__table__,
+            [{"avg_level": l, "max_phases": 3} for l in (3, 6, 9, 12, 15, 18)],
+        )
+    )
+    await conn.execute(
+        _rows(
+            Activity.__table__,
+            [
+                dict(
+                    value=value,
+                    cc=cc,
+                    diversion=diversion,
+                    points=points,
+                    credit_ratio=credit_ratio,
+                    level_up_token=level_up_token,
+                )
+                for value, cc, diversion, points, credit_ratio, level_up_token in ACTIVITIES
+            ],
+        )
+    )
+    await conn.execute(
+        _rows(
+            DashboardType.__table__,
+            [{"value": v} for v in ["RP", "CCENSUS", "LDIST", "FINANCIAL"]],
+        )
+    )
+    await conn.execute(
+        _rows(
+            CodeConversion.__table__,
+            [{"id": l, "value": 100 * l} for l in range(1, 21)],
+        )
+    )
+    await conn.execute(
+        _rows(
+            ArenaType.__table__,
+            [{"id": i, "value": v} for i, v in enumerate(["COMBAT", "NARRATIVE"], 1)],
+        )
+    )
+    await conn.execute(
+        _rows(
+            TransactionType.__table__,
+            [
+                {"id": 1, "value": "Buy", "currency": "Credits"},
+                {"id": 2, "value": "Sell", "currency": "Credits"},
+            ],
+        )
+    )
+    await conn.execute(
+        _rows(
+            TransactionSubType.__table__,
+            [
+                {"id": 1, "parent": 1, "value": "Item"},
+                {"id": 2, "parent": 2, "value": "Item"},
+            ],
+        )
+    )
+    await conn.execute(
+        _rows(LevelCost.__table__, [{"id": l, "cc": 1000 * l} for l in range(1, 21)])
+    )
+    await conn.execute(
+        _rows(Faction.__table__, [{"value": f"Faction {i}"} for i in range(1, 11)])
+    )
+    await conn.execute(
+        _rows(
+            ActivityPoints.__table__,
+            [{"id": i, "points": 5 * i} for i in range(1, 6)],
+        )
+    )
+    await conn.execute(
+        _rows(
+            LevelTier.__table__,
+            [{"id": l, "tier": min(6, (l + 3) // 4 + 1)} for l in range(1, 21)],
+        )
+    )
+
+
+async def seed_guild(conn: SAConnection, scale: Scale) -> None:
+    await conn.execute(
+        PlayerGuild.guilds_table.insert().values(
+            id=GUILD_ID,
+            max_level=20,
+            weeks=0,
+            reset_day=0,
+            reset_hour=0,
+            last_reset=datetime.now(timezone.utc),
+            handicap_cc=0,
+            max_characters=scale.characters_per_player + 1,
+            div_limit=1000,
+            weekly_announcement=[],
+            ping_announcement=False,
+            server_date=1000,
+        )
+    )
+    await conn.execute(
+        RefWeeklyStipend.ref_weekly_stipend_table.insert().values(
+            role_id=STIPEND_ROLE_ID,
+            guild_id=GUILD_ID,
+            amount=100,
+            reason="Benchmark stipend",
+            leadership=False,
+        )
+    )
+
+    dashboard_types = {
+        row["value"]: row["id"]
+        for row in await (
+            await conn.execute(DashboardType.__table__.select())
+        ).fetchall()
+    }
+    await conn.execute(
+        _rows(
+            RefDashboard.ref_dashboard_table,
+            [
+                {
+                    "post_id": DASHBOARD_POST_BASE + i,
+                    "channel_id": CHANNEL_ID_BASE + i,
+                    "excluded_channel_ids": [],
+                    "dashboard_type": dashboard_types[value],
+                }
+                for i, value in enumerate(["CCENSUS", "LDIST"])
+            ],
+        )
+    )
+
+
+async def seed_players(conn: SAConnection, scale: Scale) -> None:
+    params = dict(
+        guild_id=GUILD_ID,
+        base=PLAYER_ID_BASE,
+        players=scale.players,
+        per_player=scale.characters_per_player,
+        logs=scale.logs_per_character,
+        classes=len(CLASSES),
+        factions=10,
+        activities=len(ACTIVITIES),
+    )
+
+    statements = [
+        # Players
+        """
+        INSERT INTO players (id, guild_id, handicap_amount, cc, div_cc, points, activity_points,
+                             activity_level, statistics, level_tokens, level_ups_earned)
+        SELECT %(base)s + g, %(guild_id)s, 0, (g * 37) %% 5000, 0, 0, 0, 0, '{}', 0, 0
+        FROM generate_series(1, %(players)s) g
+        """,
+        # Characters, a few per player
+        """
+        INSERT INTO characters (name, species, credits, level, player_id, guild_id, active,
+                                primary_character, channels, faction, dob)
+        SELECT 'Character ' || p || '-' || c, 1 + (p + c) %% 30, (p * c * 53) %% 20000,
+               1 + (p + c) %% 20, %(base)s + p, %(guild_id)s, c = 1 OR c < %(per_player)s,
+               c = 1, '{}', 1 + p %% %(factions)s, (p * 7) %% 365
+        FROM generate_series(1, %(players)s) p, generate_series(1, %(per_player)s) c
+        """,
+        """
+        INSERT INTO character_class (character_id, primary_class, archetype, active)
+        SELECT id, 1 + id %% %(classes)s, NULL, true FROM characters
+        """,
+        """
+        INSERT INTO renown (character_id, faction, renown)
+        SELECT id, 1 + id %% %(factions)s, id %% 50 FROM characters
+        """,
+        # Logs, spread over the last two years
+        """
+        INSERT INTO log (author, cc, credits, created_ts, character_id, activity, notes,
+                         renown, invalid, player_id, guild_id)
+        SELECT ch.player_id, (l * 13) %% 200 - 20, (l * 31) %% 500, now() - (l || ' hours')::interval,
+               ch.id, 1 + (ch.id + l) %% %(activities)s, NULL, 0, l %% 50 = 0,
+               ch.player_id, ch.guild_id
+        FROM characters ch, generate_series(1, %(logs)s) l
+        """,
+    ]
+
+    for statement in statements:
+        start = timer()
+        await conn.execute(statement, params)
+        log.info(f"SEED: {statement.split()[2]} in {timer() - start:.2f}s")
+
+    await conn.execute("ANALYZE")
+
+
+async def seed(conn: SAConnection, scale: Scale) -> None:
+    """
+    Drops and recreates the schema, then seeds the compendium and one synthetic guild at the given scale.
+    Args:
+        conn (SAConnection): Connection to the benchmark database.
+        scale (Scale): How many players, characters and logs to create.
+    """
+    start = timer()
+    await reset_schema(conn)
+    await seed_compendium(conn)
+    await seed_guild(conn, scale)
+    await seed_players(conn, scale)
+    log.info(f"SEED: Finished in {timer() - start:.2f}s")
@@ -0,0 +1,343 @@
+"""
+Benchmark suite against a synthetic large guild.
+
+Seeds a dedicated PostgreSQL database (everything in it is dropped), then times the bot's hot paths with fake
+Discord objects and writes the results as JSON so runs can be compared between releases:
+
+    BENCH_DATABASE_URL=postgresql://localhost/resolute_bench python -m benchmarks.suite --seed -o before.json
+    python -m benchmarks.suite -o after.json --compare before.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict
+from datetime import datetime, timezone
+from timeit import default_timer as timer
+from types import SimpleNamespace
+from typing import Awaitable, Callable
+
+from aiopg.sa import create_engine
+
+from benchmarks import financial_render
+from benchmarks.fakes import BenchBot, Calls, FakeContext, FakeGuild
+from benchmarks.seed import (
+    CHANNEL_ID_BASE,
+    DASHBOARD_POST_BASE,
+    GUILD_ID,
+    PLAYER_ID_BASE,
+    STIPEND_ROLE_ID,
+    Scale,
+    seed,
+)
+from Resolute.cogs.guilds import Guilds
+from Resolute.models.objects.dashboards import RefDashboard
+from Resolute.models.objects.enum import QueryResultType
+from Resolute.models.objects.guilds import PlayerGuild
+from Resolute.models.objects.logs import DBLog
+from Resolute.models.objects.players import Player
+from Resolute.models.objects.webhook import _handle_character_mentions
+from Resolute.query_stats import MeasuredEngine
+
+log = logging.getLogger(__name__)
+
+
+def build_guild(scale: Scale) -> FakeGuild:
+    guild = FakeGuild(GUILD_ID, "Benchmark Guild")
+
+    members = [
+        guild.add_member(PLAYER_ID_BASE + i, f"player{i}")
+        for i in range(1, scale.players + 1)
+    ]
+    guild.add_role(STIPEND_ROLE_ID, "Stipend", members[: scale.stipend_members])
+
+    for i in range(scale.channels):
+        guild.add_channel(CHANNEL_ID_BASE + i, f"channel-{i}")
+
+    return guild
+
+
+def _query_count(bot: BenchBot) -> int:
+    return sum(s.count for s in bot.query_stats._statements.values())
+
+
+def _summary(samples: list[float], queries: int) -> dict:
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return ordered[min(int(len(ordered) * p), len(ordered) - 1)]
+
+    return {
+        "iterations": len(ordered),
+        "mean": statistics.mean(ordered),
+        "p50": pct(0.5),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+        "max": ordered[-1],
+        "queries_per_call": queries / len(ordered),
+    }
+
+
+async def measure(
+    bot: BenchBot,
+    iterations: int,
+    call: Callable[[int], Awaitable],
+    setup: Callable[[int], Awaitable] = None,
+) -> dict:
+    samples = []
+    queries = 0
+
+    for i in range(iterations):
+        if setup:
+            await setup(i)
+
+        before = _query_count(bot)
+        start = timer()
+        await call(i)
+        samples.append(timer() - start)
+        queries += _query_count(bot) - before
+
+    return _summary(samples, queries)
+
+
+class Suite(object):
+    def __init__(self, bot: BenchBot, scale: Scale, iterations: int):
+        self.bot = bot
+        self.scale = scale
+        self.iterations = iterations
+        self.random = random.Random(42)
+
+    def _player_id(self) -> int:
+        return PLAYER_ID_BASE + self.random.randint(1, self.scale.players)
+
+    async def compendium_reload(self) -> dict:
+        return await measure(
+            self.bot,
+            self.iterations,
+            lambda i: self.bot.compendium.reload_categories(self.bot),
+        )
+
+    async def get_player(self) -> dict:
+        return await measure(
+            self.bot,
+            self.iterations,
+            lambda i: Player.get_player(self.bot, self._player_id(), GUILD_ID),
+        )
+
+    async def dblog_create(self) -> dict:
+        players = [
+            await Player.get_player(self.bot, self._player_id(), GUILD_ID)
+            for _ in range(self.iterations)
+        ]
+
+        return await measure(
+            self.bot,
+            self.iterations,
+            lambda i: DBLog.create(
+                self.bot,
+                None,
+                players[i],
+                self.bot.user,
+                "RP",
+                character=players[i].characters[0] if players[i].characters else None,
+                silent=True,
+            ),
+        )
+
+    async def weekly_reset(self) -> dict:
+        cog = Guilds(self.bot)
+
+        async def call(i):
+            guild = await PlayerGuild.get_player_guild(self.bot, GUILD_ID)
+            await cog.perform_weekly_reset(guild)
+
+        return await measure(self.bot, max(1, self.iterations // 10), call)
+
+    async def character_mentions(self) -> dict:
+        channel = self.bot.get_channel(CHANNEL_ID_BASE)
+
+        async def call(i):
+            player_number = self.random.randint(1, self.scale.players)
+            author = self.bot.get_guild(GUILD_ID).get_member(self._player_id())
+            ctx = FakeContext(self.bot, channel, author)
+            player = await Player.get_player(self.bot, author.id, GUILD_ID)
+            webhook = SimpleNamespace(
+                ctx=ctx,
+                player=player,
+                content=f"Hello there {{$Character {player_number}-1}}",
+            )
+            await _handle_character_mentions(webhook)
+
+        return await measure(self.bot, self.iterations, call)
+
+    async def _dashboard_refresh(self, changed: bool) -> dict:
+        dashboards = [
+            await RefDashboard.get_dashboard(
+                self.bot, message_id=DASHBOARD_POST_BASE + i
+            )
+            for i in range(2)
+        ]
+
+        async def setup(i):
+            if changed:
+                await self.bot.query(
+                    RefDashboard.ref_dashboard_content_table.delete(),
+                    QueryResultType.none,
+                )
+
+        async def call(i):
+            for dashboard in dashboards:
+                await dashboard.refresh(self.bot)
+
+        return await measure(self.bot, self.iterations, call, setup)
+
+    async def dashboard_refresh_changed(self) -> dict:
+        return await self._dashboard_refresh(True)
+
+    async def dashboard_refresh_unchanged(self) -> dict:
+        await self._dashboard_refresh(True)
+        return await self._dashboard_refresh(False)
+
+    async def financial_render(self) -> dict:
+        results = financial_render.run(self.iterations)
+        return _summary(results["progress"], 0)
+
+    BENCHMARKS = [
+        "compendium_reload",
+        "get_player",
+        "dblog_create",
+        "weekly_reset",
+        "character_mentions",
+        "dashboard_refresh_changed",
+        "dashboard_refresh_unchanged",
+        "financial_render",
+    ]
+
+    async def run(self, only: list[str] = None) -> dict:
+        results = {}
+
+        for name in self.BENCHMARKS:
+            if only and name not in only:
+                continue
+
+            Calls.reset()
+            start = timer()
+            results[name] = await getattr(self, name)()
+            results[name]["discord_calls"] = Calls.as_dict()
+            log.info(f"BENCH: {name} finished in {timer() - start:.2f}s")
+
+        return results
+
+
+def _revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+    except Exception:
+        return None
+
+
+def compare(base: dict, current: dict) -> str:
+    lines = [
+        f"{'benchmark':<30}{'base p50':>12}{'p50':>12}{'change':>10}{'base p95':>12}{'p95':>12}{'change':>10}"
+    ]
+
+    for name, result in current["results"].items():
+        if not (previous := base["results"].get(name)):
+            continue
+
+        row = f"{name:<30}"
+        for key in ("p50", "p95"):
+            change = (
+                (result[key] - previous[key]) / previous[key] * 100
+                if previous[key]
+                else 0
+            )
+            row += f"{previous[key] * 1000:>10.2f}ms{result[key] * 1000:>10.2f}ms{change:>+9.1f}%"
+        lines.append(row)
+
+    return "\n".join(lines)
+
+
+async def main(args: argparse.Namespace) -> dict:
+    scale = Scale(
+        players=args.players,
+        characters_per_player=args.characters_per_player,
+        logs_per_character=args.logs_per_character,
+    )
+
+    engine = await create_engine(args.dsn, maxsize=args.pool_size)
+
+    if args.seed:
+        async with engine.acquire() as conn:
+            await seed(conn, scale)
+
+    bot = BenchBot(build_guild(scale))
+    bot.db = MeasuredEngine(engine, bot.query_stats)
+
+    try:
+        await bot.compendium.reload_categories(bot)
+        results = await Suite(bot, scale, args.iterations).run(args.only)
+    finally:
+        engine.close()
+        await engine.wait_closed()
+
+    return {
+        "meta": {
+            "revision": _revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "scale": {**asdict(scale), "logs": scale.logs},
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv: list[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dsn", default=os.environ.get("BENCH_DATABASE_URL"))
+    parser.add_argument(
+        "--seed", action="store_true", help="Drop and reseed the database first"
+    )
+    parser.add_argument("--players", type=int, default=Scale.players)
+    parser.add_argument(
+        "--characters-per-player", type=int, default=Scale.characters_per_player
+    )
+    parser.add_argument(
+        "--logs-per-character", type=int, default=Scale.logs_per_character
+    )
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--only", nargs="*", choices=Suite.BENCHMARKS)
+    parser.add_argument("-o", "--output", help="Write JSON results to this file")
+    parser.add_argument("--compare", help="Previous JSON results to compare against")
+    args = parser.parse_args(argv)
+
+    if not args.dsn:
+        parser.error("--dsn or BENCH_DATABASE_URL is required")
+
+    return args
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s: %(message)s")
+    args = parse_args()
+    output = asyncio.run(main(args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+    else:
+        json.dump(output, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            print(compare(json.load(f), output))
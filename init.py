@@ -1,13 +1,19 @@
+# Imported before anything else so the startup clock covers the imports below
+from Resolute.startup import PROCESS_START
+
 import asyncio
 import logging
 import sys
 from os import listdir
+from timeit import default_timer as timer
 
 import discord
 from discord.ext import commands
 
 from Resolute.bot import G0T0Bot
 from Resolute.constants import BOT_TOKEN, DEFAULT_PREFIX
+from Resolute.helpers import needs_context
+from Resolute.models.objects.enum import ContextLevel
 
 intents = discord.Intents.default()
 intents.members = True
@@ -41,14 +47,18 @@ bot = G0T0Bot(
     help_command=MyHelpCommand(),
     intents=intents,
 )
+bot.startup.record("imports", timer() - PROCESS_START)
 
-# Load the cogs!
-for filename in listdir("Resolute/cogs"):
-    if filename.endswith(".py"):
-        bot.load_extension(f"Resolute.cogs.{filename[:-3]}")
+# Load the cogs! Each one is timed so a slow import stands out in the startup report
+with bot.startup.phase("cogs"):
+    for filename in sorted(listdir("Resolute/cogs")):
+        if filename.endswith(".py"):
+            with bot.startup.phase(f"cog.{filename[:-3]}"):
+                bot.load_extension(f"Resolute.cogs.{filename[:-3]}")
 
 
 @bot.command()
+@needs_context(ContextLevel.none)
 async def ping(ctx):
     print("Pong")
     await ctx.send(f"Pong! Latency is {round(bot.latency * 1000)}ms.")